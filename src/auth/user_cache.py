@@ -0,0 +1,67 @@
+import time
+from typing import AsyncContextManager, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.cruds.user as user_cruds
+from src.utils.cache import TTLCache
+
+_MISSING = object()
+
+
+class UserExistenceCache:
+    """
+    Whether a user id exists, by user id.
+
+    Users that exist are kept for `ttl` seconds, users that do not exist for `negative_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        maxsize: int,
+        ttl: float,
+        negative_ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.session_factory = session_factory
+        self.negative_ttl = negative_ttl
+        self.cache = TTLCache(maxsize, ttl, clock)
+
+    async def exists(self, user_id: int) -> bool:
+        """
+        Check that a user exists, from the cache if possible.
+
+        On a miss the user is looked up with a session of `session_factory`. It should be on the primary, not on
+        a read replica, so that a user who has just signed up is not cached as missing because of replication lag.
+
+        Args:
+            user_id (int): User id.
+
+        Returns:
+            bool: True if the user exists.
+        """
+        exists = self.cache.get(user_id, _MISSING)
+        if exists is _MISSING:
+            async with self.session_factory() as db:
+                exists = await user_cruds.count_user_by_user_id(db, user_id) > 0
+            self.cache.set(user_id, exists, ttl=None if exists else self.negative_ttl)
+        return exists
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop the cached existence of a user. Call it once a user is created, deleted or changed, after the commit.
+
+        Args:
+            user_id (int): User id.
+        """
+        self.cache.invalidate(user_id)
+
+    def metrics(self) -> dict:
+        """
+        Get the size and lookup counters.
+
+        Returns:
+            dict: Metrics.
+        """
+        return self.cache.metrics()
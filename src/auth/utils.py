@@ -1,16 +1,27 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.schemas.auth as auth_schema
-from src.constants.common import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, JWT_REFRESH_KEY, JWT_SECRET_KEY, REFRESH_TOKEN_EXPIRE_MINUTES
+from src.constants.common import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    JWT_REFRESH_KEY,
+    JWT_SECRET_KEY,
+    PASSWORD_HASH_WORKERS,
+    REFRESH_TOKEN_EXPIRE_MINUTES,
+)
 from src.errors.errors import TokenExpiredException, TokenValidationFailException
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login", scheme_name="JWT")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt releases the GIL while hashing, so hashes in these threads leave the event loop free.
+# Its work queue is FIFO, so concurrent logins are served in arrival order once every worker is busy.
+password_hash_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
 
 
 def create_hash_password(password: str) -> str:
@@ -40,6 +51,33 @@ def verify_hash_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def create_hash_password_async(password: str) -> str:
+    """
+    Create hashed password in password_hash_executor, without blocking the event loop.
+
+    Args:
+        password (str): Plain password.
+
+    Returns:
+        str: Hashed password.
+    """
+    return await asyncio.get_running_loop().run_in_executor(password_hash_executor, create_hash_password, password)
+
+
+async def verify_hash_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify the password is valid in password_hash_executor, without blocking the event loop.
+
+    Args:
+        plain_password (str): Plain password.
+        hashed_password (str): Hashed password.
+
+    Returns:
+        bool: True if the password is valid. False otherwise.
+    """
+    return await asyncio.get_running_loop().run_in_executor(password_hash_executor, verify_hash_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """
     Create access token.
@@ -80,13 +118,12 @@ def create_refresh_access_token(data: dict, expires_delta: timedelta | None = No
     return jwt.encode(_data, JWT_REFRESH_KEY, ALGORITHM)
 
 
-def verify_access_token(token: str, db: AsyncSession) -> auth_schema.TokenPayload:
+def verify_access_token(token: str) -> auth_schema.TokenPayload:
     """
     Verify the access token.
 
     Args:
         token (str): Encoded jwt string.
-        db (AsyncSession): AsyncSession
 
     Raises:
         TokenValidationFailException: Failed to validate token.
@@ -0,0 +1,124 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import text
+
+import src.cruds.device as device_crud
+from src.benchmarks.partitions import benchmark_device_ids
+from src.db.db import read_session
+from src.historical.analytics import HISTORICAL_VIEWS, historical_statistics
+
+REPEATS = 10
+# 4 weeks of one reading per 10 seconds
+NUM_OF_READINGS = 4 * 7 * 8640
+
+# Same statistics as src.historical.analytics, aggregated in SQL.
+SQL_STATISTICS_STMT = text(
+    """
+    SELECT
+        DATE_TRUNC(:bucket, A.CREATED_AT) AS BUCKET_START,
+        AVG(A.TEMPERATURE),
+        STDDEV_POP(A.TEMPERATURE),
+        PERCENTILE_CONT(ARRAY[0.05, 0.5, 0.95]) WITHIN GROUP (ORDER BY A.TEMPERATURE),
+        AVG(A.HUMIDITY),
+        STDDEV_POP(A.HUMIDITY),
+        PERCENTILE_CONT(ARRAY[0.05, 0.5, 0.95]) WITHIN GROUP (ORDER BY A.HUMIDITY),
+        AVG(CASE WHEN A.TEMPERATURE BETWEEN COALESCE(D.TEMP_LOWER_LIMIT, '-infinity') AND COALESCE(D.TEMP_UPPER_LIMIT, 'infinity') THEN 1 ELSE 0 END)
+    FROM
+        READINGS A
+    JOIN DEVICES D
+        ON D.ID = A.DEVICE_ID
+    WHERE
+        A.DEVICE_ID = :device_id
+        AND A.TEMPERATURE IS NOT NULL
+        AND A.HUMIDITY IS NOT NULL
+        AND A.CREATED_AT >= LOCALTIMESTAMP - CAST(:window AS INTERVAL)
+        AND A.CREATED_AT <= LOCALTIMESTAMP
+    GROUP BY
+        BUCKET_START
+"""
+)
+
+
+async def numpy_statistics(db: AsyncSession, device_id: str, view: str) -> int:
+    """
+    Fetch the series as arrays and compute the statistics with NumPy.
+
+    Returns:
+        int: Number of buckets.
+    """
+    window, bucket, label_format = HISTORICAL_VIEWS[view]
+    lower, upper, times, temperature, humidity = await device_crud.get_historical_series_arrays(db, device_id, window)
+    return len(historical_statistics(times, temperature, humidity, lower, upper, bucket, label_format))
+
+
+async def sql_statistics(db: AsyncSession, device_id: str, view: str) -> int:
+    """
+    Compute the statistics with SQL aggregates.
+
+    Returns:
+        int: Number of buckets.
+    """
+    window, bucket, _ = HISTORICAL_VIEWS[view]
+    result = await db.execute(SQL_STATISTICS_STMT, params={"device_id": device_id, "bucket": bucket, "window": window})
+    return len(result.all())
+
+
+async def measure(func: Callable[[], Awaitable]) -> List[float]:
+    """
+    Measure the latency of REPEATS runs.
+
+    Args:
+        func (Callable[[], Awaitable]): Coroutine function.
+
+    Returns:
+        List[float]: Latencies in milliseconds.
+    """
+    latencies = []
+    for _ in range(REPEATS):
+        begin = time.perf_counter()
+        await func()
+        latencies.append((time.perf_counter() - begin) * 1000)
+    return latencies
+
+
+async def main(from_db: bool) -> None:
+    rng = np.random.default_rng(0)
+    times = time.time() - np.arange(NUM_OF_READINGS) * 10.0
+    temperature = rng.normal(25, 3, NUM_OF_READINGS)
+    humidity = rng.normal(60, 10, NUM_OF_READINGS)
+
+    print(f"NumPy statistics of {NUM_OF_READINGS} generated readings, {REPEATS} repeats")
+    print(f"{'view':>8} {'p50 ms':>8} {'max ms':>8}")
+    for view, (_, bucket, label_format) in HISTORICAL_VIEWS.items():
+
+        async def compute() -> None:
+            historical_statistics(times, temperature, humidity, 20.0, 30.0, bucket, label_format)
+
+        latencies = await measure(compute)
+        print(f"{view:>8} {statistics.median(latencies):>8.2f} {max(latencies):>8.2f}")
+
+    if not from_db:
+        return
+
+    device_id = benchmark_device_ids()[0]
+    print(f"Statistics of {device_id} from the database, {REPEATS} repeats")
+    print(f"{'view':>8} {'numpy p50 ms':>13} {'sql p50 ms':>11}")
+    async with read_session() as db:
+        for view in HISTORICAL_VIEWS:
+            assert await numpy_statistics(db, device_id, view) == await sql_statistics(db, device_id, view)
+            numpy_latencies = await measure(lambda: numpy_statistics(db, device_id, view))
+            sql_latencies = await measure(lambda: sql_statistics(db, device_id, view))
+            print(f"{view:>8} {statistics.median(numpy_latencies):>13.2f} {statistics.median(sql_latencies):>11.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark historical statistics with NumPy against SQL aggregates")
+    parser.add_argument("--db", action="store_true", help="Also compare on the readings of the partitions benchmark device in the database")
+    args = parser.parse_args()
+    asyncio.run(main(args.db))
@@ -0,0 +1,83 @@
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from pydantic import parse_raw_as
+
+import src.cruds.device as device_crud
+import src.schemas.device as device_schema
+
+NUM_OF_SAMPLES = 10000
+REPEAT = 5
+
+
+def generate_payloads(n: int) -> tuple[bytes, bytes]:
+    """
+    Generate row-oriented and column-oriented JSON payloads with the same samples.
+
+    Args:
+        n (int): Number of samples.
+
+    Returns:
+        tuple[bytes, bytes]: Row-oriented payload and column-oriented payload.
+    """
+    start = datetime.now() - timedelta(seconds=n)
+    rows = [
+        {
+            "temperature_c": 25.1,
+            "temperature_f": 77.18,
+            "humidity": 60.0,
+            "motion": i % 2 == 0,
+            "alarm": False,
+            "button": False,
+            "created_at": (start + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        for i in range(n)
+    ]
+    columns = {key: [row[key] for row in rows] for key in ["temperature_c", "humidity", "motion", "alarm", "button", "created_at"]}
+    return json.dumps(rows).encode(), json.dumps(columns).encode()
+
+
+def best_of(fn: Callable[[], List[tuple]]) -> float:
+    """
+    Run the function REPEAT times and return the best time.
+
+    Args:
+        fn (Callable[[], List[tuple]]): Function to measure.
+
+    Returns:
+        float: Best elapsed seconds.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    device_id = str(uuid.uuid4())
+    row_payload, column_payload = generate_payloads(NUM_OF_SAMPLES)
+
+    def parse_rows() -> List[tuple]:
+        device_data_list = parse_raw_as(List[device_schema.DeviceDataCreate], row_payload)
+        return device_crud.to_reading_records(device_id, device_data_list)
+
+    def parse_columns() -> List[tuple]:
+        device_data_columns = device_schema.DeviceDataColumns.parse_raw(column_payload)
+        return device_crud.columns_to_reading_records(device_id, device_data_columns)
+
+    assert parse_rows() == parse_columns()
+
+    row_seconds = best_of(parse_rows)
+    column_seconds = best_of(parse_columns)
+    print(f"{'format':>8} {'bytes':>10} {'ms':>8} {'samples/s':>12}")
+    print(f"{'rows':>8} {len(row_payload):>10} {row_seconds * 1000:>8.1f} {NUM_OF_SAMPLES / row_seconds:>12.0f}")
+    print(f"{'columns':>8} {len(column_payload):>10} {column_seconds * 1000:>8.1f} {NUM_OF_SAMPLES / column_seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import time
+import uuid
+from typing import Callable, List
+
+import numpy as np
+from pydantic import parse_raw_as
+
+import src.cruds.device as device_crud
+import src.schemas.device as device_schema
+from src.benchmarks.columnar import generate_payloads
+from src.utils.packed import pack_device_data, unpack_device_data
+
+NUM_OF_SAMPLES = 10000
+REPEAT = 5
+
+
+def best_of(fn: Callable[[], List[tuple]]) -> float:
+    """
+    Run the function REPEAT times and return the best time.
+
+    Args:
+        fn (Callable[[], List[tuple]]): Function to measure.
+
+    Returns:
+        float: Best elapsed seconds.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    device_id = str(uuid.uuid4())
+    row_payload, column_payload = generate_payloads(NUM_OF_SAMPLES)
+    columns = device_schema.DeviceDataColumns.parse_raw(column_payload)
+    packed_payload = pack_device_data(columns.temperature_c, columns.humidity, columns.motion, columns.alarm, columns.button, columns.created_at)
+
+    def decode_rows() -> List[tuple]:
+        return device_crud.to_reading_records(device_id, parse_raw_as(List[device_schema.DeviceDataCreate], row_payload))
+
+    def decode_columns() -> List[tuple]:
+        return device_crud.columns_to_reading_records(device_id, device_schema.DeviceDataColumns.parse_raw(column_payload))
+
+    def decode_packed() -> List[tuple]:
+        return device_crud.columns_to_reading_records(device_id, device_schema.DeviceDataColumns.construct(**unpack_device_data(packed_payload)))
+
+    assert np.allclose([r[2] for r in decode_packed()], [r[2] for r in decode_rows()])
+
+    print(f"{'format':>14} {'bytes/sample':>13} {'decode us/sample':>17}")
+    for name, payload, fn in [
+        ("json rows", row_payload, decode_rows),
+        ("json columns", column_payload, decode_columns),
+        ("packed", packed_payload, decode_packed),
+    ]:
+        seconds = best_of(fn)
+        print(f"{name:>14} {len(payload) / NUM_OF_SAMPLES:>13.1f} {seconds / NUM_OF_SAMPLES * 1e6:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
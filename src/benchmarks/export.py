@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, List
+
+import src.cruds.device as device_crud
+from src.benchmarks.partitions import benchmark_device_ids
+from src.constants.common import EXPORT_CHUNK_ROWS
+from src.db.db import read_session
+from src.export.service import ENCODERS, parquet_available, stream_export
+
+NUM_OF_ROWS = 1000000
+
+
+def generate_rows(num_of_rows: int) -> List[tuple]:
+    """
+    Generate one reading per 10 seconds, in the order of EXPORT_COLUMNS.
+
+    Args:
+        num_of_rows (int): Number of rows.
+
+    Returns:
+        List[tuple]: Rows.
+    """
+    start = datetime(2020, 1, 1)
+    return [(start + timedelta(seconds=10 * i), 20 + i % 100 / 10, 40 + i % 300 / 10, i % 7 == 0, i % 11 == 0, True) for i in range(num_of_rows)]
+
+
+async def encode_rows(rows: List[tuple], export_format: str) -> AsyncIterator[bytes]:
+    """
+    Encode rows in chunks of EXPORT_CHUNK_ROWS, like an export without the database.
+
+    Args:
+        rows (List[tuple]): Rows.
+        export_format (str): Export format.
+
+    Yields:
+        bytes: Encoded chunk.
+    """
+    encoder = ENCODERS[export_format]()
+    for i in range(0, len(rows), EXPORT_CHUNK_ROWS):
+        yield encoder.encode(rows[i : i + EXPORT_CHUNK_ROWS])
+    yield encoder.close()
+
+
+async def measure(make_stream: Callable[[], AsyncIterator[bytes]]) -> tuple[float, int, int]:
+    """
+    Consume a stream once for its time, then once more for its peak traced memory.
+
+    Args:
+        make_stream (Callable[[], AsyncIterator[bytes]]): Creates the stream.
+
+    Returns:
+        tuple[float, int, int]: Seconds, bytes streamed, peak memory in bytes.
+    """
+    begin = time.perf_counter()
+    size = 0
+    async for chunk in make_stream():
+        size += len(chunk)
+    elapsed = time.perf_counter() - begin
+
+    tracemalloc.start()
+    async for chunk in make_stream():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+
+async def main(from_db: bool) -> None:
+    formats = [export_format for export_format in ENCODERS if export_format != "parquet" or parquet_available()]
+
+    print(f"Encoding {NUM_OF_ROWS} generated rows in chunks of {EXPORT_CHUNK_ROWS}")
+    rows = generate_rows(NUM_OF_ROWS)
+    print(f"{'format':>8} {'rows/s':>10} {'MB':>8} {'peak MB':>8}")
+    for export_format in formats:
+        elapsed, size, peak = await measure(lambda: encode_rows(rows, export_format))
+        print(f"{export_format:>8} {NUM_OF_ROWS / elapsed:>10.0f} {size / 1e6:>8.1f} {peak / 1e6:>8.1f}")
+
+    if not from_db:
+        return
+
+    device_id = benchmark_device_ids()[0]
+    start, end = datetime(2000, 1, 1), datetime.now()
+    async with read_session() as db:
+        num_of_rows = sum([len(chunk) async for chunk in device_crud.stream_readings(db, device_id, start, end, EXPORT_CHUNK_ROWS)])
+
+    print(f"Exporting {num_of_rows} readings of {device_id} from the database")
+    print(f"{'format':>8} {'rows/s':>10} {'MB':>8} {'peak MB':>8}")
+    for export_format in formats:
+
+        async def export() -> AsyncIterator[bytes]:
+            async with read_session() as db:
+                async for chunk in stream_export(db, device_id, start, end, export_format):
+                    yield chunk
+
+        elapsed, size, peak = await measure(export)
+        print(f"{export_format:>8} {num_of_rows / elapsed:>10.0f} {size / 1e6:>8.1f} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark throughput and memory of raw reading exports")
+    parser.add_argument("--db", action="store_true", help="Also export the readings of the partitions benchmark device from the database")
+    args = parser.parse_args()
+    asyncio.run(main(args.db))
@@ -0,0 +1,81 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+import src.cruds.device as device_crud
+import src.schemas.device as device_schema
+from src.db.db import async_session
+
+BATCH_SIZES = [10, 1000, 100000]
+MODES = ["insert", "unnest", "copy"]
+
+
+def generate_device_data(n: int) -> List[device_schema.DeviceDataCreate]:
+    """
+    Generate device data for benchmark.
+
+    Args:
+        n (int): Number of readings.
+
+    Returns:
+        List[device_schema.DeviceDataCreate]: List of device data.
+    """
+    start = datetime.now() - timedelta(seconds=n)
+    return [
+        device_schema.DeviceDataCreate(
+            temperature_c=25.1,
+            temperature_f=77.18,
+            humidity=60.0,
+            motion=i % 2 == 0,
+            alarm=False,
+            button=False,
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(n)
+    ]
+
+
+async def measure(mode: str, device_id: str, device_data_list: List[device_schema.DeviceDataCreate]) -> float:
+    """
+    Measure readings per second for one batch. The transaction is rolled back afterwards.
+
+    Args:
+        mode (str): Ingestion mode, see src.cruds.device.create_readings.
+        device_id (str): Device id.
+        device_data_list (List[device_schema.DeviceDataCreate]): List of device data.
+
+    Returns:
+        float: Readings per second.
+    """
+    async with async_session() as db:
+        start = time.perf_counter()
+        await device_crud.create_device_data(db, device_id, device_data_list, mode=mode)
+        await db.flush()
+        elapsed = time.perf_counter() - start
+        await db.rollback()
+    return len(device_data_list) / elapsed
+
+
+async def main() -> None:
+    device_id = str(uuid.uuid4())
+    async with async_session() as db:
+        await device_crud.create_device(db, device_id, 35.6560, 139.7247, None)
+        await db.commit()
+
+    try:
+        print(f"{'batch':>8} {'mode':>8} {'readings/s':>12}")
+        for batch_size in BATCH_SIZES:
+            device_data_list = generate_device_data(batch_size)
+            for mode in MODES:
+                readings_per_second = await measure(mode, device_id, device_data_list)
+                print(f"{batch_size:>8} {mode:>8} {readings_per_second:>12.0f}")
+    finally:
+        async with async_session() as db:
+            await db.execute("DELETE FROM DEVICES WHERE ID = :device_id", params={"device_id": device_id})
+            await db.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
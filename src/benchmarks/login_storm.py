@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List
+
+import requests
+
+from src.auth.utils import create_hash_password, verify_hash_password, verify_hash_password_async
+from src.constants.common import PASSWORD_HASH_WORKERS
+
+NUM_OF_LOGINS = 50
+# Interval between two /live requests
+PROBE_INTERVAL_SECONDS = 0.01
+REQUEST_TIMEOUT_SECONDS = 60
+
+
+def percentiles(latencies: List[float]) -> str:
+    """
+    Format p50/p99/max of latencies.
+
+    Args:
+        latencies (List[float]): Latencies in milliseconds.
+
+    Returns:
+        str: Formatted percentiles.
+    """
+    p99 = statistics.quantiles(latencies, n=100, method="inclusive")[98] if len(latencies) > 1 else latencies[0]
+    return f"{statistics.median(latencies):>8.2f} {p99:>8.2f} {max(latencies):>8.2f}"
+
+
+async def probe_loop(stop: asyncio.Event) -> List[float]:
+    """
+    Measure how late the event loop wakes up a sleeping task, like the latency it adds to a cheap request such as /live.
+
+    Args:
+        stop (asyncio.Event): Set to stop probing.
+
+    Returns:
+        List[float]: Delays in milliseconds.
+    """
+    delays = []
+    while not stop.is_set():
+        begin = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        delays.append((time.perf_counter() - begin - PROBE_INTERVAL_SECONDS) * 1000)
+    return delays
+
+
+async def storm_in_process(verify: Callable[[str, str], Awaitable[bool]], hashed_password: str) -> tuple[List[float], float]:
+    """
+    Verify NUM_OF_LOGINS passwords concurrently while probing the event loop.
+
+    Args:
+        verify (Callable[[str, str], Awaitable[bool]]): Coroutine function verifying a password.
+        hashed_password (str): Hashed password.
+
+    Returns:
+        tuple[List[float], float]: Event loop delays in milliseconds, seconds of the storm.
+    """
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop(stop))
+    await asyncio.sleep(PROBE_INTERVAL_SECONDS * 10)
+    begin = time.perf_counter()
+    assert all(await asyncio.gather(*[verify("secretPassword", hashed_password) for _ in range(NUM_OF_LOGINS)]))
+    elapsed = time.perf_counter() - begin
+    stop.set()
+    return await probe, elapsed
+
+
+async def main_in_process() -> None:
+    hashed_password = create_hash_password("secretPassword")
+
+    async def verify_on_loop(plain_password: str, hashed_password: str) -> bool:
+        return verify_hash_password(plain_password, hashed_password)
+
+    print(f"Event loop delay during {NUM_OF_LOGINS} concurrent bcrypt verifications, {PASSWORD_HASH_WORKERS} workers")
+    print(f"{'mode':>10} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'logins/s':>9}")
+    for mode, verify in [("event loop", verify_on_loop), ("pool", verify_hash_password_async)]:
+        delays, elapsed = await storm_in_process(verify, hashed_password)
+        print(f"{mode:>10} {percentiles(delays)} {NUM_OF_LOGINS / elapsed:>9.1f}")
+
+
+def login(url: str, email: str, password: str) -> str:
+    """
+    Log in to a running server.
+
+    Returns:
+        str: Access token.
+    """
+    r = requests.post(f"{url}/login", data={"username": email, "password": password}, timeout=REQUEST_TIMEOUT_SECONDS)
+    r.raise_for_status()
+    return r.json()["access_token"]
+
+
+def probe_live(url: str, token: str, device_id: str, stop: threading.Event) -> List[float]:
+    """
+    Request /live of a device one after another until stopped.
+
+    Returns:
+        List[float]: Latencies in milliseconds.
+    """
+    latencies = []
+    with requests.Session() as session:
+        session.headers["Authorization"] = f"Bearer {token}"
+        while not stop.is_set():
+            begin = time.perf_counter()
+            session.get(f"{url}/device-data/{device_id}/live", timeout=REQUEST_TIMEOUT_SECONDS).raise_for_status()
+            latencies.append((time.perf_counter() - begin) * 1000)
+            time.sleep(PROBE_INTERVAL_SECONDS)
+    return latencies
+
+
+def main_server(url: str, email: str, password: str, device_id: str) -> None:
+    token = login(url, email, password)
+    print(f"/live latency of {url}, alone and during {NUM_OF_LOGINS} concurrent logins")
+    print(f"{'phase':>10} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    with ThreadPoolExecutor(max_workers=NUM_OF_LOGINS + 1) as executor:
+        stop = threading.Event()
+        probe = executor.submit(probe_live, url, token, device_id, stop)
+        time.sleep(2)
+        stop.set()
+        print(f"{'idle':>10} {percentiles(probe.result())}")
+
+        stop = threading.Event()
+        probe = executor.submit(probe_live, url, token, device_id, stop)
+        begin = time.perf_counter()
+        logins = [executor.submit(login, url, email, password) for _ in range(NUM_OF_LOGINS)]
+        for future in logins:
+            future.result()
+        elapsed = time.perf_counter() - begin
+        stop.set()
+        print(f"{'storm':>10} {percentiles(probe.result())}")
+    print(f"{NUM_OF_LOGINS} logins in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark request latency during a storm of concurrent logins")
+    parser.add_argument("--url", help="Measure /live of a running server instead of the event loop of this process, e.g. http://localhost:8000")
+    parser.add_argument("--email", default="test@test.com", help="Email of a user, the seeded one by default")
+    parser.add_argument("--password", default="secretPassword", help="Password of the user")
+    parser.add_argument("--device-id", help="Device id for /live")
+    args = parser.parse_args()
+    if args.url is None:
+        asyncio.run(main_in_process())
+    else:
+        if args.device_id is None:
+            parser.error("--device-id is required with --url")
+        main_server(args.url, args.email, args.password, args.device_id)
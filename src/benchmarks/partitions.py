@@ -0,0 +1,128 @@
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Awaitable, Callable, List
+
+import src.cruds.device as device_crud
+from src.constants.common import DEFAULT_PAGE_SIZE
+from src.db.db import async_engine, async_session
+from src.db.partitions import create_partitions
+
+DEVICES = 100
+MONTHS = 24
+SEED_CHUNK_SIZE = 1_000_000
+REPEATS = 20
+
+# Benchmark devices are named so that they can be found again by a later run, e.g. after `migrate_db partition-readings`.
+DEVICE_NAMESPACE = uuid.UUID("9c1f4a52-6a3e-4f0e-9a53-6b7f1d9e2c10")
+
+
+def benchmark_device_ids() -> List[str]:
+    """
+    Get the ids of the benchmark devices.
+
+    Returns:
+        List[str]: Device ids.
+    """
+    return [str(uuid.uuid5(DEVICE_NAMESPACE, str(i))) for i in range(DEVICES)]
+
+
+async def seed(rows: int) -> None:
+    """
+    Insert `rows` readings spread evenly over DEVICES devices and the last MONTHS months.
+
+    Args:
+        rows (int): Number of readings.
+    """
+    device_ids = benchmark_device_ids()
+    end = datetime.now()
+    start = end - timedelta(days=30 * MONTHS)
+    rows_per_device = rows // DEVICES
+    step = (end - start) / rows_per_device
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(create_partitions, start, end)
+    async with async_session() as db:
+        for device_id in device_ids:
+            await device_crud.create_device(db, device_id, 35.6560, 139.7247, None)
+        await db.commit()
+
+    for device_id in device_ids:
+        for offset in range(0, rows_per_device, SEED_CHUNK_SIZE):
+            count = min(SEED_CHUNK_SIZE, rows_per_device - offset)
+            async with async_session() as db:
+                await db.execute(
+                    """
+                    INSERT INTO
+                        READINGS (DEVICE_ID, CREATED_AT, TEMPERATURE, HUMIDITY, MOTION, IS_ALARM, DEVICE_LISTENING)
+                    SELECT
+                        CAST(:device_id AS UUID),
+                        CAST(:start AS TIMESTAMP) + CAST(:step AS INTERVAL) * I,
+                        20 + RANDOM() * 10,
+                        40 + RANDOM() * 30,
+                        RANDOM() < 0.1,
+                        RANDOM() < 0.001,
+                        FALSE
+                    FROM
+                        GENERATE_SERIES(:first, :last) I
+                    ON CONFLICT (DEVICE_ID, CREATED_AT) DO NOTHING
+                    """,
+                    params={"device_id": device_id, "start": start, "step": step, "first": offset, "last": offset + count - 1},
+                )
+                await db.commit()
+        # TODO Replace with logger
+        print(f"Seeded {device_id}")
+
+
+async def measure(query: Callable[..., Awaitable], device_id: str) -> List[float]:
+    """
+    Measure the latency of a device data query, REPEATS times.
+
+    Args:
+        query (Callable[..., Awaitable]): Query function taking a session and a device id.
+        device_id (str): Device id.
+
+    Returns:
+        List[float]: Latencies in milliseconds.
+    """
+    latencies = []
+    for _ in range(REPEATS):
+        async with async_session() as db:
+            begin = time.perf_counter()
+            await query(db, device_id)
+            latencies.append((time.perf_counter() - begin) * 1000)
+    return latencies
+
+
+async def main(rows: int) -> None:
+    if rows > 0:
+        await seed(rows)
+
+    async with async_session() as db:
+        total = (await db.execute("SELECT COUNT(*) FROM READINGS")).scalar()
+        partitioned = (await db.execute("SELECT EXISTS (SELECT 1 FROM PG_PARTITIONED_TABLE WHERE PARTRELID = CAST('readings' AS REGCLASS))")).scalar()
+
+    queries = {
+        "latest": device_crud.get_latest_device_data,
+        "day": device_crud.get_historical_device_data_day,
+        "week": device_crud.get_historical_device_data_week,
+        "month": device_crud.get_historical_device_data_month,
+        "alarm": partial(device_crud.get_historical_device_data_alarm, limit=DEFAULT_PAGE_SIZE),
+    }
+    device_id = benchmark_device_ids()[0]
+    print(f"{total} readings, partitioned: {partitioned}, {REPEATS} repeats")
+    print(f"{'query':>8} {'p50 ms':>8} {'max ms':>8}")
+    for name, query in queries.items():
+        latencies = await measure(query, device_id)
+        print(f"{name:>8} {statistics.median(latencies):>8.2f} {max(latencies):>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark device data queries on a large READINGS table")
+    parser.add_argument("--seed", type=int, default=0, help="Number of readings to insert before measuring, e.g. 100000000")
+    args = parser.parse_args()
+    asyncio.run(main(args.seed))
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, NamedTuple, Type
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+
+import src.schemas.device as device_schema
+import src.schemas.notification as notification_schema
+
+NUM_OF_ROWS = 10000
+REPEAT = 5
+
+
+class NotificationRow(NamedTuple):
+    id: int
+    content_type: str
+    content: str
+    is_read: bool
+    date: str
+    created_at: datetime
+
+
+class AlarmRow(NamedTuple):
+    date: str
+    hour: str
+    created_at: datetime
+
+
+def generate_rows() -> tuple[List[NotificationRow], List[AlarmRow]]:
+    """
+    Generate notification and alarm rows as returned by their queries.
+
+    Returns:
+        tuple[List[NotificationRow], List[AlarmRow]]: Notification rows and alarm rows.
+    """
+    start = datetime(2022, 7, 1)
+    notifications = []
+    alarms = []
+    for i in range(NUM_OF_ROWS):
+        created_at = start + timedelta(minutes=i)
+        date = created_at.strftime("%Y/%m/%d")
+        notifications.append(NotificationRow(i, "Alarm", "Alarm has been triggered, call to check in!", False, date, created_at))
+        alarms.append(AlarmRow(date, created_at.strftime("%H:%M"), created_at))
+    return notifications, alarms
+
+
+async def pydantic_path(rows: list, schema: Type[BaseModel], to_model: Callable) -> bytes:
+    """
+    Serialize rows the previous way: one pydantic model per row, then validation against response_model.
+
+    Args:
+        rows (list): Rows.
+        schema (Type[BaseModel]): Item schema of response_model.
+        to_model (Callable): Converts a row to a model.
+
+    Returns:
+        bytes: Response body.
+    """
+    field = create_response_field(name="response", type_=List[schema])
+    content = await serialize_response(field=field, response_content=[to_model(row) for row in rows])
+    return JSONResponse(content=content).body
+
+
+async def fast_path(rows: list, to_dict: Callable) -> bytes:
+    """
+    Serialize rows with the fast path: plain dicts straight to JSON.
+
+    Args:
+        rows (list): Rows.
+        to_dict (Callable): Converts a row to a dict.
+
+    Returns:
+        bytes: Response body.
+    """
+    return JSONResponse(content=[to_dict(row) for row in rows]).body
+
+
+async def measure(func: Callable, *args) -> float:
+    """
+    Measure the best time of REPEAT runs.
+
+    Args:
+        func (Callable): Coroutine function.
+
+    Returns:
+        float: Time in milliseconds.
+    """
+    times = []
+    for _ in range(REPEAT):
+        begin = time.perf_counter()
+        await func(*args)
+        times.append((time.perf_counter() - begin) * 1000)
+    return min(times)
+
+
+async def main() -> None:
+    notifications, alarms = generate_rows()
+    cases = {
+        "notifications": (
+            notifications,
+            notification_schema.DeviceNotificationData,
+            lambda row: notification_schema.DeviceNotificationData(id=row[0], content_type=row[1], content=row[2], is_read=row[3], date=row[4]),
+            lambda row: {"id": row.id, "content_type": row.content_type, "content": row.content, "is_read": row.is_read, "date": row.date},
+        ),
+        "alarms": (
+            alarms,
+            device_schema.DeviceHistoricalAlarm,
+            lambda row: device_schema.DeviceHistoricalAlarm(date=row[0], hour=row[1]),
+            lambda row: {"date": row.date, "hour": row.hour},
+        ),
+    }
+
+    print(f"{NUM_OF_ROWS} rows, best of {REPEAT}")
+    print(f"{'response':>14} {'pydantic ms':>12} {'fast path ms':>13}")
+    for name, (rows, schema, to_model, to_dict) in cases.items():
+        assert await pydantic_path(rows, schema, to_model) == await fast_path(rows, to_dict)
+        slow = await measure(pydantic_path, rows, schema, to_model)
+        fast = await measure(fast_path, rows, to_dict)
+        print(f"{name:>14} {slow:>12.2f} {fast:>13.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
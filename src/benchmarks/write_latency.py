@@ -0,0 +1,76 @@
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+import src.cruds.device as device_crud
+from src.db.db import async_session
+
+BATCH_SIZE = 60
+ITERATIONS = 500
+MODES = ["insert", "unnest", "copy"]
+
+
+def generate_records(device_id: str, start: datetime, n: int) -> List[tuple]:
+    """
+    Generate reading records for benchmark.
+
+    Args:
+        device_id (str): Device id.
+        start (datetime): Timestamp of the first record.
+        n (int): Number of records.
+
+    Returns:
+        List[tuple]: Reading records in the order of READING_COLUMNS.
+    """
+    device_uuid = uuid.UUID(device_id)
+    return [(device_uuid, start + timedelta(seconds=i), 25.1, 60.0, False, False, False) for i in range(n)]
+
+
+async def measure(mode: str, device_id: str) -> List[float]:
+    """
+    Measure the latency of writing and committing one batch, ITERATIONS times.
+
+    Args:
+        mode (str): Ingestion mode, see src.cruds.device.create_readings.
+        device_id (str): Device id.
+
+    Returns:
+        List[float]: Latencies in milliseconds.
+    """
+    latencies = []
+    start = datetime(2000, 1, 1) + timedelta(days=MODES.index(mode))
+    for i in range(ITERATIONS):
+        records = generate_records(device_id, start + timedelta(seconds=i * BATCH_SIZE), BATCH_SIZE)
+        async with async_session() as db:
+            begin = time.perf_counter()
+            await device_crud.create_readings(db, records, mode=mode)
+            await db.commit()
+            latencies.append((time.perf_counter() - begin) * 1000)
+    return latencies
+
+
+async def main() -> None:
+    device_id = str(uuid.uuid4())
+    async with async_session() as db:
+        await device_crud.create_device(db, device_id, 35.6560, 139.7247, None)
+        await db.commit()
+
+    try:
+        print(f"{BATCH_SIZE} readings per batch, {ITERATIONS} batches")
+        print(f"{'mode':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for mode in MODES:
+            latencies = await measure(mode, device_id)
+            percentiles = statistics.quantiles(latencies, n=100)
+            print(f"{mode:>8} {percentiles[49]:>8.2f} {percentiles[98]:>8.2f}")
+    finally:
+        async with async_session() as db:
+            await db.execute("DELETE FROM READINGS WHERE DEVICE_ID = :device_id", params={"device_id": device_id})
+            await db.execute("DELETE FROM DEVICES WHERE ID = :device_id", params={"device_id": device_id})
+            await db.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -13,8 +13,62 @@ TWILIO_VIRTUAL_NUMBER = os.getenv("TWILIO_VIRTUAL_NUMBER")
 TWILIO_VERIFIED_NUMBER = os.getenv("TWILIO_VERIFIED_NUMBER")
 OPEN_WEATHER_API = "https://api.openweathermap.org/data/2.5/weather"
 OPEN_WEATHER_APPID = os.getenv("OPEN_WEATHER_APPID")
+WEATHER_REQUEST_TIMEOUT_SECONDS = float(os.getenv("WEATHER_REQUEST_TIMEOUT_SECONDS", "5"))
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_MINUTES = 10080  # 60 * 24 * 7 (7 days)
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 JWT_REFRESH_KEY = os.getenv("JWT_REFRESH_KEY")
 ALGORITHM = ALGORITHMS.HS256
+# Keyset pagination
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Ingestion mode for device data, "auto", "unnest", "copy" or "insert". See src.cruds.device.create_readings.
+DEVICE_DATA_INGESTION_MODE = os.getenv("DEVICE_DATA_INGESTION_MODE", "auto")
+# Write-behind ingestion buffer
+INGESTION_BUFFER_ENABLED = os.getenv("INGESTION_BUFFER_ENABLED", "true").lower() == "true"
+INGESTION_BUFFER_MAX_ROWS = int(os.getenv("INGESTION_BUFFER_MAX_ROWS", "200000"))
+INGESTION_FLUSH_ROWS = int(os.getenv("INGESTION_FLUSH_ROWS", "5000"))
+INGESTION_FLUSH_INTERVAL_SECONDS = float(os.getenv("INGESTION_FLUSH_INTERVAL_SECONDS", "1.0"))
+# Number of recent client batch ids remembered to skip replayed uploads
+INGESTION_BATCH_ID_CACHE_SIZE = int(os.getenv("INGESTION_BATCH_ID_CACHE_SIZE", "100000"))
+# Ingestion backpressure
+INGESTION_MAX_IN_FLIGHT = int(os.getenv("INGESTION_MAX_IN_FLIGHT", "64"))
+# Connections reserved for ingestion writes, separate from the pool of async_engine
+INGESTION_POOL_SIZE = int(os.getenv("INGESTION_POOL_SIZE", "2"))
+# Number of readings written at once by streaming backfill uploads
+INGESTION_BACKFILL_CHUNK_SIZE = int(os.getenv("INGESTION_BACKFILL_CHUNK_SIZE", "5000"))
+# READINGS monthly partitions
+READINGS_PARTITION_MONTHS_AHEAD = int(os.getenv("READINGS_PARTITION_MONTHS_AHEAD", "3"))
+READINGS_PARTITION_MAINTENANCE_INTERVAL_SECONDS = float(os.getenv("READINGS_PARTITION_MAINTENANCE_INTERVAL_SECONDS", "86400"))
+# Generic historical query
+HISTORICAL_MAX_POINTS = int(os.getenv("HISTORICAL_MAX_POINTS", "1000"))
+# Longest range served from raw readings
+HISTORICAL_RAW_MAX_RANGE_HOURS = int(os.getenv("HISTORICAL_RAW_MAX_RANGE_HOURS", "48"))
+# Raw readings retention. Older readings are compacted into rollups and deleted. 0 keeps every reading.
+READINGS_RAW_RETENTION_DAYS = int(os.getenv("READINGS_RAW_RETENTION_DAYS", "0"))
+READINGS_RETENTION_BATCH_SIZE = int(os.getenv("READINGS_RETENTION_BATCH_SIZE", "10000"))
+READINGS_RETENTION_INTERVAL_SECONDS = float(os.getenv("READINGS_RETENTION_INTERVAL_SECONDS", "3600"))
+# Connection pool warm-up on startup. 0 disables the warm-up.
+WARMUP_CONNECTIONS = int(os.getenv("WARMUP_CONNECTIONS", "5"))
+WARMUP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_TIMEOUT_SECONDS", "30"))
+# Optional read replica for read-only sessions, see src.db.db.get_read_db. Unset routes reads to the primary.
+READ_REPLICA_DATABASE_URL = os.getenv("READ_REPLICA_DATABASE_URL")
+READ_REPLICA_CONNECT_TIMEOUT_SECONDS = float(os.getenv("READ_REPLICA_CONNECT_TIMEOUT_SECONDS", "2"))
+# Time reads stay on the primary after the replica could not be reached
+READ_REPLICA_RETRY_SECONDS = float(os.getenv("READ_REPLICA_RETRY_SECONDS", "30"))
+# Readings fetched and encoded at once by /device-data/{device_id}/export
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "10000"))
+# Temperature limit breaches of ingested readings, see src.ingestion.thresholds
+THRESHOLD_EVALUATION_ENABLED = os.getenv("THRESHOLD_EVALUATION_ENABLED", "true").lower() == "true"
+# A breach ends once the temperature is back inside the limit by this many degrees
+THRESHOLD_HYSTERESIS_CELSIUS = float(os.getenv("THRESHOLD_HYSTERESIS_CELSIUS", "0.5"))
+DEVICE_LIMITS_CACHE_SIZE = int(os.getenv("DEVICE_LIMITS_CACHE_SIZE", "100000"))
+# Bounds staleness when settings are updated by another process
+DEVICE_LIMITS_CACHE_TTL_SECONDS = float(os.getenv("DEVICE_LIMITS_CACHE_TTL_SECONDS", "300"))
+# Existence of the users of valid tokens, see src.routers.auth.user_cache. Deleted users are rejected after at most the TTL.
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "100000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+USER_NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv("USER_NEGATIVE_CACHE_TTL_SECONDS", "30"))
+# Threads hashing and verifying passwords with bcrypt, see src.auth.utils. Logins beyond this wait in arrival order.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
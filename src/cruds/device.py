@@ -1,17 +1,48 @@
-from datetime import datetime
-from typing import List, Tuple
-
-from sqlalchemy.engine import Result
-from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+from datetime import datetime, timedelta
+from itertools import repeat
+from typing import AsyncIterator, Dict, List, Tuple
+
+import asyncpg
+import numpy as np
+from sqlalchemy import Boolean, DateTime, Float, String, event
+from sqlalchemy.engine import Connection, Engine, Result
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.pool.base import _ConnectionFairy
 from sqlalchemy.sql import text
+from sqlalchemy.sql.selectable import TextualSelect
 
 import src.schemas.device as device_schema
+from src.constants.common import DEVICE_DATA_INGESTION_MODE, READINGS_RAW_RETENTION_DAYS
+from src.errors.errors import CopyNotSupportedError
+
+# Batches of at least this many records are written with COPY in "auto" mode
+COPY_MIN_RECORDS = 1000
+READING_COLUMNS = ["device_id", "created_at", "temperature", "humidity", "motion", "is_alarm", "device_listening"]
+# Columns of READINGS kept in LATEST_READINGS
+LATEST_READING_COLUMNS = ["temperature", "humidity", "is_alarm"]
+
+
+# Statements of the most frequent queries are built once, so that each request only binds parameters
+# and SQLAlchemy reuses their compiled form from the statement cache.
+LATEST_DEVICE_DATA_STMT = text(
+    """
+    SELECT
+        A.TEMPERATURE,
+        A.HUMIDITY,
+        A.IS_ALARM
+    FROM
+        LATEST_READINGS A
+    WHERE
+        A.DEVICE_ID = :device_id
+"""
+).columns(temperature=Float, humidity=Float, is_alarm=Boolean)
 
 
 async def get_latest_device_data(db: AsyncSession, device_id: str) -> Tuple[float, float, bool]:
     """Get latest device info
 
-    Get the latest temperature, humidity from the database.
+    Get the latest temperature, humidity and alarm from LATEST_READINGS, which is kept up to date on ingest.
 
     Args:
         db (AsyncSession): AsyncSession
@@ -20,60 +51,10 @@ async def get_latest_device_data(db: AsyncSession, device_id: str) -> Tuple[floa
     Returns:
         (float, float, bool): Tuples in the order of temperature, humidity, alarm.
     """
-    stmt = text(
-        """
-        SELECT
-            SUB_TEMP.TEMPERATURE,
-            SUB_HUMID.HUMIDITY,
-            SUB_ALARM.IS_ALARM
-        FROM
-            (
-                SELECT
-                    A.TEMPERATURE,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY DEVICE_ID
-                        ORDER BY
-                            CREATED_AT DESC
-                    ) AS NUM
-                FROM
-                    TEMPERATURE A
-                WHERE
-                    A.DEVICE_ID = :device_id
-            ) SUB_TEMP,
-            (
-                SELECT
-                    A.HUMIDITY,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY DEVICE_ID
-                        ORDER BY
-                            CREATED_AT DESC
-                    ) AS NUM
-                FROM
-                    HUMIDITY A
-                WHERE
-                    A.DEVICE_ID = :device_id
-            ) SUB_HUMID,
-            (
-                SELECT
-                    A.IS_ALARM,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY DEVICE_ID
-                        ORDER BY
-                            CREATED_AT DESC
-                    ) AS NUM
-                FROM
-                    ALARM A
-            WHERE
-                A.DEVICE_ID = :device_id
-            ) SUB_ALARM
-        WHERE
-            SUB_TEMP.NUM = 1
-            AND SUB_HUMID.NUM = 1
-            AND SUB_ALARM.NUM = 1
-    """
-    )
-    result: Result = await db.execute(stmt, params={"device_id": device_id})
-    first: Tuple[float, float, bool] = result.one()
+    result: Result = await db.execute(LATEST_DEVICE_DATA_STMT, params={"device_id": device_id})
+    first: Tuple[float, float, bool] | None = result.one_or_none()
+    if first is None:
+        return None, None, None
     return first
 
 
@@ -113,24 +94,7 @@ async def get_historical_device_data_day(db: AsyncSession, device_id: str) -> Li
     Returns:
         [device.schema.DeviceHistorical]: List of device historical data
     """
-    stmt = """
-        SELECT
-            MIN(A.TEMPERATURE) AS MIN_TEMP,
-            MAX(A.TEMPERATURE) AS MAX_TEMP,
-            MIN(B.HUMIDITY) AS MIN_HUMID,
-            MAX(B.HUMIDITY) AS MAX_HUMID,
-            TO_CHAR(A.CREATED_AT, 'YYYY/MM/DD HH24:00:00') AS CREATED_DATE
-        FROM TEMPERATURE A
-        INNER JOIN HUMIDITY B
-            ON A.CREATED_AT = B.CREATED_AT
-            AND A.DEVICE_ID = B.DEVICE_ID
-        WHERE
-            A.CREATED_AT BETWEEN now() - INTERVAL '1 day' AND now()
-            AND A.DEVICE_ID = :device_id
-        GROUP BY CREATED_DATE
-        ORDER BY CREATED_DATE
-    """
-    result: Result = await db.execute(stmt, params={"device_id": device_id})
+    result: Result = await db.execute(HISTORICAL_DAY_STMT, params={"device_id": device_id})
     rows = result.all()
 
     result = []
@@ -159,24 +123,7 @@ async def get_historical_device_data_week(db: AsyncSession, device_id: str) -> L
     Returns:
         [device.schema.DeviceHistorical]: List of device historical data
     """
-    stmt = """
-        SELECT
-            MIN(A.TEMPERATURE) AS MIN_TEMP,
-            MAX(A.TEMPERATURE) AS MAX_TEMP,
-            MIN(B.HUMIDITY) AS MIN_HUMID,
-            MAX(B.HUMIDITY) AS MAX_HUMID,
-            TO_CHAR(A.CREATED_AT, 'YYYY/MM/DD') AS CREATED_DATE
-        FROM TEMPERATURE A
-        INNER JOIN HUMIDITY B
-            ON A.CREATED_AT = B.CREATED_AT
-            AND A.DEVICE_ID = B.DEVICE_ID
-        WHERE
-            A.CREATED_AT BETWEEN now() - INTERVAL '1 week' AND now()
-            AND A.DEVICE_ID = :device_id
-        GROUP BY CREATED_DATE
-        ORDER BY CREATED_DATE
-    """
-    result: Result = await db.execute(stmt, params={"device_id": device_id})
+    result: Result = await db.execute(HISTORICAL_WEEK_STMT, params={"device_id": device_id})
     rows = result.all()
 
     result = []
@@ -205,25 +152,7 @@ async def get_historical_device_data_month(db: AsyncSession, device_id: str) ->
     Returns:
         [device.schema.DeviceHistorical]: List of device historical data
     """
-
-    stmt = """
-        SELECT
-            MIN(A.TEMPERATURE) AS MIN_TEMP,
-            MAX(A.TEMPERATURE) AS MAX_TEMP,
-            MIN(B.HUMIDITY) AS MIN_HUMID,
-            MAX(B.HUMIDITY) AS MAX_HUMID,
-            TO_CHAR(DATE_TRUNC('week', A.CREATED_AT), 'YYYY/MM/DD') AS CREATED_DATE
-        FROM TEMPERATURE A
-        INNER JOIN HUMIDITY B
-            ON A.CREATED_AT = B.CREATED_AT
-            AND A.DEVICE_ID = B.DEVICE_ID
-        WHERE
-            A.CREATED_AT BETWEEN now() - INTERVAL '4 WEEKS' AND now()
-            AND A.DEVICE_ID = :device_id
-        GROUP BY CREATED_DATE
-        ORDER BY CREATED_DATE DESC
-    """
-    result: Result = await db.execute(stmt, params={"device_id": device_id})
+    result: Result = await db.execute(HISTORICAL_MONTH_STMT, params={"device_id": device_id})
     rows = result.all()
 
     result = []
@@ -245,43 +174,382 @@ async def get_historical_device_data_month(db: AsyncSession, device_id: str) ->
     return result
 
 
-async def get_historical_device_data_alarm(db: AsyncSession, device_id: str) -> List[device_schema.DeviceHistoricalAlarm]:
+def _historical_rollup_stmt(window: str, label: str, order: str, use_daily: bool) -> str:
     """
-    Get historical alarm data
+    Build a query of min/max temperature and humidity per label over the last `window`, from rollups where possible.
+
+    The window (now - `window`, now) is split into:
+        - the partial hours at both ends, aggregated from READINGS,
+        - full days, from READINGS_DAILY if `use_daily`,
+        - the remaining full hours, from READINGS_HOURLY.
+    Labels are computed from the bucket start, so buckets must not be coarser than a label.
+    The result is the same as aggregating READINGS rows with both temperature and humidity over the window.
 
     Args:
-        db (AsyncSession): AsyncSession
-        device_id (str): Device id
+        window (str): Interval literal, e.g. "1 week".
+        label (str): SQL expression of BUCKET_START to group by.
+        order (str): "ASC" or "DESC".
+        use_daily (bool): Use READINGS_DAILY for full days.
+
+    Returns:
+        str: SQL with :device_id parameter.
+    """
+    start_at = f"(LOCALTIMESTAMP - INTERVAL '{window}')"
+    hour_start = f"DATE_TRUNC('hour', {start_at} + INTERVAL '1 hour' - INTERVAL '1 microsecond')"
+    hour_end = "DATE_TRUNC('hour', LOCALTIMESTAMP)"
+    day_start = f"DATE_TRUNC('day', {start_at} + INTERVAL '1 day' - INTERVAL '1 microsecond')"
+    day_end = "DATE_TRUNC('day', LOCALTIMESTAMP)"
+
+    hourly_condition = f"AND (H.BUCKET_START < {day_start} OR H.BUCKET_START >= {day_end})" if use_daily else ""
+    daily_buckets = (
+        f"""
+            UNION ALL
+            SELECT D.BUCKET_START, D.TEMPERATURE_MIN, D.TEMPERATURE_MAX, D.HUMIDITY_MIN, D.HUMIDITY_MAX
+            FROM READINGS_DAILY D
+            WHERE
+                D.DEVICE_ID = :device_id
+                AND D.TEMPERATURE_COUNT > 0
+                AND D.BUCKET_START >= {day_start}
+                AND D.BUCKET_START < {day_end}
+        """
+        if use_daily
+        else ""
+    )
+
+    return f"""
+        SELECT
+            MIN(A.MIN_TEMP) AS MIN_TEMP,
+            MAX(A.MAX_TEMP) AS MAX_TEMP,
+            MIN(A.MIN_HUMID) AS MIN_HUMID,
+            MAX(A.MAX_HUMID) AS MAX_HUMID,
+            {label} AS CREATED_DATE
+        FROM (
+            SELECT R.CREATED_AT AS BUCKET_START, R.TEMPERATURE AS MIN_TEMP, R.TEMPERATURE AS MAX_TEMP, R.HUMIDITY AS MIN_HUMID, R.HUMIDITY AS MAX_HUMID
+            FROM READINGS R
+            WHERE
+                R.DEVICE_ID = :device_id
+                AND R.TEMPERATURE IS NOT NULL
+                AND R.HUMIDITY IS NOT NULL
+                AND R.CREATED_AT >= {start_at}
+                AND R.CREATED_AT < {hour_start}
+            UNION ALL
+            SELECT R.CREATED_AT, R.TEMPERATURE, R.TEMPERATURE, R.HUMIDITY, R.HUMIDITY
+            FROM READINGS R
+            WHERE
+                R.DEVICE_ID = :device_id
+                AND R.TEMPERATURE IS NOT NULL
+                AND R.HUMIDITY IS NOT NULL
+                AND R.CREATED_AT >= {hour_end}
+                AND R.CREATED_AT <= LOCALTIMESTAMP
+            UNION ALL
+            SELECT H.BUCKET_START, H.TEMPERATURE_MIN, H.TEMPERATURE_MAX, H.HUMIDITY_MIN, H.HUMIDITY_MAX
+            FROM READINGS_HOURLY H
+            WHERE
+                H.DEVICE_ID = :device_id
+                AND H.TEMPERATURE_COUNT > 0
+                AND H.BUCKET_START >= {hour_start}
+                AND H.BUCKET_START < {hour_end}
+                {hourly_condition}
+            {daily_buckets}
+        ) A
+        GROUP BY CREATED_DATE
+        ORDER BY CREATED_DATE {order}
+    """
+
+
+def _historical_stmt(window: str, label: str, order: str, use_daily: bool) -> TextualSelect:
+    """
+    Build a typed statement from _historical_rollup_stmt.
+
+    Args:
+        window (str): See _historical_rollup_stmt.
+        label (str): See _historical_rollup_stmt.
+        order (str): See _historical_rollup_stmt.
+        use_daily (bool): See _historical_rollup_stmt.
+
+    Returns:
+        TextualSelect: Statement with typed result columns.
+    """
+    return text(_historical_rollup_stmt(window, label, order, use_daily)).columns(
+        min_temp=Float, max_temp=Float, min_humid=Float, max_humid=Float, created_date=String
+    )
+
+
+HISTORICAL_DAY_STMT = _historical_stmt("1 day", "TO_CHAR(BUCKET_START, 'YYYY/MM/DD HH24:00:00')", "ASC", use_daily=False)
+HISTORICAL_WEEK_STMT = _historical_stmt("1 week", "TO_CHAR(BUCKET_START, 'YYYY/MM/DD')", "ASC", use_daily=True)
+HISTORICAL_MONTH_STMT = _historical_stmt("4 weeks", "TO_CHAR(DATE_TRUNC('week', BUCKET_START), 'YYYY/MM/DD')", "DESC", use_daily=True)
+
+
+def _alarm_page_stmt(keyset_condition: str) -> TextualSelect:
+    """
+    Build the statement of a page of alarm history.
+
+    Args:
+        keyset_condition (str): Condition on CREATED_AT for pages after the first, or "".
 
     Returns:
-        [device.schema.DeviceHistoricalAlarm]: List of device historical alarm data
+        TextualSelect: Statement with typed result columns.
     """
-    #
-    stmt = """
+    return text(
+        f"""
         SELECT
             TO_CHAR(CREATED_AT, 'YYYY/MM/DD') AS DATE,
-            TO_CHAR(CREATED_AT, 'HH24:MI') AS HOUR
-        FROM ALARM
+            TO_CHAR(CREATED_AT, 'HH24:MI') AS HOUR,
+            CREATED_AT
+        FROM READINGS
         WHERE
             DEVICE_ID = :device_id
-        AND
-            IS_ALARM = True
-        ORDER BY DATE, HOUR
+            AND IS_ALARM = True
+            {keyset_condition}
+        ORDER BY CREATED_AT
+        LIMIT :limit
     """
+    ).columns(date=String, hour=String, created_at=DateTime)
 
-    result: Result = await db.execute(stmt, params={"device_id": device_id})
+
+# The keyset condition is only in the statement of later pages, so that it is always usable as an index condition.
+ALARM_FIRST_PAGE_STMT = _alarm_page_stmt("")
+ALARM_NEXT_PAGE_STMT = _alarm_page_stmt("AND CREATED_AT > :after")
+
+
+async def get_historical_device_data_alarm(db: AsyncSession, device_id: str, limit: int, after: datetime | None = None) -> Tuple[List[dict], datetime | None]:
+    """
+    Get historical alarm data, oldest first, one page at a time.
+
+    Pages are found with keyset pagination on CREATED_AT, which is unique per device,
+    using the partial index of alarm readings.
+    Alarms are returned as plain dicts in the shape of src.schemas.device.DeviceHistoricalAlarm, ready to be serialized.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        limit (int): Page size.
+        after (datetime | None): Created timestamp of the last alarm of the previous page.
+
+    Returns:
+        ([dict], datetime | None): Page of device historical alarm data,
+            and the created timestamp of its last alarm if there is a next page.
+    """
+    if after is None:
+        result: Result = await db.execute(ALARM_FIRST_PAGE_STMT, params={"device_id": device_id, "limit": limit + 1})
+    else:
+        result = await db.execute(ALARM_NEXT_PAGE_STMT, params={"device_id": device_id, "after": after, "limit": limit + 1})
     rows = result.all()
 
-    result = []
-    for row in rows:
-        result.append(
-            device_schema.DeviceHistoricalAlarm(
-                date=row[0],
-                hour=row[1],
-            )
-        )
+    alarms = [{"date": row.date, "hour": row.hour} for row in rows[:limit]]
+    next_after = rows[limit - 1].created_at if len(rows) > limit else None
+    return alarms, next_after
 
-    return result
+
+# Rollup tables by bucket, see get_reading_rollups
+ROLLUP_TABLES = {"hour": "READINGS_HOURLY", "day": "READINGS_DAILY"}
+
+
+async def get_raw_readings(db: AsyncSession, device_id: str, start: datetime, end: datetime) -> List[Tuple[datetime, float, float]]:
+    """
+    Get readings with both temperature and humidity in a range.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        start (datetime): Start of the range, inclusive.
+        end (datetime): End of the range, exclusive.
+
+    Returns:
+        List[Tuple[datetime, float, float]]: (created_at, temperature, humidity) in ascending order of created_at.
+    """
+    stmt = text(
+        """
+        SELECT
+            A.CREATED_AT,
+            A.TEMPERATURE,
+            A.HUMIDITY
+        FROM
+            READINGS A
+        WHERE
+            A.DEVICE_ID = :device_id
+            AND A.CREATED_AT >= :start
+            AND A.CREATED_AT < :end
+            AND A.TEMPERATURE IS NOT NULL
+            AND A.HUMIDITY IS NOT NULL
+        ORDER BY
+            A.CREATED_AT
+    """
+    )
+    result: Result = await db.execute(stmt, params={"device_id": device_id, "start": start, "end": end})
+    return result.all()
+
+
+# Readings of the last :window as one array per column, with the temperature limits of the device.
+# Arrays come back as single values instead of one row per reading, and turn into NumPy arrays without a Python loop.
+# They are aggregated in scan order, which is the same for every column.
+HISTORICAL_SERIES_STMT = text(
+    """
+    SELECT
+        D.TEMP_LOWER_LIMIT,
+        D.TEMP_UPPER_LIMIT,
+        R.CREATED_AT,
+        R.TEMPERATURE,
+        R.HUMIDITY
+    FROM
+        DEVICES D
+    CROSS JOIN LATERAL (
+        SELECT
+            ARRAY_AGG(CAST(EXTRACT(EPOCH FROM A.CREATED_AT) AS DOUBLE PRECISION)) AS CREATED_AT,
+            ARRAY_AGG(A.TEMPERATURE) AS TEMPERATURE,
+            ARRAY_AGG(A.HUMIDITY) AS HUMIDITY
+        FROM
+            READINGS A
+        WHERE
+            A.DEVICE_ID = D.ID
+            AND A.TEMPERATURE IS NOT NULL
+            AND A.HUMIDITY IS NOT NULL
+            AND A.CREATED_AT >= LOCALTIMESTAMP - CAST(:window AS INTERVAL)
+            AND A.CREATED_AT <= LOCALTIMESTAMP
+    ) R
+    WHERE
+        D.ID = :device_id
+"""
+)
+
+
+async def get_historical_series_arrays(
+    db: AsyncSession, device_id: str, window: timedelta
+) -> Tuple[float | None, float | None, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get readings with both temperature and humidity over the last `window` as NumPy arrays.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        window (timedelta): Length of the range, ending now.
+
+    Returns:
+        (float | None, float | None, np.ndarray, np.ndarray, np.ndarray): Temperature lower and upper limits,
+            then created_at as seconds since the epoch of the naive timestamp, temperature and humidity, unordered.
+    """
+    result: Result = await db.execute(HISTORICAL_SERIES_STMT, params={"device_id": device_id, "window": window})
+    row = result.one_or_none()
+    if row is None:
+        return None, None, np.empty(0), np.empty(0), np.empty(0)
+    lower, upper, *columns = row
+    return (lower, upper, *(np.array(column if column is not None else [], dtype=np.float64) for column in columns))
+
+
+# Columns of READINGS in exports, see src.export.service
+EXPORT_COLUMNS = ["created_at", "temperature", "humidity", "motion", "is_alarm", "device_listening"]
+EXPORT_READINGS_STMT = text(
+    """
+    SELECT
+        A.CREATED_AT,
+        A.TEMPERATURE,
+        A.HUMIDITY,
+        A.MOTION,
+        A.IS_ALARM,
+        A.DEVICE_LISTENING
+    FROM
+        READINGS A
+    WHERE
+        A.DEVICE_ID = :device_id
+        AND A.CREATED_AT >= :start
+        AND A.CREATED_AT < :end
+    ORDER BY
+        A.CREATED_AT
+"""
+).columns(created_at=DateTime, temperature=Float, humidity=Float, motion=Boolean, is_alarm=Boolean, device_listening=Boolean)
+
+
+async def stream_readings(db: AsyncSession, device_id: str, start: datetime, end: datetime, chunk_size: int) -> AsyncIterator[List[tuple]]:
+    """
+    Stream all readings in a range in chunks, through a server-side cursor.
+    Only one chunk is held in memory at a time, however many readings the range has.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        start (datetime): Start of the range, inclusive.
+        end (datetime): End of the range, exclusive.
+        chunk_size (int): Number of readings fetched at once.
+
+    Yields:
+        List[tuple]: Readings in the order of EXPORT_COLUMNS, in ascending order of created_at.
+    """
+    result: AsyncResult = await db.stream(
+        EXPORT_READINGS_STMT.execution_options(yield_per=chunk_size), params={"device_id": device_id, "start": start, "end": end}
+    )
+    async for rows in result.partitions():
+        yield rows
+
+
+async def get_reading_rollups(db: AsyncSession, device_id: str, bucket: str, start: datetime, end: datetime) -> List[tuple]:
+    """
+    Get hourly or daily rollups of readings in a range.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        bucket (str): "hour" or "day".
+        start (datetime): Start of the range. The bucket containing it is included.
+        end (datetime): End of the range, exclusive.
+
+    Returns:
+        List[tuple]: (bucket_start, temperature_min, temperature_max, temperature_sum, temperature_count,
+            humidity_min, humidity_max, humidity_sum, humidity_count) in ascending order of bucket_start.
+    """
+    stmt = text(
+        f"""
+        SELECT
+            A.BUCKET_START,
+            A.TEMPERATURE_MIN,
+            A.TEMPERATURE_MAX,
+            A.TEMPERATURE_SUM,
+            A.TEMPERATURE_COUNT,
+            A.HUMIDITY_MIN,
+            A.HUMIDITY_MAX,
+            A.HUMIDITY_SUM,
+            A.HUMIDITY_COUNT
+        FROM
+            {ROLLUP_TABLES[bucket]} A
+        WHERE
+            A.DEVICE_ID = :device_id
+            AND A.BUCKET_START >= DATE_TRUNC(:bucket, CAST(:start AS TIMESTAMP))
+            AND A.BUCKET_START < :end
+            AND A.TEMPERATURE_COUNT > 0
+        ORDER BY
+            A.BUCKET_START
+    """
+    )
+    result: Result = await db.execute(stmt, params={"device_id": device_id, "bucket": bucket, "start": start, "end": end})
+    return result.all()
+
+
+TEMPERATURE_LIMITS_STMT = text(
+    """
+    SELECT
+        ID,
+        TEMP_LOWER_LIMIT,
+        TEMP_UPPER_LIMIT
+    FROM
+        DEVICES
+    WHERE
+        ID = ANY(CAST(:device_ids AS UUID[]))
+"""
+)
+
+
+async def find_temperature_limits(db: AsyncSession, device_ids: List[str]) -> Dict[str, Tuple[float | None, float | None]]:
+    """
+    Find the temperature limits of devices.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_ids (List[str]): Device ids
+
+    Returns:
+        Dict[str, Tuple[float | None, float | None]]: (Lower limit, upper limit) by device id, for devices that exist.
+    """
+    result: Result = await db.execute(TEMPERATURE_LIMITS_STMT, params={"device_ids": device_ids})
+    return {str(device_id): (lower, upper) for device_id, lower, upper in result.all()}
 
 
 async def get_latitude_and_longitude(db: AsyncSession, device_id: str) -> Tuple[float | None, float | None]:
@@ -345,126 +613,467 @@ async def create_device(db: AsyncSession, device_id: str, latitude: float, longi
     )
 
 
-async def create_device_data(db: AsyncSession, device_id: str, device_data_list: list[device_schema.DeviceDataCreate]) -> None:
+async def create_device_data(
+    db: AsyncSession, device_id: str, device_data_list: list[device_schema.DeviceDataCreate], mode: str = DEVICE_DATA_INGESTION_MODE
+) -> None:
     """
-    Create each parameter data from device data
+    Create readings from device data
 
     Args:
         db (AsyncSession): AsyncSession
         device_id (str): Device id
         device_data_list (list[device_schema.DeviceDataCreate]): List of device data
+        mode (str): Ingestion mode, see create_readings. Defaults to DEVICE_DATA_INGESTION_MODE.
     """
-    collected_data: dict = {
-        "temperature": [],
-        "humidity": [],
-        "motion": [],
-        "alarm": [],
-        "button": [],
-    }
-    for device_data in device_data_list:
-        collected_data["temperature"].append({"temperature": device_data.temperature_c, "created_at": device_data.created_at, "device_id": device_id})
-        collected_data["humidity"].append({"humidity": device_data.humidity, "created_at": device_data.created_at, "device_id": device_id})
-        collected_data["motion"].append({"motion": device_data.motion, "created_at": device_data.created_at, "device_id": device_id})
-        collected_data["alarm"].append({"is_alarm": device_data.alarm, "created_at": device_data.created_at, "device_id": device_id})
-        collected_data["button"].append({"device_listening": device_data.button, "created_at": device_data.created_at, "device_id": device_id})
+    records = to_reading_records(device_id, device_data_list)
+    await create_readings(db, records, mode=mode)
+
+
+def to_reading_records(device_id: str, device_data_list: list[device_schema.DeviceDataCreate]) -> list[tuple]:
+    """
+    Convert device data to reading records.
+
+    Args:
+        device_id (str): Device id
+        device_data_list (list[device_schema.DeviceDataCreate]): List of device data
 
-    await _create_temperature(db, collected_data["temperature"])
-    await _create_humidity(db, collected_data["humidity"])
-    await _create_motion(db, collected_data["motion"])
-    await _create_alarm(db, collected_data["alarm"])
-    await _create_button(db, collected_data["button"])
+    Returns:
+        list[tuple]: Reading records in the order of READING_COLUMNS.
+    """
+    device_uuid = uuid.UUID(device_id)
+    return [
+        (device_uuid, device_data.created_at, device_data.temperature_c, device_data.humidity, device_data.motion, device_data.alarm, device_data.button)
+        for device_data in device_data_list
+    ]
 
 
-async def _create_temperature(db: AsyncSession, temperature_data_list: list[dict]) -> None:
+def columns_to_reading_records(device_id: str, device_data_columns: device_schema.DeviceDataColumns) -> list[tuple]:
     """
-    Create temperature data.
+    Convert column-oriented device data to reading records without building per-row objects.
+
+    Args:
+        device_id (str): Device id
+        device_data_columns (device_schema.DeviceDataColumns): Column-oriented device data
+
+    Returns:
+        list[tuple]: Reading records in the order of READING_COLUMNS.
+    """
+    return list(
+        zip(
+            repeat(uuid.UUID(device_id)),
+            device_data_columns.created_at.tolist(),
+            device_data_columns.temperature_c.tolist(),
+            device_data_columns.humidity.tolist(),
+            device_data_columns.motion.tolist(),
+            device_data_columns.alarm.tolist(),
+            device_data_columns.button.tolist(),
+        )
+    )
+
+
+async def create_readings(db: AsyncSession, records: list[tuple], mode: str = DEVICE_DATA_INGESTION_MODE) -> None:
+    """
+    Create readings from reading records.
+
+    Modes:
+        - "unnest": one INSERT ... SELECT FROM UNNEST of column arrays, a single round-trip.
+        - "copy": binary COPY through a staging table inside a savepoint. Falls back to "insert" if COPY fails.
+        - "insert": executemany INSERT.
+        - "auto": "copy" for batches of COPY_MIN_RECORDS records or more, "unnest" otherwise.
+
+    Readings older than READINGS_RAW_RETENTION_DAYS days, if set, are skipped.
 
     Args:
         db (AsyncSession): AsyncSession
-        temperature_data_list (list[dict]): List of temperature table parameters
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
+        mode (str): Ingestion mode. Defaults to DEVICE_DATA_INGESTION_MODE.
     """
-    stmt = text(
-        """
-        INSERT INTO
-            TEMPERATURE (temperature, created_at, device_id)
-        VALUES
-            (:temperature, :created_at, :device_id)
+    if READINGS_RAW_RETENTION_DAYS > 0:
+        # Hours older than the retention window have been compacted and their readings deleted,
+        # re-aggregating them from a late reading would overwrite their rollups with partial data.
+        expires_at = datetime.now() - timedelta(days=READINGS_RAW_RETENTION_DAYS)
+        records = [record for record in records if record[1].replace(tzinfo=None) >= expires_at]
+    if not records:
+        return
+    await _write_readings(db, records, mode)
+    await upsert_latest_readings(db, records)
+    await update_reading_rollups(db, records)
+
+
+async def _write_readings(db: AsyncSession, records: list[tuple], mode: str) -> None:
     """
-    )
-    await db.execute(stmt, params=temperature_data_list)
+    Write reading records to READINGS.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
+        mode (str): Ingestion mode, see create_readings.
+    """
+    if mode == "auto":
+        mode = "copy" if len(records) >= COPY_MIN_RECORDS else "unnest"
+
+    if mode == "unnest":
+        await _unnest_readings(db, records)
+        return
+
+    if mode == "copy":
+        try:
+            async with db.begin_nested():
+                await _copy_readings(db, records)
+            return
+        except (asyncpg.PostgresError, asyncpg.InterfaceError, CopyNotSupportedError) as e:
+            # TODO Replace with logger
+            print(f"COPY ingestion failed, falling back to INSERT: {e}")
+
+    await _insert_readings(db, records)
+
+
+def latest_reading_values(records: list[tuple]) -> list[tuple]:
+    """
+    Get the latest non-null value of each LATEST_READING_COLUMNS column per device in reading records.
+
+    Records can be in any order, the value with the greatest timestamp wins.
 
+    Args:
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
 
-async def _create_humidity(db: AsyncSession, humidity_data_list: list[dict]) -> None:
+    Returns:
+        list[tuple]: (device_id, temperature, temperature_at, humidity, humidity_at, is_alarm, is_alarm_at) per device, sorted by device id.
     """
-    Create humidity data.
+    indexes = [READING_COLUMNS.index(column) for column in LATEST_READING_COLUMNS]
+    latest: dict[uuid.UUID, list] = {}
+    for record in records:
+        created_at = record[1]
+        values = latest.setdefault(record[0], [None] * (len(indexes) * 2))
+        for i, index in enumerate(indexes):
+            if record[index] is None:
+                continue
+            if values[i * 2 + 1] is None or created_at >= values[i * 2 + 1]:
+                values[i * 2] = record[index]
+                values[i * 2 + 1] = created_at
+    return [(device_id, *values) for device_id, values in sorted(latest.items(), key=lambda item: str(item[0]))]
+
+
+UPSERT_LATEST_READINGS_STMT = text(
+    """
+    INSERT INTO
+        LATEST_READINGS (device_id, temperature, temperature_at, humidity, humidity_at, is_alarm, is_alarm_at)
+    SELECT
+        *
+    FROM
+        UNNEST(
+            CAST(:device_id AS UUID[]),
+            CAST(:temperature AS FLOAT[]),
+            CAST(:temperature_at AS TIMESTAMP[]),
+            CAST(:humidity AS FLOAT[]),
+            CAST(:humidity_at AS TIMESTAMP[]),
+            CAST(:is_alarm AS BOOLEAN[]),
+            CAST(:is_alarm_at AS TIMESTAMP[])
+        )
+    ON CONFLICT (device_id) DO UPDATE SET
+        temperature = CASE
+            WHEN EXCLUDED.temperature_at >= COALESCE(LATEST_READINGS.temperature_at, '-infinity') THEN EXCLUDED.temperature
+            ELSE LATEST_READINGS.temperature
+        END,
+        temperature_at = GREATEST(LATEST_READINGS.temperature_at, EXCLUDED.temperature_at),
+        humidity = CASE
+            WHEN EXCLUDED.humidity_at >= COALESCE(LATEST_READINGS.humidity_at, '-infinity') THEN EXCLUDED.humidity
+            ELSE LATEST_READINGS.humidity
+        END,
+        humidity_at = GREATEST(LATEST_READINGS.humidity_at, EXCLUDED.humidity_at),
+        is_alarm = CASE
+            WHEN EXCLUDED.is_alarm_at >= COALESCE(LATEST_READINGS.is_alarm_at, '-infinity') THEN EXCLUDED.is_alarm
+            ELSE LATEST_READINGS.is_alarm
+        END,
+        is_alarm_at = GREATEST(LATEST_READINGS.is_alarm_at, EXCLUDED.is_alarm_at)
+"""
+)
+
+
+async def upsert_latest_readings(db: AsyncSession, records: list[tuple]) -> None:
+    """
+    Upsert LATEST_READINGS from reading records.
+
+    A column is only replaced by a value with a timestamp at least as recent as the stored one,
+    so batches that arrive late or out of order never overwrite newer values.
+    Rows are written in device id order so that concurrent batches lock them in the same order.
 
     Args:
         db (AsyncSession): AsyncSession
-        humidity_data_list (list[dict]): List of humidity table parameters
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
     """
-    stmt = text(
-        """
-        INSERT INTO
-            HUMIDITY (humidity, created_at, device_id)
-        VALUES
-            (:humidity, :created_at, :device_id)
+    keys = ["device_id"] + [key for column in LATEST_READING_COLUMNS for key in (column, f"{column}_at")]
+    columns = [list(column) for column in zip(*latest_reading_values(records))]
+    await db.execute(UPSERT_LATEST_READINGS_STMT, params=dict(zip(keys, columns)))
+
+
+def reading_rollup_buckets(records: list[tuple]) -> tuple[list[tuple], list[tuple]]:
     """
-    )
-    await db.execute(stmt, params=humidity_data_list)
+    Get the hourly and daily buckets touched by reading records.
+
+    Args:
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
+
+    Returns:
+        tuple[list[tuple], list[tuple]]: (device_id, bucket_start) of the hours and of the days, sorted.
+    """
+    hours = {(record[0], record[1].replace(minute=0, second=0, microsecond=0)) for record in records}
+    days = {(device_id, hour.replace(hour=0)) for device_id, hour in hours}
+    return sorted(hours, key=lambda bucket: (str(bucket[0]), bucket[1])), sorted(days, key=lambda bucket: (str(bucket[0]), bucket[1]))
 
 
-async def _create_motion(db: AsyncSession, motion_data_list: list[dict]) -> None:
+HOURLY_ROLLUP_STMT = text(
+    """
+    INSERT INTO
+        READINGS_HOURLY (
+            device_id, bucket_start,
+            temperature_min, temperature_max, temperature_sum, temperature_count,
+            humidity_min, humidity_max, humidity_sum, humidity_count
+        )
+    SELECT
+        K.DEVICE_ID,
+        K.BUCKET_START,
+        MIN(R.TEMPERATURE),
+        MAX(R.TEMPERATURE),
+        SUM(R.TEMPERATURE),
+        COUNT(R.TEMPERATURE),
+        MIN(R.HUMIDITY),
+        MAX(R.HUMIDITY),
+        SUM(R.HUMIDITY),
+        COUNT(R.HUMIDITY)
+    FROM
+        UNNEST(CAST(:device_id AS UUID[]), CAST(:bucket_start AS TIMESTAMP[])) AS K(DEVICE_ID, BUCKET_START)
+    LEFT JOIN READINGS R
+        ON R.DEVICE_ID = K.DEVICE_ID
+        AND R.CREATED_AT >= K.BUCKET_START
+        AND R.CREATED_AT < K.BUCKET_START + INTERVAL '1 hour'
+        AND R.TEMPERATURE IS NOT NULL
+        AND R.HUMIDITY IS NOT NULL
+    GROUP BY
+        K.DEVICE_ID,
+        K.BUCKET_START
+    ON CONFLICT (device_id, bucket_start) DO UPDATE SET
+        temperature_min = EXCLUDED.temperature_min,
+        temperature_max = EXCLUDED.temperature_max,
+        temperature_sum = EXCLUDED.temperature_sum,
+        temperature_count = EXCLUDED.temperature_count,
+        humidity_min = EXCLUDED.humidity_min,
+        humidity_max = EXCLUDED.humidity_max,
+        humidity_sum = EXCLUDED.humidity_sum,
+        humidity_count = EXCLUDED.humidity_count
+"""
+)
+
+
+DAILY_ROLLUP_STMT = text(
+    """
+    INSERT INTO
+        READINGS_DAILY (
+            device_id, bucket_start,
+            temperature_min, temperature_max, temperature_sum, temperature_count,
+            humidity_min, humidity_max, humidity_sum, humidity_count
+        )
+    SELECT
+        K.DEVICE_ID,
+        K.BUCKET_START,
+        MIN(H.TEMPERATURE_MIN),
+        MAX(H.TEMPERATURE_MAX),
+        SUM(H.TEMPERATURE_SUM),
+        COALESCE(SUM(H.TEMPERATURE_COUNT), 0),
+        MIN(H.HUMIDITY_MIN),
+        MAX(H.HUMIDITY_MAX),
+        SUM(H.HUMIDITY_SUM),
+        COALESCE(SUM(H.HUMIDITY_COUNT), 0)
+    FROM
+        UNNEST(CAST(:device_id AS UUID[]), CAST(:bucket_start AS TIMESTAMP[])) AS K(DEVICE_ID, BUCKET_START)
+    LEFT JOIN READINGS_HOURLY H
+        ON H.DEVICE_ID = K.DEVICE_ID
+        AND H.BUCKET_START >= K.BUCKET_START
+        AND H.BUCKET_START < K.BUCKET_START + INTERVAL '1 day'
+    GROUP BY
+        K.DEVICE_ID,
+        K.BUCKET_START
+    ON CONFLICT (device_id, bucket_start) DO UPDATE SET
+        temperature_min = EXCLUDED.temperature_min,
+        temperature_max = EXCLUDED.temperature_max,
+        temperature_sum = EXCLUDED.temperature_sum,
+        temperature_count = EXCLUDED.temperature_count,
+        humidity_min = EXCLUDED.humidity_min,
+        humidity_max = EXCLUDED.humidity_max,
+        humidity_sum = EXCLUDED.humidity_sum,
+        humidity_count = EXCLUDED.humidity_count
+"""
+)
+
+
+async def update_reading_rollups(db: AsyncSession, records: list[tuple]) -> None:
     """
-    Create motion data.
+    Re-aggregate the READINGS_HOURLY and READINGS_DAILY buckets touched by reading records.
+
+    Only the touched buckets are recomputed, from READINGS for hours and from READINGS_HOURLY for days,
+    so late and duplicated readings leave the rollups exact.
+    Must run after upsert_latest_readings in the same transaction: the LATEST_READINGS row locks it holds make
+    concurrent batches of the same device wait for this one to commit, so they re-aggregate with its readings.
 
     Args:
         db (AsyncSession): AsyncSession
-        motion_data_list (list[dict]): List of motion table parameters
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
     """
-    stmt = text(
-        """
-        INSERT INTO
-            MOTION (motion, created_at, device_id)
-        VALUES
-            (:motion, :created_at, :device_id)
+    hours, days = reading_rollup_buckets(records)
+    for stmt, buckets in ((HOURLY_ROLLUP_STMT, hours), (DAILY_ROLLUP_STMT, days)):
+        device_ids, bucket_starts = zip(*buckets)
+        await db.execute(stmt, params={"device_id": list(device_ids), "bucket_start": list(bucket_starts)})
+
+
+UNNEST_READINGS_STMT = text(
     """
-    )
-    await db.execute(stmt, params=motion_data_list)
+    INSERT INTO
+        READINGS (device_id, created_at, temperature, humidity, motion, is_alarm, device_listening)
+    SELECT
+        *
+    FROM
+        UNNEST(
+            CAST(:device_id AS UUID[]),
+            CAST(:created_at AS TIMESTAMP[]),
+            CAST(:temperature AS FLOAT[]),
+            CAST(:humidity AS FLOAT[]),
+            CAST(:motion AS BOOLEAN[]),
+            CAST(:is_alarm AS BOOLEAN[]),
+            CAST(:device_listening AS BOOLEAN[])
+        )
+    ON CONFLICT (device_id, created_at) DO NOTHING
+"""
+)
+
+
+async def _unnest_readings(db: AsyncSession, records: list[tuple]) -> None:
+    """
+    Create readings with one INSERT of column arrays.
+    Readings that already exist for the same device and timestamp are skipped.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
+    """
+    columns = [list(column) for column in zip(*records)]
+    await db.execute(UNNEST_READINGS_STMT, params=dict(zip(READING_COLUMNS, columns)))
 
 
-async def _create_alarm(db: AsyncSession, alarm_data_list: list[dict]) -> None:
+async def _insert_readings(db: AsyncSession, records: list[tuple]) -> None:
     """
-    Create alarm data.
+    Create readings with executemany INSERT.
+    Readings that already exist for the same device and timestamp are skipped.
 
     Args:
         db (AsyncSession): AsyncSession
-        alarm_data_list (list[dict]): List of alarm table parameters
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
     """
     stmt = text(
         """
         INSERT INTO
-            ALARM (is_alarm, created_at, device_id)
+            READINGS (device_id, created_at, temperature, humidity, motion, is_alarm, device_listening)
         VALUES
-            (:is_alarm, :created_at, :device_id)
+            (:device_id, :created_at, :temperature, :humidity, :motion, :is_alarm, :device_listening)
+        ON CONFLICT (device_id, created_at) DO NOTHING
     """
     )
-    await db.execute(stmt, params=alarm_data_list)
+    await db.execute(stmt, params=[dict(zip(READING_COLUMNS, record)) for record in records])
 
 
-async def _create_button(db: AsyncSession, button_data_list: list[dict]) -> None:
+async def _copy_readings(db: AsyncSession, records: list[tuple]) -> None:
     """
-    Create button data.
+    Create readings with binary COPY.
+
+    COPY cannot skip conflicting rows, so records are copied into a temporary staging table first
+    and moved to READINGS with INSERT ... ON CONFLICT DO NOTHING.
 
     Args:
         db (AsyncSession): AsyncSession
-        button_data_list (list[dict]): List of button table parameters
+        records (list[tuple]): Reading records in the order of READING_COLUMNS.
+
+    Raises:
+        CopyNotSupportedError: The session is not backed by asyncpg.
     """
-    stmt = text(
+    raw_connection = await _get_raw_connection(db)
+    connection = _get_asyncpg_connection(raw_connection)
+
+    # The staging table lives as long as the pooled connection, so it is created once per connection.
+    # A rolled back transaction also drops it, so the flag is cleared by forget_readings_staging on rollback,
+    # and on any error here, and the table is created again next time.
+    try:
+        if not raw_connection.info.get("readings_staging"):
+            await connection.execute(
+                """
+                CREATE TEMPORARY TABLE IF NOT EXISTS READINGS_STAGING
+                    (LIKE READINGS INCLUDING DEFAULTS)
+                ON COMMIT DELETE ROWS
+            """
+            )
+            raw_connection.info["readings_staging"] = True
+
+        await connection.copy_records_to_table("readings_staging", records=records, columns=READING_COLUMNS)
+        # Without arguments asyncpg uses the simple query protocol, so both statements are sent in one round-trip.
+        await connection.execute(
+            """
+            INSERT INTO
+                READINGS (device_id, created_at, temperature, humidity, motion, is_alarm, device_listening)
+            SELECT
+                device_id, created_at, temperature, humidity, motion, is_alarm, device_listening
+            FROM
+                READINGS_STAGING
+            ON CONFLICT (device_id, created_at) DO NOTHING;
+
+            TRUNCATE READINGS_STAGING;
         """
-        INSERT INTO
-            BUTTON (device_listening, created_at, device_id)
-        VALUES
-            (:device_listening, :created_at, :device_id)
+        )
+    except Exception:
+        raw_connection.info.pop("readings_staging", None)
+        raise
+
+
+@event.listens_for(Engine, "rollback")
+@event.listens_for(Engine, "rollback_savepoint")
+def forget_readings_staging(conn: Connection, *args) -> None:
     """
-    )
-    await db.execute(stmt, params=button_data_list)
+    Clear the flag of the staging table of _copy_readings when a transaction, which may have created it, is rolled back.
+
+    Args:
+        conn (Connection): Connection rolled back.
+    """
+    if not conn.invalidated:
+        conn.info.pop("readings_staging", None)
+
+
+async def _get_raw_connection(db: AsyncSession) -> _ConnectionFairy:
+    """
+    Get the pooled DBAPI connection underneath the session.
+
+    The connection is checked out from the session, so statements on it run inside the session transaction.
+
+    Args:
+        db (AsyncSession): AsyncSession
+
+    Returns:
+        _ConnectionFairy: Pooled DBAPI connection.
+    """
+    connection = await db.connection()
+    return await connection.get_raw_connection()
+
+
+def _get_asyncpg_connection(raw_connection: _ConnectionFairy) -> asyncpg.Connection:
+    """
+    Get the asyncpg connection of a pooled DBAPI connection.
+
+    Args:
+        raw_connection (_ConnectionFairy): Pooled DBAPI connection.
+
+    Raises:
+        CopyNotSupportedError: The connection is not an asyncpg connection.
+
+    Returns:
+        asyncpg.Connection: Raw asyncpg connection.
+    """
+    driver_connection = raw_connection.driver_connection
+    if not isinstance(driver_connection, asyncpg.Connection):
+        raise CopyNotSupportedError(f"COPY requires asyncpg, got {type(driver_connection).__name__}")
+    return driver_connection
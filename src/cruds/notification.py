@@ -1,9 +1,11 @@
-from typing import List
+from datetime import datetime
+from typing import List, Tuple
 
+from sqlalchemy import Boolean, DateTime, Integer, String
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
-
-import src.schemas.notification as notification_schema
+from sqlalchemy.sql import text
+from sqlalchemy.sql.selectable import TextualSelect
 
 
 async def notification_belongs_to_user(db: AsyncSession, notification_id: int, user_id: int) -> bool:
@@ -56,49 +58,108 @@ async def update_notification(db: AsyncSession, notification_id: int) -> None:
     await db.execute(stmt, params={"notification_id": notification_id})
 
 
-async def find_device_notification_by_user_id(db: AsyncSession, user_id: int) -> List[notification_schema.DeviceNotificationData]:
+def _notification_page_stmt(keyset_condition: str) -> TextualSelect:
     """
-    Find device notification data by user id.
+    Build the statement of a page of notifications.
 
     Args:
-        db (AsyncSession): AsyncSession.
-        user_id (int): User id.
+        keyset_condition (str): Condition on (CREATED_AT, ID) for pages after the first, or "".
 
     Returns:
-        [notification_schema.DeviceNotificationData]: List of device notification data.
+        TextualSelect: Statement with typed result columns.
     """
-    stmt = """
+    return text(
+        f"""
         SELECT
-            ID,
-            CONTENT_TYPE,
-            CONTENT,
-            IS_READ,
-            TO_CHAR(CREATED_AT, 'YYYY/MM/DD') AS DATE
-        FROM NOTIFICATIONS
+            N.ID,
+            N.CONTENT_TYPE,
+            N.CONTENT,
+            N.IS_READ,
+            TO_CHAR(N.CREATED_AT, 'YYYY/MM/DD') AS DATE,
+            N.CREATED_AT
+        FROM DEVICES D
+        CROSS JOIN LATERAL (
+            SELECT
+                *
+            FROM NOTIFICATIONS A
+            WHERE
+                A.DEVICE_ID = D.ID
+                {keyset_condition}
+            ORDER BY A.CREATED_AT DESC, A.ID DESC
+            LIMIT :limit
+        ) N
         WHERE
-            DEVICE_ID IN (
-                SELECT
-                    ID
-                FROM DEVICES
-                WHERE
-                    USER_ID = :user_id
-            )
-        ORDER BY DATE DESC
+            D.USER_ID = :user_id
+        ORDER BY N.CREATED_AT DESC, N.ID DESC
+        LIMIT :limit
+    """
+    ).columns(id=Integer, content_type=String, content=String, is_read=Boolean, date=String, created_at=DateTime)
+
+
+# The keyset condition is only in the statement of later pages, so that it is always usable as an index condition.
+NOTIFICATION_FIRST_PAGE_STMT = _notification_page_stmt("")
+NOTIFICATION_NEXT_PAGE_STMT = _notification_page_stmt("AND (A.CREATED_AT, A.ID) < (:created_at, :id)")
+
+
+async def find_device_notification_by_user_id(
+    db: AsyncSession, user_id: int, limit: int, cursor: Tuple[datetime, int] | None = None
+) -> Tuple[List[dict], Tuple[datetime, int] | None]:
     """
+    Find device notification data by user id, newest first, one page at a time.
+
+    Pages are found with keyset pagination on (CREATED_AT, ID) of each device,
+    so that every page costs the same however many notifications the user has.
+    Notifications are returned as plain dicts in the shape of src.schemas.notification.DeviceNotificationData, ready to be serialized.
 
-    result: Result = await db.execute(stmt, params={"user_id": user_id})
+    Args:
+        db (AsyncSession): AsyncSession.
+        user_id (int): User id.
+        limit (int): Page size.
+        cursor (Tuple[datetime, int] | None): (created_at, id) of the last notification of the previous page.
+
+    Returns:
+        ([dict], (datetime, int) | None): Page of device notification data,
+            and (created_at, id) of its last notification if there is a next page.
+    """
+    if cursor is None:
+        result: Result = await db.execute(NOTIFICATION_FIRST_PAGE_STMT, params={"user_id": user_id, "limit": limit + 1})
+    else:
+        params = {"user_id": user_id, "created_at": cursor[0], "id": cursor[1], "limit": limit + 1}
+        result = await db.execute(NOTIFICATION_NEXT_PAGE_STMT, params=params)
     rows = result.all()
 
-    result = []
-    for row in rows:
-        result.append(
-            notification_schema.DeviceNotificationData(
-                id=row[0],
-                content_type=row[1],
-                content=row[2],
-                is_read=row[3],
-                date=row[4],
-            )
+    notifications = [
+        {"id": row.id, "content_type": row.content_type, "content": row.content, "is_read": row.is_read, "date": row.date} for row in rows[:limit]
+    ]
+    next_cursor = (rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None
+    return notifications, next_cursor
+
+
+CREATE_NOTIFICATIONS_STMT = text(
+    """
+    INSERT INTO
+        NOTIFICATIONS (device_id, content_type, content, created_at, is_read)
+    SELECT
+        *,
+        FALSE
+    FROM
+        UNNEST(
+            CAST(:device_id AS UUID[]),
+            CAST(:content_type AS VARCHAR[]),
+            CAST(:content AS VARCHAR[]),
+            CAST(:created_at AS TIMESTAMP[])
         )
+"""
+)
 
-    return result
+
+async def create_notifications(db: AsyncSession, notifications: List[Tuple[str, str, str, datetime]]) -> None:
+    """
+    Create unread notifications with one INSERT of column arrays.
+
+    Args:
+        db (AsyncSession): AsyncSession.
+        notifications (List[Tuple[str, str, str, datetime]]): (device_id, content_type, content, created_at) of each notification.
+    """
+    columns = [list(column) for column in zip(*notifications)]
+    await db.execute(CREATE_NOTIFICATIONS_STMT, params=dict(zip(["device_id", "content_type", "content", "created_at"], columns)))
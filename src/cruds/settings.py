@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text
 
 import src.schemas.settings as settings_schema
-from src.auth.utils import create_hash_password
+from src.auth.utils import create_hash_password_async
 
 
 async def find_user_settings_by_user_id(db: AsyncSession, user_id: int) -> settings_schema.UserSettings:
@@ -195,7 +195,7 @@ async def update_user_settings(db: AsyncSession, user: settings_schema.UpdateUse
             "last_name": user.last_name,
             "email": user.email,
             "phone_number": user.phone_number,
-            "password": user.new_password if user.new_password is None else create_hash_password(user.new_password),
+            "password": user.new_password if user.new_password is None else await create_hash_password_async(user.new_password),
             "user_id": user_id,
         },
     )
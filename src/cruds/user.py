@@ -1,12 +1,26 @@
 from datetime import datetime
 from typing import List, Tuple
 
+from sqlalchemy import Boolean, Float, Integer, String
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text
+from sqlalchemy_utils import UUIDType
 
 import src.schemas.user as user_schema
-from src.auth.utils import create_hash_password
+from src.auth.utils import create_hash_password_async
+
+# Runs on every authenticated request, see src.routers.auth.get_current_user
+COUNT_USER_BY_USER_ID_STMT = text(
+    """
+    SELECT
+        COUNT(*) AS CNT
+    FROM
+        USERS A
+    WHERE
+        A.ID = :user_id
+    """
+)
 
 
 async def count_user_by_user_id(db: AsyncSession, user_id: int) -> int:
@@ -20,17 +34,7 @@ async def count_user_by_user_id(db: AsyncSession, user_id: int) -> int:
     Returns:
         int: Count result.
     """
-    stmt = text(
-        """
-        SELECT
-            COUNT(*) AS CNT
-        FROM
-            USERS A
-        WHERE
-            A.ID = :user_id
-        """
-    )
-    count_result: Result = await db.execute(stmt, params={"user_id": user_id})
+    count_result: Result = await db.execute(COUNT_USER_BY_USER_ID_STMT, params={"user_id": user_id})
     return count_result.one()[0]
 
 
@@ -114,7 +118,7 @@ async def create_user(db: AsyncSession, user: user_schema.UserCreate) -> int:
             "last_name": user.last_name,
             "email": user.email,
             "phone_number": user.phone_number,
-            "password": create_hash_password(user.password),
+            "password": await create_hash_password_async(user.password),
             "created_at": datetime.now(),
             "updated_at": datetime.now(),
         },
@@ -152,3 +156,66 @@ async def find_device_id_by_user_id(db: AsyncSession, user_id: int) -> List[user
         result.append(user_schema.UserDevice(device_id=row[0]))
 
     return result
+
+
+# Built once, see src.cruds.device.LATEST_DEVICE_DATA_STMT
+DASHBOARD_DEVICES_STMT = text(
+    """
+    SELECT
+        A.ID,
+        A.DEVICE_NAME,
+        A.LATITUDE,
+        A.LONGITUDE,
+        A.TEMP_UPPER_LIMIT,
+        A.TEMP_LOWER_LIMIT,
+        L.TEMPERATURE,
+        L.HUMIDITY,
+        L.IS_ALARM,
+        N.UNREAD
+    FROM
+        DEVICES A
+    LEFT JOIN LATEST_READINGS L
+        ON L.DEVICE_ID = A.ID
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) AS UNREAD
+        FROM
+            NOTIFICATIONS B
+        WHERE
+            B.DEVICE_ID = A.ID
+            AND B.IS_READ = FALSE
+    ) N
+    WHERE
+        A.USER_ID = :user_id
+    ORDER BY
+        A.CREATED_AT,
+        A.ID
+    """
+).columns(
+    id=UUIDType(binary=False),
+    device_name=String,
+    latitude=Float,
+    longitude=Float,
+    temp_upper_limit=Float,
+    temp_lower_limit=Float,
+    temperature=Float,
+    humidity=Float,
+    is_alarm=Boolean,
+    unread=Integer,
+)
+
+
+async def find_dashboard_devices_by_user_id(db: AsyncSession, user_id: int) -> List[Tuple]:
+    """
+    Find the devices owned by user with their latest readings, limits and unread notification count, in one query.
+
+    Args:
+        db (AsyncSession): AsyncSession.
+        user_id (int): User id.
+
+    Returns:
+        List[Tuple]: (id, device_name, latitude, longitude, temp_upper_limit, temp_lower_limit,
+            temperature, humidity, is_alarm, unread_notifications) per device.
+    """
+    execute_result: Result = await db.execute(DASHBOARD_DEVICES_STMT, params={"user_id": user_id})
+    return execute_result.all()
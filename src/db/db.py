@@ -1,10 +1,42 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from src.constants.common import ASYNC_DATABASE_URL
+from src.constants.common import (
+    ASYNC_DATABASE_URL,
+    INGESTION_POOL_SIZE,
+    READ_REPLICA_CONNECT_TIMEOUT_SECONDS,
+    READ_REPLICA_DATABASE_URL,
+    READ_REPLICA_RETRY_SECONDS,
+)
 
 async_engine = create_async_engine(ASYNC_DATABASE_URL)
 async_session = sessionmaker(autocommit=False, autoflush=False, bind=async_engine, class_=AsyncSession)
+
+# Ingestion writes use their own pool, so they can never take the connections of user-facing reads.
+ingestion_engine = create_async_engine(ASYNC_DATABASE_URL, pool_size=INGESTION_POOL_SIZE, max_overflow=0)
+ingestion_session = sessionmaker(autocommit=False, autoflush=False, bind=ingestion_engine, class_=AsyncSession)
+
+# Read-only sessions run in READ ONLY transactions. Without a replica they share the pool of async_engine.
+primary_read_engine = async_engine.execution_options(postgresql_readonly=True)
+primary_read_session = sessionmaker(autocommit=False, autoflush=False, bind=primary_read_engine, class_=AsyncSession)
+if READ_REPLICA_DATABASE_URL:
+    read_engine = create_async_engine(
+        READ_REPLICA_DATABASE_URL,
+        connect_args={"timeout": READ_REPLICA_CONNECT_TIMEOUT_SECONDS},
+        execution_options={"postgresql_readonly": True},
+    )
+    read_session = sessionmaker(autocommit=False, autoflush=False, bind=read_engine, class_=AsyncSession)
+else:
+    read_engine = primary_read_engine
+    read_session = primary_read_session
+# time.monotonic() until which reads skip the unreachable replica
+replica_unavailable_until = 0.0
 Base = declarative_base()
 
 
@@ -16,3 +48,48 @@ async def get_db() -> sessionmaker:
             await session.rollback()
         else:
             await session.commit()
+
+
+async def open_read_session() -> AsyncSession:
+    """
+    Open a read-only session on the replica, or on the primary if there is no replica or it cannot be reached.
+
+    The connection is checked out here, so that a replica that is down is found before the request uses the session.
+
+    Returns:
+        AsyncSession: Session in a READ ONLY transaction.
+    """
+    global replica_unavailable_until
+    if read_session is not primary_read_session and time.monotonic() >= replica_unavailable_until:
+        session = read_session()
+        try:
+            await session.connection()
+            return session
+        except (OSError, asyncio.TimeoutError, DBAPIError) as e:
+            await session.close()
+            replica_unavailable_until = time.monotonic() + READ_REPLICA_RETRY_SECONDS
+            # TODO Replace with logger
+            print(f"Read replica unavailable, reading from primary for {READ_REPLICA_RETRY_SECONDS} seconds: {e!r}")
+    return primary_read_session()
+
+
+@asynccontextmanager
+async def read_db() -> AsyncIterator[AsyncSession]:
+    """
+    Read-only session for the duration of the context, see open_read_session.
+    Routes that call external services after reading use it to return the connection to the pool first.
+    """
+    session = await open_read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_read_db() -> sessionmaker:
+    """
+    Session dependency of routes that only read. The transaction is rolled back instead of committed.
+    Reads on a replica may lag behind writes on the primary.
+    """
+    async with read_db() as session:
+        yield session
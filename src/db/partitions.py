@@ -0,0 +1,188 @@
+import asyncio
+import re
+from datetime import date, datetime
+from typing import List
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import text
+
+from src.constants.common import READINGS_PARTITION_MONTHS_AHEAD
+
+PARENT_TABLE = "readings"
+DEFAULT_PARTITION = "readings_default"
+RE_PARTITION_NAME = r"^readings_y([0-9]{4})m([0-9]{2})$"
+
+
+def add_months(month: date, n: int) -> date:
+    """
+    Add months to the first day of a month.
+
+    Args:
+        month (date): First day of a month.
+        n (int): Number of months. Can be negative.
+
+    Returns:
+        date: First day of the month.
+    """
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_of(d: date | datetime) -> date:
+    """
+    Get the first day of the month of a date.
+
+    Args:
+        d (date | datetime): Date.
+
+    Returns:
+        date: First day of the month.
+    """
+    return date(d.year, d.month, 1)
+
+
+def partition_name(month: date) -> str:
+    """
+    Get the partition name of a month.
+
+    Args:
+        month (date): First day of a month.
+
+    Returns:
+        str: Partition name, e.g. readings_y2022m07.
+    """
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def list_partition_months(conn: Connection) -> List[date]:
+    """
+    List the months of attached monthly partitions.
+
+    Args:
+        conn (Connection): Connection.
+
+    Returns:
+        List[date]: First days of the months, in ascending order.
+    """
+    stmt = text(
+        """
+        SELECT
+            C.RELNAME
+        FROM
+            PG_INHERITS I
+        INNER JOIN PG_CLASS C
+            ON C.OID = I.INHRELID
+        WHERE
+            I.INHPARENT = CAST(:parent AS REGCLASS)
+        """
+    )
+    months = []
+    for row in conn.execute(stmt, {"parent": PARENT_TABLE}):
+        match = re.fullmatch(RE_PARTITION_NAME, row[0])
+        if match is not None:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def create_default_partition(conn: Connection) -> None:
+    """
+    Create the default partition, which holds readings outside of every monthly partition.
+
+    Args:
+        conn (Connection): Connection.
+    """
+    conn.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"))
+
+
+def create_partition(conn: Connection, month: date) -> None:
+    """
+    Create the partition of a month.
+
+    Readings of the month already in the default partition are moved into the new partition.
+
+    Args:
+        conn (Connection): Connection.
+        month (date): First day of the month.
+    """
+    name = partition_name(month)
+    params = {"start": month, "end": add_months(month, 1)}
+    in_default = conn.execute(
+        text(
+            f"""
+            SELECT
+                EXISTS (
+                    SELECT 1 FROM {DEFAULT_PARTITION} WHERE CREATED_AT >= :start AND CREATED_AT < :end
+                )
+            """
+        ),
+        params,
+    ).scalar()
+
+    if not in_default:
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} FOR VALUES FROM ('{month}') TO ('{params['end']}')"))
+        return
+
+    # A partition cannot be created while the default partition holds rows of its range.
+    conn.execute(text(f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    conn.execute(
+        text(
+            f"""
+            WITH MOVED AS (
+                DELETE FROM {DEFAULT_PARTITION} WHERE CREATED_AT >= :start AND CREATED_AT < :end RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM MOVED
+            """
+        ),
+        params,
+    )
+    conn.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{month}') TO ('{params['end']}')"))
+
+
+def create_partitions(conn: Connection, start: date | datetime, end: date | datetime) -> None:
+    """
+    Create the default partition and the missing monthly partitions from `start` to `end`, both months included.
+
+    Args:
+        conn (Connection): Connection.
+        start (date | datetime): Start date.
+        end (date | datetime): End date.
+    """
+    create_default_partition(conn)
+    existing = set(list_partition_months(conn))
+    month = month_of(start)
+    while month <= month_of(end):
+        if month not in existing:
+            create_partition(conn, month)
+        month = add_months(month, 1)
+
+
+def maintain_partitions(conn: Connection) -> None:
+    """
+    Pre-create partitions for the next READINGS_PARTITION_MONTHS_AHEAD months.
+
+    Expired partitions are dropped by src.db.retention only, after their readings are compacted into rollups.
+
+    Args:
+        conn (Connection): Connection.
+    """
+    this_month = month_of(date.today())
+    create_partitions(conn, this_month, add_months(this_month, READINGS_PARTITION_MONTHS_AHEAD))
+
+
+async def run_partition_maintenance(engine: AsyncEngine, interval: float) -> None:
+    """
+    Run maintain_partitions every `interval` seconds.
+
+    Args:
+        engine (AsyncEngine): AsyncEngine.
+        interval (float): Interval in seconds.
+    """
+    while True:
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(maintain_partitions)
+        except Exception as e:
+            # TODO Replace with logger
+            print(f"Partition maintenance failed: {e}")
+        await asyncio.sleep(interval)
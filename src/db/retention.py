@@ -0,0 +1,236 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict
+
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import text
+
+from src.db.partitions import PARENT_TABLE, add_months, list_partition_months, partition_name
+
+ROLLUP_COLUMNS = [
+    "temperature_min",
+    "temperature_max",
+    "temperature_sum",
+    "temperature_count",
+    "humidity_min",
+    "humidity_max",
+    "humidity_sum",
+    "humidity_count",
+]
+ROLLUP_UPDATE = ", ".join(f"{column} = EXCLUDED.{column}" for column in ROLLUP_COLUMNS)
+
+
+def compact_readings(conn: Connection, table: str = PARENT_TABLE, start: datetime | None = None, end: datetime | None = None) -> None:
+    """
+    Aggregate readings into READINGS_HOURLY, then the touched days of READINGS_HOURLY into READINGS_DAILY.
+
+    Buckets are replaced, not added to, so `start` and `end` must be on hour boundaries and
+    every reading of the range must still be in `table`.
+
+    Args:
+        conn (Connection): Connection.
+        table (str): READINGS or one of its partitions.
+        start (datetime | None): Start of the range, inclusive. Defaults to the first reading.
+        end (datetime | None): End of the range, exclusive. Defaults to after the last reading.
+    """
+    hourly_stmt = text(
+        f"""
+        INSERT INTO
+            READINGS_HOURLY (device_id, bucket_start, {", ".join(ROLLUP_COLUMNS)})
+        SELECT
+            DEVICE_ID,
+            DATE_TRUNC('hour', CREATED_AT),
+            MIN(TEMPERATURE),
+            MAX(TEMPERATURE),
+            SUM(TEMPERATURE),
+            COUNT(TEMPERATURE),
+            MIN(HUMIDITY),
+            MAX(HUMIDITY),
+            SUM(HUMIDITY),
+            COUNT(HUMIDITY)
+        FROM
+            {table}
+        WHERE
+            TEMPERATURE IS NOT NULL
+            AND HUMIDITY IS NOT NULL
+            AND (CAST(:start AS TIMESTAMP) IS NULL OR CREATED_AT >= :start)
+            AND (CAST(:end AS TIMESTAMP) IS NULL OR CREATED_AT < :end)
+        GROUP BY
+            DEVICE_ID,
+            DATE_TRUNC('hour', CREATED_AT)
+        ON CONFLICT (device_id, bucket_start) DO UPDATE SET {ROLLUP_UPDATE}
+        """
+    )
+    daily_stmt = text(
+        f"""
+        INSERT INTO
+            READINGS_DAILY (device_id, bucket_start, {", ".join(ROLLUP_COLUMNS)})
+        SELECT
+            DEVICE_ID,
+            DATE_TRUNC('day', BUCKET_START),
+            MIN(TEMPERATURE_MIN),
+            MAX(TEMPERATURE_MAX),
+            SUM(TEMPERATURE_SUM),
+            SUM(TEMPERATURE_COUNT),
+            MIN(HUMIDITY_MIN),
+            MAX(HUMIDITY_MAX),
+            SUM(HUMIDITY_SUM),
+            SUM(HUMIDITY_COUNT)
+        FROM
+            READINGS_HOURLY
+        WHERE
+            (CAST(:start AS TIMESTAMP) IS NULL OR BUCKET_START >= DATE_TRUNC('day', CAST(:start AS TIMESTAMP)))
+            AND (CAST(:end AS TIMESTAMP) IS NULL OR BUCKET_START < DATE_TRUNC('day', CAST(:end AS TIMESTAMP) - INTERVAL '1 microsecond') + INTERVAL '1 day')
+        GROUP BY
+            DEVICE_ID,
+            DATE_TRUNC('day', BUCKET_START)
+        ON CONFLICT (device_id, bucket_start) DO UPDATE SET {ROLLUP_UPDATE}
+        """
+    )
+    params = {"start": start, "end": end}
+    conn.execute(hourly_stmt, params)
+    conn.execute(daily_stmt, params)
+
+
+def is_partitioned(conn: Connection) -> bool:
+    """
+    Check whether READINGS is partitioned.
+
+    Args:
+        conn (Connection): Connection.
+
+    Returns:
+        bool: True if READINGS is partitioned.
+    """
+    stmt = text("SELECT EXISTS (SELECT 1 FROM PG_PARTITIONED_TABLE WHERE PARTRELID = CAST(:parent AS REGCLASS))")
+    return conn.execute(stmt, {"parent": PARENT_TABLE}).scalar()
+
+
+def drop_expired_partitions(conn: Connection, cutoff: datetime, report: Dict[str, int]) -> None:
+    """
+    Compact, detach and drop the monthly partitions that end before `cutoff`, one transaction each.
+
+    Args:
+        conn (Connection): Connection without an open transaction.
+        cutoff (datetime): Readings before this are expired.
+        report (Dict[str, int]): Report updated with the dropped partitions, rows and bytes.
+    """
+    with conn.begin():
+        months = list_partition_months(conn)
+
+    for month in months:
+        if datetime.combine(add_months(month, 1), datetime.min.time()) > cutoff:
+            break
+        name = partition_name(month)
+        with conn.begin():
+            compact_readings(conn, name)
+            rows = conn.execute(text(f"SELECT COUNT(*) FROM {name}")).scalar()
+            size = conn.execute(text("SELECT PG_TOTAL_RELATION_SIZE(CAST(:name AS REGCLASS))"), {"name": name}).scalar()
+            conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            conn.execute(text(f"DROP TABLE {name}"))
+        report["dropped_partitions"] += 1
+        report["dropped_rows"] += rows
+        report["dropped_bytes"] += size
+
+
+def delete_expired_readings(conn: Connection, cutoff: datetime, batch_size: int, report: Dict[str, int]) -> None:
+    """
+    Compact and delete readings before `cutoff`, one day at a time, in batches of `batch_size` rows.
+
+    Each day is compacted in one transaction while all its readings are still there,
+    then deleted in short transactions so that no lock is held for long.
+
+    Args:
+        conn (Connection): Connection without an open transaction.
+        cutoff (datetime): Readings before this are expired. Must be on an hour boundary.
+        batch_size (int): Number of readings deleted per transaction.
+        report (Dict[str, int]): Report updated with the deleted rows and bytes.
+    """
+    delete_stmt = text(
+        f"""
+        WITH DELETED AS (
+            DELETE FROM
+                {PARENT_TABLE} R
+            USING (
+                SELECT DEVICE_ID, CREATED_AT FROM {PARENT_TABLE}
+                WHERE CREATED_AT >= :start AND CREATED_AT < :end
+                LIMIT :batch_size
+            ) B
+            WHERE
+                R.DEVICE_ID = B.DEVICE_ID
+                AND R.CREATED_AT = B.CREATED_AT
+            RETURNING PG_COLUMN_SIZE(R.*) AS SIZE
+        )
+        SELECT COUNT(*), COALESCE(SUM(SIZE), 0) FROM DELETED
+        """
+    )
+    while True:
+        with conn.begin():
+            oldest = conn.execute(text(f"SELECT MIN(CREATED_AT) FROM {PARENT_TABLE} WHERE CREATED_AT < :cutoff"), {"cutoff": cutoff}).scalar()
+        if oldest is None:
+            return
+
+        start = oldest.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = min(start + timedelta(days=1), cutoff)
+        with conn.begin():
+            compact_readings(conn, PARENT_TABLE, start, end)
+
+        while True:
+            with conn.begin():
+                rows, size = conn.execute(delete_stmt, {"start": start, "end": end, "batch_size": batch_size}).one()
+            report["deleted_rows"] += rows
+            report["deleted_bytes"] += size
+            if rows < batch_size:
+                break
+
+
+def apply_retention(conn: Connection, retention_days: int, batch_size: int) -> Dict[str, int]:
+    """
+    Compact readings older than `retention_days` into READINGS_HOURLY/READINGS_DAILY and remove them from READINGS.
+
+    Monthly partitions that are entirely expired are dropped, remaining expired readings
+    (in the partition containing the cutoff, the default partition, or an unpartitioned READINGS) are deleted in batches.
+    Deleted bytes are the size of the deleted rows, which becomes reusable once the table is vacuumed.
+
+    Args:
+        conn (Connection): Connection without an open transaction.
+        retention_days (int): Days of raw readings to keep.
+        batch_size (int): Number of readings deleted per transaction.
+
+    Returns:
+        Dict[str, int]: Cutoff, dropped partitions, rows and bytes, and deleted rows and bytes.
+    """
+    with conn.begin():
+        # One hour earlier than the window, so that readings still accepted by ingestion never fall into a compacted hour.
+        stmt = text("SELECT DATE_TRUNC('hour', LOCALTIMESTAMP - MAKE_INTERVAL(days => :days, hours => 1))")
+        cutoff = conn.execute(stmt, {"days": retention_days}).scalar()
+        partitioned = is_partitioned(conn)
+
+    report = {"dropped_partitions": 0, "dropped_rows": 0, "dropped_bytes": 0, "deleted_rows": 0, "deleted_bytes": 0}
+    if partitioned:
+        drop_expired_partitions(conn, cutoff, report)
+    delete_expired_readings(conn, cutoff, batch_size, report)
+    return {"cutoff": cutoff, **report}
+
+
+async def run_retention(engine: AsyncEngine, retention_days: int, batch_size: int, interval: float) -> None:
+    """
+    Run apply_retention every `interval` seconds.
+
+    Args:
+        engine (AsyncEngine): AsyncEngine.
+        retention_days (int): Days of raw readings to keep.
+        batch_size (int): Number of readings deleted per transaction.
+        interval (float): Interval in seconds.
+    """
+    while True:
+        try:
+            async with engine.connect() as conn:
+                report = await conn.run_sync(apply_retention, retention_days, batch_size)
+            # TODO Replace with logger
+            print(f"Retention: {report}")
+        except Exception as e:
+            # TODO Replace with logger
+            print(f"Retention failed: {e}")
+        await asyncio.sleep(interval)
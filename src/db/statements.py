@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import List, Tuple
+
+from sqlalchemy.sql.elements import TextClause
+
+from src.cruds import device as device_crud
+from src.cruds import notification as notification_crud
+from src.cruds import user as user_crud
+
+# Parameters that match no row, so that warming a connection only prepares and plans the statements.
+NIL_DEVICE_ID = "00000000-0000-0000-0000-000000000000"
+NIL_USER_ID = 0
+
+# Statements run by request handlers, with parameters of the types they are called with.
+# asyncpg prepared statements are cached per connection by their SQL, so executing each statement once
+# on a connection makes later requests on it skip the prepare round trip.
+HOT_STATEMENTS: List[Tuple[TextClause, dict]] = [
+    (user_crud.COUNT_USER_BY_USER_ID_STMT, {"user_id": NIL_USER_ID}),
+    (user_crud.DASHBOARD_DEVICES_STMT, {"user_id": NIL_USER_ID}),
+    (device_crud.LATEST_DEVICE_DATA_STMT, {"device_id": NIL_DEVICE_ID}),
+    (device_crud.HISTORICAL_DAY_STMT, {"device_id": NIL_DEVICE_ID}),
+    (device_crud.HISTORICAL_WEEK_STMT, {"device_id": NIL_DEVICE_ID}),
+    (device_crud.HISTORICAL_MONTH_STMT, {"device_id": NIL_DEVICE_ID}),
+    (device_crud.ALARM_FIRST_PAGE_STMT, {"device_id": NIL_DEVICE_ID, "limit": 1}),
+    (device_crud.ALARM_NEXT_PAGE_STMT, {"device_id": NIL_DEVICE_ID, "after": datetime.min, "limit": 1}),
+    (notification_crud.NOTIFICATION_FIRST_PAGE_STMT, {"user_id": NIL_USER_ID, "limit": 1}),
+    (notification_crud.NOTIFICATION_NEXT_PAGE_STMT, {"user_id": NIL_USER_ID, "created_at": datetime.min, "id": 0, "limit": 1}),
+]
+
+# Statements run by ingestion writes. Empty arrays insert nothing, and the transaction is rolled back anyway.
+INGESTION_STATEMENTS: List[Tuple[TextClause, dict]] = [
+    (device_crud.UNNEST_READINGS_STMT, {column: [] for column in device_crud.READING_COLUMNS}),
+    (
+        device_crud.UPSERT_LATEST_READINGS_STMT,
+        {column: [] for column in ("device_id", "temperature", "temperature_at", "humidity", "humidity_at", "is_alarm", "is_alarm_at")},
+    ),
+    (device_crud.HOURLY_ROLLUP_STMT, {"device_id": [], "bucket_start": []}),
+    (device_crud.DAILY_ROLLUP_STMT, {"device_id": [], "bucket_start": []}),
+    (device_crud.TEMPERATURE_LIMITS_STMT, {"device_ids": []}),
+    (notification_crud.CREATE_NOTIFICATIONS_STMT, {column: [] for column in ("device_id", "content_type", "content", "created_at")}),
+]
+
+# Statement timed on a cold and on a warm connection, the one behind /device-data/{device_id}/live
+PROBE_STATEMENT = HOT_STATEMENTS[2]
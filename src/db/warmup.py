@@ -0,0 +1,93 @@
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from typing import List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.sql.elements import TextClause
+
+from src.constants.common import INGESTION_POOL_SIZE, WARMUP_CONNECTIONS, WARMUP_TIMEOUT_SECONDS
+from src.db.db import ingestion_engine, read_engine
+from src.db.statements import HOT_STATEMENTS, INGESTION_STATEMENTS, PROBE_STATEMENT
+
+
+async def execute_and_rollback(conn: AsyncConnection, statements: List[Tuple[TextClause, dict]]) -> None:
+    """
+    Execute statements on a connection in a transaction that is rolled back.
+
+    Args:
+        conn (AsyncConnection): AsyncConnection.
+        statements (List[Tuple[TextClause, dict]]): Statements and their parameters.
+    """
+    async with conn.begin() as transaction:
+        for stmt, params in statements:
+            await conn.execute(stmt, params)
+        await transaction.rollback()
+
+
+async def warm_pool(engine: AsyncEngine, connections: int, statements: List[Tuple[TextClause, dict]]) -> int:
+    """
+    Open pooled connections at once and prepare statements on each of them.
+
+    All connections are checked out before any is returned, so that the pool opens new ones instead of
+    handing back an already warm connection.
+
+    Args:
+        engine (AsyncEngine): AsyncEngine.
+        connections (int): Number of connections, capped at the pool size since overflow connections are not kept.
+        statements (List[Tuple[TextClause, dict]]): Statements and their parameters.
+
+    Returns:
+        int: Number of connections warmed.
+    """
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(min(connections, engine.pool.size()))))
+        await asyncio.gather(*(execute_and_rollback(conn, statements) for conn in conns))
+    return len(conns)
+
+
+async def time_probe(engine: AsyncEngine) -> float:
+    """
+    Time PROBE_STATEMENT on a connection checked out from the pool, like a request would.
+
+    Args:
+        engine (AsyncEngine): AsyncEngine.
+
+    Returns:
+        float: Latency in milliseconds.
+    """
+    started = time.perf_counter()
+    async with engine.connect() as conn:
+        await execute_and_rollback(conn, [PROBE_STATEMENT])
+    return (time.perf_counter() - started) * 1000
+
+
+async def warm_up(connections: int = WARMUP_CONNECTIONS) -> None:
+    """
+    Pre-open pool connections of read_engine and ingestion_engine and prepare the hot statements on them.
+
+    Reports the warm-up time and the latency of the first request on a cold and on a warm connection.
+    A failed warm-up is reported and does not prevent startup, connections are then opened on demand.
+
+    Args:
+        connections (int): Number of connections of read_engine to warm. 0 disables the warm-up.
+    """
+    if connections <= 0:
+        return
+    try:
+        started = time.perf_counter()
+        cold_ms = await asyncio.wait_for(time_probe(read_engine), WARMUP_TIMEOUT_SECONDS)
+        warmed = await asyncio.wait_for(warm_pool(read_engine, connections, HOT_STATEMENTS), WARMUP_TIMEOUT_SECONDS)
+        ingestion_warmed = await asyncio.wait_for(warm_pool(ingestion_engine, INGESTION_POOL_SIZE, INGESTION_STATEMENTS), WARMUP_TIMEOUT_SECONDS)
+        warmup_ms = (time.perf_counter() - started) * 1000
+        warm_ms = await asyncio.wait_for(time_probe(read_engine), WARMUP_TIMEOUT_SECONDS)
+    except Exception as e:
+        # TODO Replace with logger
+        print(f"Connection pool warm-up failed: {e!r}")
+        return
+    # TODO Replace with logger
+    print(
+        f"Connection pool warm-up: {warmed} connections x {len(HOT_STATEMENTS)} statements, "
+        f"{ingestion_warmed} ingestion connections x {len(INGESTION_STATEMENTS)} statements in {warmup_ms:.1f} ms. "
+        f"First request latency: cold {cold_ms:.1f} ms, warm {warm_ms:.1f} ms"
+    )
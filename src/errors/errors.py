@@ -78,6 +78,63 @@ class FailedToSendCommandToDeviceError(APIError):
     detail = "Failed to send command to device"
 
 
+class IngestionBufferFullError(APIError):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Ingestion buffer is full"
+
+    def __init__(self, retry_after: int = 1) -> None:
+        super().__init__()
+        self.headers = {"Retry-After": str(retry_after)}
+
+
+class DeviceDataNotStoredError(APIError):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Device data could not be stored, retry the batch"
+
+
+class IngestionOverloadedError(APIError):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    detail = "Too many ingestion requests in flight"
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__()
+        self.headers = {"Retry-After": str(retry_after)}
+
+
+class DeviceDataDecodeError(APIError):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Could not decode device data"
+
+
+class UnsupportedMediaTypeError(APIError):
+    status_code = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    detail = "Content-Type must be `application/json` or `application/x-ondo-packed`"
+
+
+class InvalidHistoricalRangeError(APIError):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "`from` must be before `to`"
+
+
+class HistoricalRangeTooLargeError(APIError):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Range is too large for raw readings, use a coarser bucket"
+
+
+class InvalidCursorError(APIError):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Invalid cursor"
+
+
+class ExportFormatNotAvailableError(APIError):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Parquet export is not available, use `csv` or `ndjson`"
+
+
+class CopyNotSupportedError(Exception):
+    """Raised when the session cannot be used for binary COPY."""
+
+
 def error_response(error_types: List[Type[APIError]]) -> dict:
     """
     Convert error_types to OpenAPI format.
@@ -0,0 +1,214 @@
+import csv
+import io
+import json
+import time
+from datetime import datetime
+from typing import AsyncIterator, List, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.cruds.device as device_crud
+from src.constants.common import EXPORT_CHUNK_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Media type by export format
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def parquet_available() -> bool:
+    """
+    Check whether pyarrow, which parquet exports need, is installed.
+
+    Returns:
+        bool: True if parquet exports are available.
+    """
+    return pq is not None
+
+
+class CsvEncoder:
+    """
+    Encode chunks of rows of EXPORT_COLUMNS as CSV lines, after a header line.
+    """
+
+    def __init__(self) -> None:
+        self.header = True
+
+    def encode(self, rows: Sequence[Sequence]) -> bytes:
+        """
+        Encode rows.
+
+        Args:
+            rows (Sequence[Sequence]): Rows in the order of EXPORT_COLUMNS.
+
+        Returns:
+            bytes: CSV lines.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if self.header:
+            writer.writerow(device_crud.EXPORT_COLUMNS)
+            self.header = False
+        writer.writerows((row[0].isoformat(), *row[1:]) for row in rows)
+        return buffer.getvalue().encode()
+
+    def close(self) -> bytes:
+        """
+        End the file.
+
+        Returns:
+            bytes: The header line if there were no rows.
+        """
+        return self.encode([]) if self.header else b""
+
+
+class NdjsonEncoder:
+    """
+    Encode chunks of rows of EXPORT_COLUMNS as newline-delimited JSON objects.
+    """
+
+    def encode(self, rows: Sequence[Sequence]) -> bytes:
+        """
+        Encode rows.
+
+        Args:
+            rows (Sequence[Sequence]): Rows in the order of EXPORT_COLUMNS.
+
+        Returns:
+            bytes: One JSON object per line.
+        """
+        columns = device_crud.EXPORT_COLUMNS
+        return "".join(json.dumps(dict(zip(columns, (row[0].isoformat(), *row[1:])))) + "\n" for row in rows).encode()
+
+    def close(self) -> bytes:
+        """
+        End the file.
+
+        Returns:
+            bytes: Nothing, lines need no closing.
+        """
+        return b""
+
+
+class ChunkSink:
+    """
+    Write-only file that keeps what is written until it is drained, for streaming a parquet file chunk by chunk.
+    Unlike a reset io.BytesIO, tell() keeps counting from the start of the file, which the parquet footer refers to.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """
+        Take what was written since the last drain.
+
+        Returns:
+            bytes: Written bytes.
+        """
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+class ParquetEncoder:
+    """
+    Encode chunks of rows of EXPORT_COLUMNS as the row groups of one parquet file.
+    """
+
+    def __init__(self) -> None:
+        self.schema = pa.schema(
+            [
+                ("created_at", pa.timestamp("us")),
+                ("temperature", pa.float64()),
+                ("humidity", pa.float64()),
+                ("motion", pa.bool_()),
+                ("is_alarm", pa.bool_()),
+                ("device_listening", pa.bool_()),
+            ]
+        )
+        self.sink = ChunkSink()
+        self.writer = pq.ParquetWriter(pa.PythonFile(self.sink, mode="w"), self.schema)
+
+    def encode(self, rows: Sequence[Sequence]) -> bytes:
+        """
+        Write rows as a row group.
+
+        Args:
+            rows (Sequence[Sequence]): Rows in the order of EXPORT_COLUMNS.
+
+        Returns:
+            bytes: Bytes of the file written so far and not returned yet.
+        """
+        columns = [list(column) for column in zip(*rows)]
+        self.writer.write_table(pa.Table.from_arrays([pa.array(values, type=field.type) for values, field in zip(columns, self.schema)], schema=self.schema))
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        """
+        Write the footer.
+
+        Returns:
+            bytes: Remaining bytes of the file.
+        """
+        self.writer.close()
+        return self.sink.drain()
+
+
+# Encoder by export format
+ENCODERS = {"csv": CsvEncoder, "ndjson": NdjsonEncoder, "parquet": ParquetEncoder}
+
+
+async def stream_export(db: AsyncSession, device_id: str, start: datetime, end: datetime, export_format: str) -> AsyncIterator[bytes]:
+    """
+    Stream raw readings of a device in a range, encoded in an export format.
+
+    Readings are fetched with a server-side cursor EXPORT_CHUNK_ROWS at a time, and each chunk is encoded and
+    sent before the next one is fetched, so memory does not grow with the length of the range.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        start (datetime): Start of the range, inclusive.
+        end (datetime): End of the range, exclusive.
+        export_format (str): One of EXPORT_FORMATS.
+
+    Yields:
+        bytes: Encoded chunk.
+    """
+    started = time.perf_counter()
+    num_of_rows = 0
+    encoder = ENCODERS[export_format]()
+    async for rows in device_crud.stream_readings(db, device_id, start, end, EXPORT_CHUNK_ROWS):
+        yield encoder.encode(rows)
+        num_of_rows += len(rows)
+    yield encoder.close()
+
+    elapsed = time.perf_counter() - started
+    # TODO Replace with logger
+    print(f"Exported {num_of_rows} readings of {device_id} as {export_format} in {elapsed:.2f} s ({num_of_rows / max(elapsed, 1e-9):.0f} rows/s)")
@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.cruds.device as device_crud
+import src.schemas.device as device_schema
+
+PERCENTILES = [5, 50, 95]
+# Bucket width in seconds
+BUCKET_SECONDS = {"hour": 3600, "day": 86400, "week": 604800}
+# DATE_TRUNC('week') starts weeks on Monday, and 1970-01-05 is the first Monday after the epoch.
+WEEK_ORIGIN = 4 * 86400
+# Window, bucket and label format of the points of each historical view, see src.cruds.device.HISTORICAL_DAY_STMT etc.
+HISTORICAL_VIEWS = {
+    "day": (timedelta(days=1), "hour", "%Y/%m/%d %H:00:00"),
+    "week": (timedelta(weeks=1), "day", "%Y/%m/%d"),
+    "month": (timedelta(weeks=4), "week", "%Y/%m/%d"),
+}
+
+
+def bucket_starts(times: np.ndarray, bucket: str) -> np.ndarray:
+    """
+    Truncate timestamps to the start of their bucket, like DATE_TRUNC.
+
+    Args:
+        times (np.ndarray): Seconds since the epoch.
+        bucket (str): "hour", "day" or "week".
+
+    Returns:
+        np.ndarray: Start of the bucket of each timestamp, in seconds since the epoch.
+    """
+    width = BUCKET_SECONDS[bucket]
+    origin = WEEK_ORIGIN if bucket == "week" else 0
+    return (np.floor_divide(times - origin, width) * width + origin).astype(np.int64)
+
+
+def grouped_statistics(groups: np.ndarray, values: np.ndarray, lower: float | None = None, upper: float | None = None) -> Dict[str, np.ndarray]:
+    """
+    Compute statistics of values per group, for all groups at once.
+
+    Values are sorted by group and value once. Every statistic is then a reduction over the contiguous slices of
+    the groups, and percentiles are read at their position in each slice, interpolated like PERCENTILE_CONT.
+
+    Args:
+        groups (np.ndarray): Group of each value.
+        values (np.ndarray): Values, at least one.
+        lower (float | None): Lower limit of the range, inclusive. None for no lower limit.
+        upper (float | None): Upper limit of the range, inclusive. None for no upper limit.
+
+    Returns:
+        Dict[str, np.ndarray]: "group", "count", "min", "max", "avg", "std" (population), "p5", "p50", "p95",
+            and "in_range", the share of values within the limits if there is any limit, per group in ascending order.
+    """
+    order = np.lexsort((values, groups))
+    groups = groups[order]
+    values = values[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    counts = np.diff(np.r_[starts, len(values)])
+
+    avg = np.add.reduceat(values, starts) / counts
+    deviations = values - np.repeat(avg, counts)
+    stats = {
+        "group": groups[starts],
+        "count": counts,
+        "min": values[starts],
+        "max": values[starts + counts - 1],
+        "avg": avg,
+        "std": np.sqrt(np.add.reduceat(deviations * deviations, starts) / counts),
+    }
+    for percentile in PERCENTILES:
+        position = starts + (counts - 1) * percentile / 100
+        below = np.floor(position).astype(np.int64)
+        above = np.ceil(position).astype(np.int64)
+        stats[f"p{percentile}"] = values[below] + (values[above] - values[below]) * (position - below)
+
+    if lower is not None or upper is not None:
+        in_range = np.ones(len(values), dtype=bool)
+        if lower is not None:
+            in_range &= values >= lower
+        if upper is not None:
+            in_range &= values <= upper
+        stats["in_range"] = np.add.reduceat(in_range, starts) / counts
+    return stats
+
+
+def historical_statistics(
+    times: np.ndarray, temperature: np.ndarray, humidity: np.ndarray, lower: float | None, upper: float | None, bucket: str, label_format: str
+) -> Dict[str, dict]:
+    """
+    Compute the extra fields of DeviceHistorical per bucket.
+
+    Args:
+        times (np.ndarray): Seconds since the epoch of each reading.
+        temperature (np.ndarray): Temperature of each reading.
+        humidity (np.ndarray): Humidity of each reading.
+        lower (float | None): Temperature lower limit of the device.
+        upper (float | None): Temperature upper limit of the device.
+        bucket (str): "hour", "day" or "week".
+        label_format (str): strftime format of the bucket label, as in DeviceHistorical.date.
+
+    Returns:
+        Dict[str, dict]: Fields by bucket label.
+    """
+    if len(times) == 0:
+        return {}
+    groups = bucket_starts(times, bucket)
+    temperature_stats = grouped_statistics(groups, temperature, lower, upper)
+    humidity_stats = grouped_statistics(groups, humidity)
+
+    fields: Dict[str, list] = {}
+    for suffix, stats in (("temp", temperature_stats), ("humid", humidity_stats)):
+        for name in ["avg", "std"] + [f"p{percentile}" for percentile in PERCENTILES]:
+            fields[f"{name}_{suffix}"] = stats[name].tolist()
+    fields["temp_in_range"] = temperature_stats["in_range"].tolist() if "in_range" in temperature_stats else [None] * len(temperature_stats["group"])
+
+    labels = [(datetime(1970, 1, 1) + timedelta(seconds=group)).strftime(label_format) for group in temperature_stats["group"].tolist()]
+    return {label: {name: values[i] for name, values in fields.items()} for i, label in enumerate(labels)}
+
+
+async def add_historical_statistics(
+    db: AsyncSession, device_id: str, view: str, points: List[device_schema.DeviceHistorical]
+) -> List[device_schema.DeviceHistorical]:
+    """
+    Add mean, standard deviation, percentiles and time in range to the points of a historical view.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        view (str): "day", "week" or "month".
+        points (List[device_schema.DeviceHistorical]): Points of the view.
+
+    Returns:
+        List[device_schema.DeviceHistorical]: Points with the extra fields, where the bucket has readings.
+    """
+    window, bucket, label_format = HISTORICAL_VIEWS[view]
+    lower, upper, times, temperature, humidity = await device_crud.get_historical_series_arrays(db, device_id, window)
+    statistics = historical_statistics(times, temperature, humidity, lower, upper, bucket, label_format)
+    return [point.copy(update=statistics.get(point.date, {})) for point in points]
@@ -0,0 +1,153 @@
+import math
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.cruds.device as device_crud
+import src.schemas.device as device_schema
+from src.constants.common import HISTORICAL_RAW_MAX_RANGE_HOURS
+from src.errors.errors import HistoricalRangeTooLargeError, InvalidHistoricalRangeError
+from src.utils.downsample import lttb_indices, minmax_indices
+
+METRICS = ["temperature", "humidity"]
+
+
+def choose_bucket(start: datetime, end: datetime, max_points: int) -> str:
+    """
+    Choose the finest source that can serve a range.
+
+    Ranges up to HISTORICAL_RAW_MAX_RANGE_HOURS are served from raw readings,
+    longer ranges from hourly rollups while they fit in `max_points` hours, and from daily rollups otherwise.
+
+    Args:
+        start (datetime): Start of the range.
+        end (datetime): End of the range.
+        max_points (int): Maximum number of points.
+
+    Returns:
+        str: "raw", "hour" or "day".
+    """
+    span = end - start
+    if span <= timedelta(hours=HISTORICAL_RAW_MAX_RANGE_HOURS):
+        return "raw"
+    if span / timedelta(hours=1) <= max_points:
+        return "hour"
+    return "day"
+
+
+def merge_rollups(rows: List[tuple], max_points: int) -> List[tuple]:
+    """
+    Merge consecutive rollup buckets so that at most `max_points` remain. Merging keeps the aggregates exact.
+
+    Args:
+        rows (List[tuple]): Rollups in the order returned by device_crud.get_reading_rollups.
+        max_points (int): Maximum number of buckets.
+
+    Returns:
+        List[tuple]: Merged rollups, each starting at the start of its first bucket.
+    """
+    if len(rows) <= max_points:
+        return rows
+
+    starts = np.arange(0, len(rows), math.ceil(len(rows) / max_points))
+    columns = list(zip(*rows))
+    values = np.array(columns[1:], dtype=np.float64)
+    reducers = [np.minimum, np.maximum, np.add, np.add] * 2
+    merged = [reducer.reduceat(column, starts) for reducer, column in zip(reducers, values)]
+    bucket_starts = [columns[0][i] for i in starts]
+    return list(zip(bucket_starts, *(column.tolist() for column in merged)))
+
+
+def downsample_readings(rows: List[tuple], metrics: List[str], method: str, max_points: int) -> List[tuple]:
+    """
+    Downsample raw readings to at most `max_points` points.
+
+    Points are selected per metric, with the budget split between metrics, and the union is returned.
+    When the budget of a metric is below what the method needs, only the first and last readings are kept,
+    which every metric shares, so the union never exceeds `max_points`.
+
+    Args:
+        rows (List[tuple]): (created_at, temperature, humidity) in ascending order of created_at.
+        metrics (List[str]): Metrics to preserve, from METRICS.
+        method (str): "lttb" or "minmax".
+        max_points (int): Maximum number of points.
+
+    Returns:
+        List[tuple]: Selected rows, in ascending order of created_at.
+    """
+    if len(rows) <= max_points:
+        return rows
+
+    x = np.array([row[0].timestamp() for row in rows])
+    selected = []
+    for metric in metrics:
+        y = np.array([row[1 + METRICS.index(metric)] for row in rows], dtype=np.float64)
+        if method == "lttb":
+            # Below 3 points LTTB keeps the first and last readings.
+            selected.append(lttb_indices(x, y, max_points // len(metrics)))
+        elif max_points >= 2 * len(metrics):
+            selected.append(minmax_indices(y, max_points // (2 * len(metrics))))
+        else:
+            selected.append(np.array([0, len(rows) - 1]))
+    return [rows[i] for i in np.unique(np.concatenate(selected))]
+
+
+async def get_historical_series(
+    db: AsyncSession,
+    device_id: str,
+    start: datetime,
+    end: datetime,
+    bucket: str,
+    metrics: List[str],
+    downsample: str,
+    max_points: int,
+) -> device_schema.DeviceHistoricalSeries:
+    """
+    Get temperature and humidity of a device in a range, from the cheapest source for the resolution.
+
+    Args:
+        db (AsyncSession): AsyncSession
+        device_id (str): Device id
+        start (datetime): Start of the range, inclusive.
+        end (datetime): End of the range, exclusive.
+        bucket (str): "raw", "hour", "day", or "auto" to choose with choose_bucket.
+        metrics (List[str]): Metrics to return, from METRICS.
+        downsample (str): Downsampling of raw readings, "lttb" or "minmax".
+        max_points (int): Maximum number of points.
+
+    Raises:
+        InvalidHistoricalRangeError: If `start` is not before `end`.
+        HistoricalRangeTooLargeError: If raw readings are requested for more than HISTORICAL_RAW_MAX_RANGE_HOURS.
+
+    Returns:
+        device_schema.DeviceHistoricalSeries: Points in ascending order of time.
+    """
+    if start >= end:
+        raise InvalidHistoricalRangeError()
+    if bucket == "auto":
+        bucket = choose_bucket(start, end, max_points)
+    if bucket == "raw" and end - start > timedelta(hours=HISTORICAL_RAW_MAX_RANGE_HOURS):
+        raise HistoricalRangeTooLargeError()
+
+    points = []
+    if bucket == "raw":
+        rows = await device_crud.get_raw_readings(db, device_id, start, end)
+        for created_at, *values in downsample_readings(rows, metrics, downsample, max_points):
+            point = {"time": created_at}
+            for metric, value in zip(METRICS, values):
+                if metric in metrics:
+                    point.update({f"{metric}_min": value, f"{metric}_max": value, f"{metric}_avg": value})
+            points.append(device_schema.DeviceHistoricalPoint(**point))
+    else:
+        rows = await device_crud.get_reading_rollups(db, device_id, bucket, start, end)
+        for bucket_start, *values in merge_rollups(rows, max_points):
+            point = {"time": bucket_start}
+            for i, metric in enumerate(METRICS):
+                if metric in metrics:
+                    minimum, maximum, total, count = values[i * 4 : i * 4 + 4]
+                    point.update({f"{metric}_min": minimum, f"{metric}_max": maximum, f"{metric}_avg": total / count})
+            points.append(device_schema.DeviceHistoricalPoint(**point))
+
+    return device_schema.DeviceHistoricalSeries(bucket=bucket, points=points)
@@ -0,0 +1,80 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from src.errors.errors import IngestionOverloadedError
+from src.ingestion.buffer import IngestionBuffer
+from src.ingestion.rate import DrainRate
+
+
+class AdmissionController:
+    """
+    Cap the number of ingestion requests in flight.
+
+    Requests above `max_in_flight` are rejected with a Retry-After computed from the drain rate,
+    the number of requests completed per second over the last `window` seconds.
+    With a write-behind `buffer`, requests are also rejected while it is full. A request returns before its
+    buffered records are written, so the buffer is where database backpressure shows, and Retry-After is
+    then the time the buffer needs to flush at its measured throughput.
+    """
+
+    def __init__(self, max_in_flight: int, window: float = 10.0, max_retry_after: int = 60, buffer: IngestionBuffer | None = None) -> None:
+        self.max_in_flight = max_in_flight
+        self.window = window
+        self.max_retry_after = max_retry_after
+        self.buffer = buffer
+
+        self.in_flight = 0
+        self.rejected = 0
+        self._drained = DrainRate(window)
+
+    def drain_rate(self) -> float:
+        """
+        Get requests completed per second over the window.
+
+        Returns:
+            float: Drain rate.
+        """
+        return self._drained.rate()
+
+    def retry_after(self) -> int:
+        """
+        Get seconds until the requests in flight are expected to drain.
+
+        Returns:
+            int: Seconds, between 1 and `max_retry_after`.
+        """
+        return self._drained.seconds_to_drain(self.in_flight - self.max_in_flight + 1, self.max_retry_after)
+
+    def acquire(self) -> None:
+        """
+        Admit one request.
+
+        Raises:
+            IngestionOverloadedError: Too many requests are in flight, or the buffer is full.
+        """
+        if self.in_flight >= self.max_in_flight:
+            self.rejected += 1
+            raise IngestionOverloadedError(self.retry_after())
+        if self.buffer is not None and self.buffer.depth >= self.buffer.max_rows:
+            self.rejected += 1
+            raise IngestionOverloadedError(self.buffer.retry_after(1))
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Mark one admitted request as completed."""
+        self.in_flight -= 1
+        self._drained.record()
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Admit one request for the duration of the context.
+
+        Raises:
+            IngestionOverloadedError: Too many requests are in flight, or the buffer is full.
+        """
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
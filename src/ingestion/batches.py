@@ -0,0 +1,54 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable
+
+from src.utils.cache import LRUSet
+
+
+class BatchTracker:
+    """
+    Skip client batches that were already stored.
+
+    A batch is remembered as stored only once its records are written, so a batch lost by a failed flush is
+    stored again when the client retries it. A replay that arrives while the batch is still being written
+    waits for the same write and gets its result or its error, instead of being acknowledged early.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.stored = LRUSet(maxsize)
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of batches being written."""
+        return len(self._pending)
+
+    async def store(self, key: Hashable, count: int, write: Callable[[], Awaitable[int]]) -> int:
+        """
+        Write a batch unless it was already stored.
+
+        The write is not cancelled when the caller is, so that a replay waiting for it still gets its result.
+
+        Args:
+            key (Hashable): Batch key, e.g. (device id, batch id).
+            count (int): Number of records in the batch.
+            write (Callable[[], Awaitable[int]]): Writes the batch and returns the number of records persisted.
+
+        Returns:
+            int: Number of records persisted, `count` if the batch was already stored.
+        """
+        if key in self.stored:
+            return count
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(write())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda future: self._done(key, count, future))
+        return await asyncio.shield(pending)
+
+    def _done(self, key: Hashable, count: int, future: asyncio.Future) -> None:
+        del self._pending[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        # 0 records persisted out of a non-empty batch means the records were dropped.
+        if future.result() > 0 or count == 0:
+            self.stored.add(key)
@@ -0,0 +1,212 @@
+import asyncio
+import math
+import time
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+from src.errors.errors import IngestionBufferFullError
+from src.ingestion.rate import DrainRate
+
+Writer = Callable[[List[tuple]], Awaitable[None]]
+
+
+class IngestionBuffer:
+    """
+    Write-behind buffer for reading records.
+
+    Records from many devices are collected in memory and written in one bulk write,
+    when either `flush_rows` records are pending or `flush_interval` seconds have passed.
+    At most `max_rows` records are held, further records are rejected with a Retry-After computed from the
+    flush throughput, the number of records written per second over the last `window` seconds.
+    """
+
+    def __init__(self, writer: Writer, max_rows: int, flush_rows: int, flush_interval: float, window: float = 10.0, max_retry_after: int = 60) -> None:
+        self._writer = writer
+        self.max_rows = max_rows
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.max_retry_after = max_retry_after
+
+        self._pending: List[tuple] = []
+        self._waiters: List[Tuple[asyncio.Future, Any, int]] = []
+        self._flush_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self._drained = DrainRate(window)
+
+        self.flush_count = 0
+        self.flushed_rows = 0
+        self.dropped_rows = 0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self.total_flush_seconds = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of records waiting to be flushed."""
+        return len(self._pending)
+
+    def retry_after(self, rows: int) -> int:
+        """
+        Get seconds until the buffer is expected to have room for more records.
+
+        Before any flush was measured, the next flush is expected within `flush_interval`,
+        unless a flush is still running, which means the database is not keeping up.
+
+        Args:
+            rows (int): Number of records to make room for.
+
+        Returns:
+            int: Seconds, between 1 and `max_retry_after`.
+        """
+        if self._drained.rate() == 0 and not self._flush_lock.locked():
+            return max(1, min(self.max_retry_after, math.ceil(self.flush_interval)))
+        return self._drained.seconds_to_drain(len(self._pending) + rows - self.max_rows, self.max_retry_after)
+
+    def put(self, records: List[tuple]) -> None:
+        """
+        Enqueue reading records.
+
+        Args:
+            records (List[tuple]): Reading records in the order of READING_COLUMNS.
+
+        Raises:
+            IngestionBufferFullError: The buffer cannot hold the records.
+        """
+        if len(self._pending) + len(records) > self.max_rows:
+            raise IngestionBufferFullError(self.retry_after(len(records)))
+        self._pending.extend(records)
+        if len(self._pending) >= self.flush_rows:
+            self._flush_event.set()
+
+    async def put_and_wait(self, records: List[tuple]) -> int:
+        """
+        Enqueue reading records of one device and wait until they are flushed.
+
+        Args:
+            records (List[tuple]): Reading records of one device in the order of READING_COLUMNS.
+
+        Raises:
+            IngestionBufferFullError: The buffer cannot hold the records.
+
+        Returns:
+            int: Number of records written. 0 if the records were dropped.
+        """
+        if not records:
+            return 0
+        self.put(records)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiters.append((future, records[0][0], len(records)))
+        return await future
+
+    def start(self) -> None:
+        """Start the background flusher."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background flusher and flush the remaining records.
+
+        The flusher is not cancelled, a flush in progress is waited for so that its records are written.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._flush_event.set()
+            await self._task
+            self._task = None
+            self._stopping = False
+        await self.flush()
+
+    async def flush(self) -> None:
+        """
+        Write all pending records.
+
+        If the bulk write fails, records are written again per device, so one bad device does not drop the whole batch.
+        If the flush is cancelled, its records and waiters are put back for the next flush.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            records, self._pending = self._pending, []
+            waiters, self._waiters = self._waiters, []
+
+            start = time.perf_counter()
+            dropped_device_ids: Set[Any] = set()
+            done = False
+            try:
+                try:
+                    await self._writer(records)
+                except Exception as e:
+                    # TODO Replace with logger
+                    print(f"Bulk flush of {len(records)} records failed, retrying per device: {e}")
+                    dropped_device_ids = await self._flush_per_device(records)
+                else:
+                    self.flushed_rows += len(records)
+                    self._drained.record(len(records))
+                done = True
+            finally:
+                if not done:
+                    # Records already written per device are written again, which READINGS skips as duplicates.
+                    self._pending[:0] = records
+                    self._waiters[:0] = waiters
+            elapsed = time.perf_counter() - start
+
+            for future, device_id, count in waiters:
+                if not future.done():
+                    future.set_result(0 if device_id in dropped_device_ids else count)
+
+            self.flush_count += 1
+            self.last_flush_seconds = elapsed
+            self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+            self.total_flush_seconds += elapsed
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Get buffer metrics.
+
+        Returns:
+            Dict[str, float]: Queue depth, flush counters, flush throughput in records per second and flush latency in seconds.
+        """
+        return {
+            "queue_depth": self.depth,
+            "max_rows": self.max_rows,
+            "flush_count": self.flush_count,
+            "flushed_rows": self.flushed_rows,
+            "dropped_rows": self.dropped_rows,
+            "flushed_rows_per_second": self._drained.rate(),
+            "last_flush_seconds": self.last_flush_seconds,
+            "max_flush_seconds": self.max_flush_seconds,
+            "avg_flush_seconds": self.total_flush_seconds / self.flush_count if self.flush_count else 0.0,
+        }
+
+    async def _flush_per_device(self, records: List[tuple]) -> Set[Any]:
+        dropped_device_ids = set()
+        for device_id, group in groupby(sorted(records, key=itemgetter(0)), key=itemgetter(0)):
+            device_records = list(group)
+            try:
+                await self._writer(device_records)
+            except Exception as e:
+                # TODO Replace with logger
+                print(f"Dropped {len(device_records)} records of device {device_id}: {e}")
+                self.dropped_rows += len(device_records)
+                dropped_device_ids.add(device_id)
+            else:
+                self.flushed_rows += len(device_records)
+                self._drained.record(len(device_records))
+        return dropped_device_ids
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                # TODO Replace with logger
+                print(f"Ingestion flush failed: {e}")
@@ -0,0 +1,57 @@
+import math
+import time
+from collections import deque
+from typing import Deque, Tuple
+
+
+class DrainRate:
+    """
+    Number of items completed per second over the last `window` seconds.
+    """
+
+    def __init__(self, window: float = 10.0) -> None:
+        self.window = window
+        self._completed: Deque[Tuple[float, int]] = deque()
+        self._total = 0
+
+    def record(self, count: int = 1) -> None:
+        """
+        Record completed items.
+
+        Args:
+            count (int): Number of items. Defaults to 1.
+        """
+        now = time.monotonic()
+        self._completed.append((now, count))
+        self._total += count
+        self._expire(now)
+
+    def rate(self) -> float:
+        """
+        Get items completed per second over the window.
+
+        Returns:
+            float: Drain rate.
+        """
+        self._expire(time.monotonic())
+        return self._total / self.window
+
+    def seconds_to_drain(self, backlog: int, max_seconds: int) -> int:
+        """
+        Get seconds until a backlog of items is expected to drain at the current rate.
+
+        Args:
+            backlog (int): Number of items.
+            max_seconds (int): Upper bound, also returned when nothing was completed over the window.
+
+        Returns:
+            int: Seconds, between 1 and `max_seconds`.
+        """
+        rate = self.rate()
+        if rate == 0:
+            return max_seconds
+        return max(1, min(max_seconds, math.ceil(backlog / rate)))
+
+    def _expire(self, now: float) -> None:
+        while self._completed and self._completed[0][0] < now - self.window:
+            self._total -= self._completed.popleft()[1]
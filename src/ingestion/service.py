@@ -0,0 +1,142 @@
+import asyncio
+from typing import AsyncIterator, List
+
+import src.cruds.device as device_crud
+import src.schemas.device as device_schema
+from src.constants.common import (
+    DEVICE_LIMITS_CACHE_SIZE,
+    DEVICE_LIMITS_CACHE_TTL_SECONDS,
+    INGESTION_BACKFILL_CHUNK_SIZE,
+    INGESTION_BATCH_ID_CACHE_SIZE,
+    INGESTION_BUFFER_ENABLED,
+    INGESTION_BUFFER_MAX_ROWS,
+    INGESTION_FLUSH_INTERVAL_SECONDS,
+    INGESTION_FLUSH_ROWS,
+    INGESTION_MAX_IN_FLIGHT,
+    THRESHOLD_EVALUATION_ENABLED,
+    THRESHOLD_HYSTERESIS_CELSIUS,
+)
+from src.db.db import ingestion_session
+from src.ingestion.admission import AdmissionController
+from src.ingestion.batches import BatchTracker
+from src.ingestion.buffer import IngestionBuffer
+from src.ingestion.thresholds import ThresholdMonitor
+
+threshold_monitor = ThresholdMonitor(DEVICE_LIMITS_CACHE_SIZE, DEVICE_LIMITS_CACHE_TTL_SECONDS, THRESHOLD_HYSTERESIS_CELSIUS)
+
+
+async def write_readings(records: List[tuple]) -> None:
+    """
+    Write reading records in their own transaction, on the ingestion connection pool.
+    Temperature limit breaches are written as notifications in the same transaction.
+
+    Args:
+        records (List[tuple]): Reading records in the order of READING_COLUMNS.
+    """
+    async with ingestion_session() as db:
+        await device_crud.create_readings(db, records)
+        breach_states = await threshold_monitor.evaluate(db, records) if THRESHOLD_EVALUATION_ENABLED else {}
+        await db.commit()
+    threshold_monitor.commit(breach_states)
+
+
+ingestion_buffer = IngestionBuffer(
+    write_readings,
+    max_rows=INGESTION_BUFFER_MAX_ROWS,
+    flush_rows=INGESTION_FLUSH_ROWS,
+    flush_interval=INGESTION_FLUSH_INTERVAL_SECONDS,
+)
+
+ingestion_admission = AdmissionController(INGESTION_MAX_IN_FLIGHT, buffer=ingestion_buffer if INGESTION_BUFFER_ENABLED else None)
+
+# Batches keyed by (Device id, Batch id)
+recent_batches = BatchTracker(INGESTION_BATCH_ID_CACHE_SIZE)
+
+
+async def store_readings(device_id: str, records: List[tuple], wait: bool = False, batch_id: str | None = None) -> int:
+    """
+    Store reading records.
+
+    This is the storage path shared by the HTTP route and the socket handler.
+    Records go through the ingestion buffer when it is enabled, otherwise they are written right away.
+    A batch with an id is always waited for, so that its id is remembered only once its records are persisted.
+    A batch whose id was stored recently for the same device is skipped without touching the database,
+    and a replay of a batch that is still being written waits for that write.
+
+    Args:
+        device_id (str): Device id.
+        records (List[tuple]): Reading records in the order of READING_COLUMNS.
+        wait (bool): Wait until buffered records are flushed. Defaults to False.
+        batch_id (str | None): Client batch id. Defaults to None.
+
+    Raises:
+        IngestionBufferFullError: The buffer cannot hold the records.
+
+    Returns:
+        int: Number of records persisted, or accepted when not waiting for the flush.
+    """
+    if batch_id is None:
+        return await _store_readings(records, wait)
+    return await recent_batches.store((device_id, batch_id), len(records), lambda: _store_readings(records, wait=True))
+
+
+async def _store_readings(records: List[tuple], wait: bool) -> int:
+    if INGESTION_BUFFER_ENABLED:
+        if wait:
+            return await ingestion_buffer.put_and_wait(records)
+        ingestion_buffer.put(records)
+        return len(records)
+    await write_readings(records)
+    return len(records)
+
+
+async def store_readings_stream(
+    device_id: str, device_data_stream: AsyncIterator[device_schema.DeviceDataCreate], chunk_size: int = INGESTION_BACKFILL_CHUNK_SIZE
+) -> int:
+    """
+    Store device data as it is received, in chunks of `chunk_size`.
+
+    Each chunk is written in its own transaction while the next chunk is being received,
+    so at most two chunks are held in memory. Chunks written before an error stay stored.
+
+    Args:
+        device_id (str): Device id.
+        device_data_stream (AsyncIterator[device_schema.DeviceDataCreate]): Device data as it is received.
+        chunk_size (int): Number of readings written at once. Defaults to INGESTION_BACKFILL_CHUNK_SIZE.
+
+    Returns:
+        int: Number of records persisted.
+    """
+    count = 0
+    chunk: List[device_schema.DeviceDataCreate] = []
+    pending_write: asyncio.Task | None = None
+    try:
+        async for device_data in device_data_stream:
+            chunk.append(device_data)
+            if len(chunk) < chunk_size:
+                continue
+            if pending_write is not None:
+                await pending_write
+            records = device_crud.to_reading_records(device_id, chunk)
+            pending_write = asyncio.create_task(write_readings(records))
+            count += len(records)
+            chunk = []
+    finally:
+        if pending_write is not None:
+            await pending_write
+
+    if chunk:
+        await write_readings(device_crud.to_reading_records(device_id, chunk))
+        count += len(chunk)
+    return count
+
+
+async def admit_ingestion() -> AsyncIterator[None]:
+    """
+    Admit one ingestion request for the duration of the request.
+
+    Raises:
+        IngestionOverloadedError: Too many ingestion requests are in flight.
+    """
+    async with ingestion_admission.admit():
+        yield
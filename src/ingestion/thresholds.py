@@ -0,0 +1,177 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.cruds.device as device_crud
+import src.cruds.notification as notification_crud
+from src.utils.cache import TTLCache
+
+# Breach states
+NORMAL = -1
+BREACHED = 1
+THRESHOLD_CONTENT_TYPE = "Temperature"
+_MISSING = object()
+
+
+def breach_states(temperature: np.ndarray, starts: np.ndarray, initial: np.ndarray, enter: np.ndarray, leave: np.ndarray) -> np.ndarray:
+    """
+    Run the hysteresis of one limit over the readings of many devices at once.
+
+    A device enters the breach at a reading for which `enter` holds, and stays in it until a reading for which `leave`
+    holds, so readings hovering between the two keep the current state. The last decisive reading is found by
+    carrying its index forward, starting every device from its state before the batch.
+
+    Args:
+        temperature (np.ndarray): Temperatures, grouped by device and in ascending order of time within each device.
+        starts (np.ndarray): Index of the first reading of each device.
+        initial (np.ndarray): State of each device before the batch, NORMAL or BREACHED.
+        enter (np.ndarray): Whether each reading enters the breach.
+        leave (np.ndarray): Whether each reading leaves the breach.
+
+    Returns:
+        np.ndarray: State after each reading.
+    """
+    events = np.where(enter, BREACHED, np.where(leave, NORMAL, 0))
+    events[starts] = np.where(events[starts] == 0, initial, events[starts])
+    decisive = np.maximum.accumulate(np.where(events != 0, np.arange(len(temperature)), 0))
+    return events[decisive]
+
+
+def evaluate_thresholds(
+    records: List[tuple], limits: Dict[str, Tuple[float | None, float | None]], states: Dict[Tuple[str, str], int], hysteresis: float
+) -> Tuple[List[tuple], Dict[Tuple[str, str], int]]:
+    """
+    Find the readings at which devices go above their upper or below their lower temperature limit.
+
+    Args:
+        records (List[tuple]): Reading records in the order of READING_COLUMNS.
+        limits (Dict[str, Tuple[float | None, float | None]]): (Lower limit, upper limit) by device id.
+        states (Dict[Tuple[str, str], int]): BREACHED by (device id, "upper" or "lower") for devices in breach.
+        hysteresis (float): Distance back inside the limit at which a breach ends.
+
+    Returns:
+        Tuple[List[tuple], Dict[Tuple[str, str], int]]: (device id, created_at, "upper" or "lower", temperature, limit)
+            of each breach in ascending order of time, and the state of each limit of the devices in the batch.
+    """
+    records = [record for record in records if record[2] is not None]
+    if not records:
+        return [], {}
+
+    records.sort(key=lambda record: (str(record[0]), record[1]))
+    device_ids = [str(record[0]) for record in records]
+    starts = np.flatnonzero(np.r_[True, np.array(device_ids[1:]) != np.array(device_ids[:-1])])
+    devices = [device_ids[i] for i in starts]
+    counts = np.diff(np.r_[starts, len(records)])
+    temperature = np.array([record[2] for record in records], dtype=np.float64)
+    lower = np.repeat(np.array([limits.get(device_id, (None, None))[0] for device_id in devices], dtype=np.float64), counts)
+    upper = np.repeat(np.array([limits.get(device_id, (None, None))[1] for device_id in devices], dtype=np.float64), counts)
+
+    breaches = []
+    new_states = {}
+    # Comparisons with a missing limit (NaN) are False, so such devices stay NORMAL.
+    for kind, limit, enter, leave in (
+        ("upper", upper, temperature > upper, temperature <= upper - hysteresis),
+        ("lower", lower, temperature < lower, temperature >= lower + hysteresis),
+    ):
+        initial = np.array([states.get((device_id, kind), NORMAL) for device_id in devices])
+        after = breach_states(temperature, starts, initial, enter, leave)
+        before = np.r_[NORMAL, after[:-1]]
+        before[starts] = initial
+        for i in np.flatnonzero((after == BREACHED) & (before != BREACHED)).tolist():
+            breaches.append((device_ids[i], records[i][1], kind, float(temperature[i]), float(limit[i])))
+        for device_id, state in zip(devices, after[starts + counts - 1].tolist()):
+            new_states[(device_id, kind)] = state
+
+    breaches.sort(key=lambda breach: breach[1])
+    return breaches, new_states
+
+
+def breach_message(kind: str, temperature: float, limit: float) -> str:
+    """
+    Build the notification content of a breach.
+
+    Args:
+        kind (str): "upper" or "lower".
+        temperature (float): Temperature of the reading.
+        limit (float): Limit.
+
+    Returns:
+        str: Notification content.
+    """
+    direction = "above the upper" if kind == "upper" else "below the lower"
+    return f"Temperature {temperature:.1f}°C is {direction} limit of {limit:.1f}°C"
+
+
+class ThresholdMonitor:
+    """
+    Evaluates ingested readings against the temperature limits of their devices and records breaches as notifications.
+
+    Limits are cached for `ttl` seconds and dropped by `invalidate` when device settings change.
+    Breach states are kept in memory, so a restart can notify a breach in progress once more.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, hysteresis: float) -> None:
+        self.limits = TTLCache(maxsize, ttl)
+        self.hysteresis = hysteresis
+        self._states: Dict[Tuple[str, str], int] = {}
+
+    def invalidate(self, device_id: str) -> None:
+        """
+        Drop the cached limits of a device.
+
+        Args:
+            device_id (str): Device id.
+        """
+        self.limits.invalidate(str(device_id))
+
+    async def _get_limits(self, db: AsyncSession, device_ids: List[str]) -> Dict[str, Tuple[float | None, float | None]]:
+        limits = {}
+        missing = []
+        for device_id in device_ids:
+            value = self.limits.get(device_id, _MISSING)
+            if value is _MISSING:
+                missing.append(device_id)
+            else:
+                limits[device_id] = value
+        if missing:
+            found = await device_crud.find_temperature_limits(db, missing)
+            for device_id in missing:
+                limits[device_id] = found.get(device_id, (None, None))
+                self.limits.set(device_id, limits[device_id])
+        return limits
+
+    async def evaluate(self, db: AsyncSession, records: List[tuple]) -> Dict[Tuple[str, str], int]:
+        """
+        Insert a notification for each breach in reading records, in one statement.
+        Must be followed by `commit` with the returned states once the transaction is committed.
+
+        Args:
+            db (AsyncSession): AsyncSession
+            records (List[tuple]): Reading records in the order of READING_COLUMNS.
+
+        Returns:
+            Dict[Tuple[str, str], int]: Breach states after the records.
+        """
+        limits = await self._get_limits(db, sorted({str(record[0]) for record in records}))
+        breaches, states = evaluate_thresholds(records, limits, self._states, self.hysteresis)
+        if breaches:
+            notifications = [
+                (device_id, THRESHOLD_CONTENT_TYPE, breach_message(kind, temperature, limit), created_at)
+                for device_id, created_at, kind, temperature, limit in breaches
+            ]
+            await notification_crud.create_notifications(db, notifications)
+        return states
+
+    def commit(self, states: Dict[Tuple[str, str], int]) -> None:
+        """
+        Keep breach states returned by `evaluate`.
+
+        Args:
+            states (Dict[Tuple[str, str], int]): Breach states.
+        """
+        for key, state in states.items():
+            if state == BREACHED:
+                self._states[key] = state
+            else:
+                self._states.pop(key, None)
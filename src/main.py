@@ -1,11 +1,26 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi_socketio import SocketManager
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
+from src.constants.common import (
+    INGESTION_BUFFER_ENABLED,
+    NEXT_CURSOR_HEADER,
+    READINGS_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+    READINGS_RAW_RETENTION_DAYS,
+    READINGS_RETENTION_BATCH_SIZE,
+    READINGS_RETENTION_INTERVAL_SECONDS,
+)
+from src.db.db import async_engine
+from src.db.partitions import run_partition_maintenance
+from src.db.retention import run_retention
+from src.db.warmup import warm_up
 from src.errors.errors import APIError
-from src.routers import auth, device, notification, settings, user, weather
+from src.ingestion.service import ingestion_buffer
+from src.routers import auth, dashboard, device, ingestion, notification, settings, user, weather
 from src.sockets.hardware_namespace import HardwareNameSpace
 
 middleware = [
@@ -15,6 +30,7 @@ middleware = [
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 ]
 
@@ -25,6 +41,8 @@ app.include_router(auth.router)
 app.include_router(settings.router)
 app.include_router(notification.router)
 app.include_router(user.router)
+app.include_router(ingestion.router)
+app.include_router(dashboard.router)
 
 
 @app.exception_handler(APIError)
@@ -32,6 +50,55 @@ async def api_error_handler(request, err: APIError):
     return JSONResponse(status_code=err.status_code, content={"detail": err.detail}, headers=err.headers)
 
 
+@app.on_event("startup")
+async def warm_up_connection_pool():
+    await warm_up()
+
+
+@app.on_event("startup")
+async def start_ingestion_buffer():
+    if INGESTION_BUFFER_ENABLED:
+        ingestion_buffer.start()
+
+
+@app.on_event("shutdown")
+async def stop_ingestion_buffer():
+    await ingestion_buffer.stop()
+
+
+partition_maintenance_task = None
+
+
+@app.on_event("startup")
+async def start_partition_maintenance():
+    global partition_maintenance_task
+    partition_maintenance_task = asyncio.create_task(run_partition_maintenance(async_engine, READINGS_PARTITION_MAINTENANCE_INTERVAL_SECONDS))
+
+
+@app.on_event("shutdown")
+async def stop_partition_maintenance():
+    if partition_maintenance_task is not None:
+        partition_maintenance_task.cancel()
+
+
+retention_task = None
+
+
+@app.on_event("startup")
+async def start_retention():
+    global retention_task
+    if READINGS_RAW_RETENTION_DAYS > 0:
+        retention_task = asyncio.create_task(
+            run_retention(async_engine, READINGS_RAW_RETENTION_DAYS, READINGS_RETENTION_BATCH_SIZE, READINGS_RETENTION_INTERVAL_SECONDS)
+        )
+
+
+@app.on_event("shutdown")
+async def stop_retention():
+    if retention_task is not None:
+        retention_task.cancel()
+
+
 socket_manager = SocketManager(app)
 socket_manager._sio.register_namespace(HardwareNameSpace("/hardware"))
 
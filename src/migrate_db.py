@@ -1,6 +1,12 @@
+import argparse
+from datetime import datetime
+
 from sqlalchemy import create_engine
+from sqlalchemy.sql import text
 
 from src.constants.common import SYNC_DATABASE_URL
+from src.db.partitions import create_partitions, maintain_partitions
+from src.db.retention import compact_readings
 from src.models import models
 
 engine = create_engine(SYNC_DATABASE_URL, echo=True)
@@ -12,6 +18,8 @@ def drop_database() -> None:
 
 def create_database() -> None:
     models.Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        maintain_partitions(connection)
 
 
 def reset_database() -> None:
@@ -19,5 +27,210 @@ def reset_database() -> None:
     create_database()
 
 
+def migrate_readings() -> None:
+    """
+    Create the READINGS table and backfill it from the legacy per-sensor tables.
+
+    Values from TEMPERATURE, HUMIDITY, MOTION, ALARM and BUTTON with the same device id and timestamp are merged into one row.
+    Rows that already exist in READINGS are kept as they are, so the migration can be run more than once.
+    """
+    models.Reading.__table__.create(engine, checkfirst=True)
+    first_created_at_stmt = text(
+        """
+        SELECT
+            LEAST(
+                (SELECT MIN(CREATED_AT) FROM TEMPERATURE),
+                (SELECT MIN(CREATED_AT) FROM HUMIDITY),
+                (SELECT MIN(CREATED_AT) FROM MOTION),
+                (SELECT MIN(CREATED_AT) FROM ALARM),
+                (SELECT MIN(CREATED_AT) FROM BUTTON)
+            )
+        """
+    )
+    stmt = text(
+        """
+        INSERT INTO
+            READINGS (DEVICE_ID, CREATED_AT, TEMPERATURE, HUMIDITY, MOTION, IS_ALARM, DEVICE_LISTENING)
+        SELECT
+            A.DEVICE_ID,
+            A.CREATED_AT,
+            MAX(A.TEMPERATURE),
+            MAX(A.HUMIDITY),
+            BOOL_OR(A.MOTION),
+            BOOL_OR(A.IS_ALARM),
+            BOOL_OR(A.DEVICE_LISTENING)
+        FROM
+            (
+                SELECT DEVICE_ID, CREATED_AT, TEMPERATURE, NULL::FLOAT AS HUMIDITY, NULL::BOOLEAN AS MOTION, NULL::BOOLEAN AS IS_ALARM, NULL::BOOLEAN AS DEVICE_LISTENING
+                FROM TEMPERATURE
+                UNION ALL
+                SELECT DEVICE_ID, CREATED_AT, NULL, HUMIDITY, NULL, NULL, NULL
+                FROM HUMIDITY
+                UNION ALL
+                SELECT DEVICE_ID, CREATED_AT, NULL, NULL, MOTION, NULL, NULL
+                FROM MOTION
+                UNION ALL
+                SELECT DEVICE_ID, CREATED_AT, NULL, NULL, NULL, IS_ALARM, NULL
+                FROM ALARM
+                UNION ALL
+                SELECT DEVICE_ID, CREATED_AT, NULL, NULL, NULL, NULL, DEVICE_LISTENING
+                FROM BUTTON
+            ) A
+        WHERE
+            A.DEVICE_ID IS NOT NULL
+        GROUP BY
+            A.DEVICE_ID,
+            A.CREATED_AT
+        ON CONFLICT (DEVICE_ID, CREATED_AT) DO NOTHING
+        """
+    )
+    with engine.begin() as connection:
+        maintain_partitions(connection)
+        first_created_at = connection.execute(first_created_at_stmt).scalar()
+        if first_created_at is not None:
+            create_partitions(connection, first_created_at, datetime.now())
+        connection.execute(stmt)
+
+
+def migrate_partition_readings() -> None:
+    """
+    Convert an unpartitioned READINGS table into one partitioned by month on CREATED_AT.
+
+    The existing table is renamed to READINGS_UNPARTITIONED and its rows are copied into the partitioned table.
+    READINGS_UNPARTITIONED is left in place and can be dropped once the copy has been checked.
+    """
+    is_partitioned_stmt = text("SELECT EXISTS (SELECT 1 FROM PG_PARTITIONED_TABLE WHERE PARTRELID = CAST('readings' AS REGCLASS))")
+    with engine.begin() as connection:
+        if connection.execute(is_partitioned_stmt).scalar():
+            return
+
+        connection.execute(text("ALTER TABLE READINGS RENAME TO READINGS_UNPARTITIONED"))
+        connection.execute(text("ALTER TABLE READINGS_UNPARTITIONED RENAME CONSTRAINT READINGS_PKEY TO READINGS_UNPARTITIONED_PKEY"))
+        connection.execute(text("ALTER TABLE READINGS_UNPARTITIONED RENAME CONSTRAINT READINGS_DEVICE_ID_FKEY TO READINGS_UNPARTITIONED_DEVICE_ID_FKEY"))
+        # Indexes created by the readings-created-at-index and pagination-indexes migrations, if they ran before.
+        connection.execute(text("ALTER INDEX IF EXISTS IX_READINGS_CREATED_AT RENAME TO IX_READINGS_CREATED_AT_UNPARTITIONED"))
+        connection.execute(text("ALTER INDEX IF EXISTS IX_READINGS_ALARM RENAME TO IX_READINGS_ALARM_UNPARTITIONED"))
+        models.Reading.__table__.create(connection)
+
+        maintain_partitions(connection)
+        first_created_at = connection.execute(text("SELECT MIN(CREATED_AT) FROM READINGS_UNPARTITIONED")).scalar()
+        if first_created_at is not None:
+            create_partitions(connection, first_created_at, datetime.now())
+        connection.execute(text("INSERT INTO READINGS SELECT * FROM READINGS_UNPARTITIONED"))
+
+
+def migrate_latest_readings() -> None:
+    """
+    Create the LATEST_READINGS table and fill it from READINGS.
+
+    Stored values are only replaced by values with a timestamp at least as recent, so it is safe to run while devices are sending data.
+    """
+    models.LatestReading.__table__.create(engine, checkfirst=True)
+    stmt = text(
+        """
+        INSERT INTO
+            LATEST_READINGS (DEVICE_ID, TEMPERATURE, TEMPERATURE_AT, HUMIDITY, HUMIDITY_AT, IS_ALARM, IS_ALARM_AT)
+        SELECT
+            D.ID,
+            T.TEMPERATURE,
+            T.CREATED_AT,
+            H.HUMIDITY,
+            H.CREATED_AT,
+            A.IS_ALARM,
+            A.CREATED_AT
+        FROM
+            DEVICES D
+        LEFT JOIN LATERAL (
+            SELECT TEMPERATURE, CREATED_AT FROM READINGS
+            WHERE DEVICE_ID = D.ID AND TEMPERATURE IS NOT NULL ORDER BY CREATED_AT DESC LIMIT 1
+        ) T ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT HUMIDITY, CREATED_AT FROM READINGS
+            WHERE DEVICE_ID = D.ID AND HUMIDITY IS NOT NULL ORDER BY CREATED_AT DESC LIMIT 1
+        ) H ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT IS_ALARM, CREATED_AT FROM READINGS
+            WHERE DEVICE_ID = D.ID AND IS_ALARM IS NOT NULL ORDER BY CREATED_AT DESC LIMIT 1
+        ) A ON TRUE
+        WHERE
+            T.CREATED_AT IS NOT NULL
+            OR H.CREATED_AT IS NOT NULL
+            OR A.CREATED_AT IS NOT NULL
+        ON CONFLICT (DEVICE_ID) DO UPDATE SET
+            TEMPERATURE = CASE
+                WHEN EXCLUDED.TEMPERATURE_AT >= COALESCE(LATEST_READINGS.TEMPERATURE_AT, '-infinity') THEN EXCLUDED.TEMPERATURE
+                ELSE LATEST_READINGS.TEMPERATURE
+            END,
+            TEMPERATURE_AT = GREATEST(LATEST_READINGS.TEMPERATURE_AT, EXCLUDED.TEMPERATURE_AT),
+            HUMIDITY = CASE
+                WHEN EXCLUDED.HUMIDITY_AT >= COALESCE(LATEST_READINGS.HUMIDITY_AT, '-infinity') THEN EXCLUDED.HUMIDITY
+                ELSE LATEST_READINGS.HUMIDITY
+            END,
+            HUMIDITY_AT = GREATEST(LATEST_READINGS.HUMIDITY_AT, EXCLUDED.HUMIDITY_AT),
+            IS_ALARM = CASE
+                WHEN EXCLUDED.IS_ALARM_AT >= COALESCE(LATEST_READINGS.IS_ALARM_AT, '-infinity') THEN EXCLUDED.IS_ALARM
+                ELSE LATEST_READINGS.IS_ALARM
+            END,
+            IS_ALARM_AT = GREATEST(LATEST_READINGS.IS_ALARM_AT, EXCLUDED.IS_ALARM_AT)
+        """
+    )
+    with engine.begin() as connection:
+        connection.execute(stmt)
+
+
+def migrate_reading_rollups() -> None:
+    """
+    Create the READINGS_HOURLY and READINGS_DAILY tables and aggregate every reading into them.
+
+    Existing buckets are recomputed, so the migration can be run more than once.
+    """
+    models.ReadingHourly.__table__.create(engine, checkfirst=True)
+    models.ReadingDaily.__table__.create(engine, checkfirst=True)
+    with engine.begin() as connection:
+        compact_readings(connection)
+
+
+def migrate_readings_created_at_index() -> None:
+    """
+    Create the BRIN index on READINGS.CREATED_AT used by retention.
+    """
+    with engine.begin() as connection:
+        connection.execute(text("CREATE INDEX IF NOT EXISTS IX_READINGS_CREATED_AT ON READINGS USING BRIN (CREATED_AT)"))
+
+
+def migrate_pagination_indexes() -> None:
+    """
+    Create the indexes used by keyset pagination of notifications and alarm history.
+    """
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE INDEX IF NOT EXISTS IX_NOTIFICATIONS_DEVICE_ID_CREATED_AT_ID ON NOTIFICATIONS (DEVICE_ID, CREATED_AT, ID)")
+        )
+        connection.execute(text("CREATE INDEX IF NOT EXISTS IX_READINGS_ALARM ON READINGS (DEVICE_ID, CREATED_AT) WHERE IS_ALARM"))
+
+
+def migrate_partitions() -> None:
+    """
+    Pre-create upcoming READINGS partitions.
+    """
+    with engine.begin() as connection:
+        maintain_partitions(connection)
+
+
+MIGRATIONS = {
+    "reset": reset_database,
+    "readings": migrate_readings,
+    "partition-readings": migrate_partition_readings,
+    "partitions": migrate_partitions,
+    "latest-readings": migrate_latest_readings,
+    "reading-rollups": migrate_reading_rollups,
+    "readings-created-at-index": migrate_readings_created_at_index,
+    "pagination-indexes": migrate_pagination_indexes,
+}
+
+
 if __name__ == "__main__":
-    reset_database()
+    parser = argparse.ArgumentParser(description="Migrate database")
+    parser.add_argument("migration", nargs="?", default="reset", choices=MIGRATIONS.keys(), help="Migration to run. Defaults to reset.")
+    args = parser.parse_args()
+    MIGRATIONS[args.migration]()
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
@@ -25,6 +25,22 @@ class CreatedNoDefaultTimeStampMixin:
         return Column(DateTime, nullable=False)
 
 
+class ReadingRollupMixin:
+    @declared_attr
+    def device_id(cls) -> Column:
+        return Column(UUIDType(binary=False), ForeignKey("devices.id"), primary_key=True)
+
+    bucket_start = Column(DateTime, primary_key=True)
+    temperature_min = Column(Float)
+    temperature_max = Column(Float)
+    temperature_sum = Column(Float)
+    temperature_count = Column(Integer, nullable=False)
+    humidity_min = Column(Float)
+    humidity_max = Column(Float)
+    humidity_sum = Column(Float)
+    humidity_count = Column(Integer, nullable=False)
+
+
 class Register(Base, CreatedUpdatedDefaultTimeStampMixin):
     __tablename__ = "registered"
 
@@ -59,6 +75,7 @@ class Device(Base, CreatedUpdatedDefaultTimeStampMixin):
 
     user = relationship("User", back_populates="devices")
 
+    reading_data = relationship("Reading", back_populates="device")
     temperature_data = relationship("Temperature", back_populates="device")
     humidity_data = relationship("Humidity", back_populates="device")
     motion_data = relationship("Motion", back_populates="device")
@@ -67,6 +84,54 @@ class Device(Base, CreatedUpdatedDefaultTimeStampMixin):
     notification_data = relationship("Notification", back_populates="device")
 
 
+class Reading(Base):
+    __tablename__ = "readings"
+    # Monthly partitions are managed by src.db.partitions.
+    # The BRIN index finds expired readings for src.db.retention without slowing down inserts.
+    __table_args__ = (
+        Index("ix_readings_created_at", "created_at", postgresql_using="brin"),
+        # Alarm history, see src.cruds.device.get_historical_device_data_alarm
+        Index("ix_readings_alarm", "device_id", "created_at", postgresql_where=text("is_alarm")),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    device_id = Column(UUIDType(binary=False), ForeignKey("devices.id"), primary_key=True)
+    created_at = Column(DateTime, primary_key=True)
+    temperature = Column(Float)
+    humidity = Column(Float)
+    motion = Column(Boolean)
+    is_alarm = Column(Boolean)
+    device_listening = Column(Boolean)
+
+    device = relationship("Device", back_populates="reading_data")
+
+
+# Aggregates of READINGS per device and hour/day, over readings that have both temperature and humidity.
+# Buckets touched by an ingested batch are re-aggregated, see src.cruds.device.update_reading_rollups.
+class ReadingHourly(Base, ReadingRollupMixin):
+    __tablename__ = "readings_hourly"
+
+
+class ReadingDaily(Base, ReadingRollupMixin):
+    __tablename__ = "readings_daily"
+
+
+# Latest non-null temperature, humidity and alarm of each device, with the timestamp of the reading each came from.
+# Upserted on every ingested batch so that /device-data/{device_id}/live is a primary key lookup.
+class LatestReading(Base):
+    __tablename__ = "latest_readings"
+
+    device_id = Column(UUIDType(binary=False), ForeignKey("devices.id"), primary_key=True)
+    temperature = Column(Float)
+    temperature_at = Column(DateTime)
+    humidity = Column(Float)
+    humidity_at = Column(DateTime)
+    is_alarm = Column(Boolean)
+    is_alarm_at = Column(DateTime)
+
+
+# Legacy per-sensor tables (TEMPERATURE, HUMIDITY, MOTION, BUTTON, ALARM).
+# Readings are written to READINGS, these are kept so that `migrate_db readings` can backfill from them.
 class Temperature(Base, CreatedNoDefaultTimeStampMixin):
     __tablename__ = "temperature"
 
@@ -99,6 +164,8 @@ class Motion(Base, CreatedNoDefaultTimeStampMixin):
 
 class Notification(Base, CreatedNoDefaultTimeStampMixin):
     __tablename__ = "notifications"
+    # Notification pages, see src.cruds.notification.find_device_notification_by_user_id
+    __table_args__ = (Index("ix_notifications_device_id_created_at_id", "device_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     content_type = Column(String(20))
@@ -6,12 +6,16 @@ import src.cruds.device as device_cruds
 import src.cruds.register as register_cruds
 import src.cruds.user as user_cruds
 import src.schemas.auth as auth_schema
-from src.auth.utils import create_access_token, create_refresh_access_token, oauth2_scheme, verify_access_token, verify_hash_password
-from src.db.db import get_db
+from src.auth.user_cache import UserExistenceCache
+from src.auth.utils import create_access_token, create_refresh_access_token, oauth2_scheme, verify_access_token, verify_hash_password_async
+from src.constants.common import USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS, USER_NEGATIVE_CACHE_TTL_SECONDS
+from src.db.db import get_db, primary_read_session
 from src.errors.errors import (
     IncorrectEmailOrPasswordException,
     SerialNumberAlreadyRegisteredException,
     SerialNumberNotFoundException,
+    TokenExpiredException,
+    TokenValidationFailException,
     UserAlreadyExistsException,
     UserNotFoundException,
     error_response,
@@ -21,14 +25,18 @@ from src.schemas.user import UserCreate
 
 router = APIRouter()
 
+# Existence of the users of valid tokens, looked up on the primary on a miss
+user_cache = UserExistenceCache(primary_read_session, USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS, USER_NEGATIVE_CACHE_TTL_SECONDS)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> auth_schema.SystemUser:
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> auth_schema.SystemUser:
     """
     Verify the token and return the current user info.
 
+    The existence of the user is cached in user_cache, so most requests do not touch the database here.
+
     Args:
         token (str): Token. Defaults to Depends(oauth2_scheme).
-        db (AsyncSession): AsyncSession. Defaults to Depends(get_db).
 
     Raises:
         UserNotFoundException: User not found.
@@ -36,9 +44,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
     Returns:
         auth_schema.SystemUser: User info object.
     """
-    token_payload = verify_access_token(token, db)
-    count = await user_cruds.count_user_by_user_id(db, token_payload.user_id)
-    if count == 0:
+    token_payload = verify_access_token(token)
+    if not await user_cache.exists(token_payload.user_id):
         raise UserNotFoundException()
     return auth_schema.SystemUser(user_id=token_payload.user_id)
 
@@ -70,6 +77,8 @@ async def signup(user: UserCreate, db: AsyncSession = Depends(get_db)):
     user_id = await user_cruds.create_user(db, user)
     await device_cruds.create_device(db, device_id, user._latitude, user._longitude, user_id)
     await register_cruds.register_device_by_device_id(db, device_id)
+    await db.commit()
+    user_cache.invalidate(user_id)
 
 
 @router.post(
@@ -89,7 +98,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSessi
 
     # Check the password is valid
     user_id, user_password = user
-    if not verify_hash_password(form_data.password, user_password):
+    if not await verify_hash_password_async(form_data.password, user_password):
         raise IncorrectEmailOrPasswordException()
 
     data = {"user_id": user_id}
@@ -97,3 +106,18 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSessi
         "access_token": create_access_token(data),
         "refresh_token": create_refresh_access_token(data),
     }
+
+
+@router.get(
+    "/auth/metrics",
+    responses=error_response(
+        [
+            UserNotFoundException,
+            TokenValidationFailException,
+            TokenExpiredException,
+        ]
+    ),
+    response_model=auth_schema.UserCacheMetrics,
+)
+async def read_user_cache_metrics(current_user: auth_schema.SystemUser = Depends(get_current_user)):
+    return user_cache.metrics()
@@ -0,0 +1,75 @@
+import asyncio
+from typing import Dict, Tuple
+
+from fastapi import APIRouter, Depends
+
+import src.cruds.user as user_crud
+import src.schemas.auth as auth_schema
+import src.schemas.dashboard as dashboard_schema
+from src.db.db import read_db
+from src.errors.errors import (
+    TokenExpiredException,
+    TokenValidationFailException,
+    UserNotFoundException,
+    WeatherAPIRequestError,
+    WeatherLangSupportException,
+    error_response,
+)
+from src.routers.auth import get_current_user
+from src.utils.weather import fetch_weather
+
+router = APIRouter()
+
+
+@router.get(
+    "/dashboard",
+    response_model=dashboard_schema.Dashboard,
+    responses=error_response(
+        [
+            UserNotFoundException,
+            TokenValidationFailException,
+            TokenExpiredException,
+            WeatherLangSupportException,
+        ]
+    ),
+)
+async def read_dashboard(
+    current_user: auth_schema.SystemUser = Depends(get_current_user),
+    lang: str = "en",
+    weather: bool = True,
+):
+    if not (lang == "en" or lang == "ja"):
+        raise WeatherLangSupportException()
+
+    # The session is closed before the weather lookups, so that its connection is not held while they wait.
+    async with read_db() as db:
+        rows = await user_crud.find_dashboard_devices_by_user_id(db, current_user.user_id)
+
+    # One lookup per distinct location, all running concurrently.
+    weather_by_location: Dict[Tuple[float, float], dict | None] = {}
+    if weather:
+        locations = list({(row[2], row[3]) for row in rows if row[2] is not None and row[3] is not None})
+        results = await asyncio.gather(*(fetch_weather(lat, lon, lang) for lat, lon in locations), return_exceptions=True)
+        for location, result in zip(locations, results):
+            if isinstance(result, WeatherAPIRequestError):
+                result = None
+            elif isinstance(result, BaseException):
+                raise result
+            weather_by_location[location] = result
+
+    devices = []
+    for row in rows:
+        devices.append(
+            dashboard_schema.DashboardDevice(
+                device_id=row[0],
+                device_name=row[1],
+                temp_upper_limit=row[4],
+                temp_lower_limit=row[5],
+                temperature_celsius=row[6],
+                humidity=row[7],
+                alarm=row[8],
+                unread_notifications=row[9],
+                weather=weather_by_location.get((row[2], row[3])),
+            )
+        )
+    return dashboard_schema.Dashboard(devices=devices)
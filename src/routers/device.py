@@ -1,18 +1,47 @@
-from typing import List
+import json
+from datetime import datetime
+from typing import AsyncIterator, List
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Header, Path, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError, parse_obj_as
+from pydantic.error_wrappers import ErrorWrapper
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.cruds.device as device_crud
 import src.schemas.auth as auth_schema
 import src.schemas.device as device_schema
-from src.constants.common import RE_UUID
-from src.db.db import get_db
-from src.errors.errors import TokenExpiredException, TokenValidationFailException, UserNotFoundException, error_response
+from src.constants.common import DEFAULT_PAGE_SIZE, HISTORICAL_MAX_POINTS, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, RE_UUID
+from src.db.db import get_read_db
+from src.errors.errors import (
+    DeviceDataDecodeError,
+    DeviceDataNotStoredError,
+    ExportFormatNotAvailableError,
+    HistoricalRangeTooLargeError,
+    IngestionBufferFullError,
+    IngestionOverloadedError,
+    InvalidCursorError,
+    InvalidHistoricalRangeError,
+    TokenExpiredException,
+    TokenValidationFailException,
+    UnsupportedMediaTypeError,
+    UserNotFoundException,
+    error_response,
+)
+from src.export.service import EXPORT_FORMATS, parquet_available, stream_export
+from src.historical.analytics import add_historical_statistics
+from src.historical.service import METRICS, get_historical_series
+from src.ingestion.service import admit_ingestion, store_readings, store_readings_stream
 from src.routers.auth import get_current_user
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.json_stream import iter_json_array
+from src.utils.packed import PACKED_CONTENT_TYPE, unpack_device_data
 
 router = APIRouter()
 
+STATS_DESCRIPTION = "Add mean, standard deviation, percentiles and time in range of the readings of each point"
+
 
 @router.get(
     "/device-data/{device_id}/live",
@@ -28,13 +57,58 @@ router = APIRouter()
 async def read_device_data(
     current_user: auth_schema.SystemUser = Depends(get_current_user),
     device_id: str = Path(regex=RE_UUID),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     # TODO Check device exists, and owned by user.
     result = await device_crud.get_latest_device_data(db, device_id)
     return device_schema.Device(temperature_celsius=result[0], humidity=result[1], alarm=result[2])
 
 
+@router.get(
+    "/device-data/{device_id}/historical",
+    responses=error_response(
+        [
+            UserNotFoundException,
+            TokenValidationFailException,
+            TokenExpiredException,
+            InvalidHistoricalRangeError,
+            HistoricalRangeTooLargeError,
+        ]
+    ),
+    response_model=device_schema.DeviceHistoricalSeries,
+    response_model_exclude_none=True,
+)
+async def read_device_data_historical(
+    current_user: auth_schema.SystemUser = Depends(get_current_user),
+    device_id: str = Path(regex=RE_UUID),
+    start: datetime = Query(alias="from", description="Start of the range, inclusive"),
+    end: datetime | None = Query(None, alias="to", description="End of the range, exclusive. Defaults to now."),
+    bucket: str = Query("auto", regex="^(auto|raw|hour|day)$", description="Source of the points. `auto` chooses by the length of the range."),
+    metrics: str = Query(",".join(METRICS), regex=f"^({'|'.join(METRICS)})(,({'|'.join(METRICS)}))*$", description="Comma-separated metrics"),
+    downsample: str = Query("lttb", regex="^(lttb|minmax)$", description="Downsampling of raw readings"),
+    max_points: int = Query(HISTORICAL_MAX_POINTS, ge=2, le=HISTORICAL_MAX_POINTS, description="Maximum number of points"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    start = to_naive_local(start)
+    end = to_naive_local(end) if end is not None else datetime.now()
+    return await get_historical_series(db, device_id, start, end, bucket, metrics.split(","), downsample, max_points)
+
+
+def to_naive_local(value: datetime) -> datetime:
+    """
+    Convert a timezone-aware datetime to naive local time, which READINGS timestamps are stored in.
+
+    Args:
+        value (datetime): Datetime.
+
+    Returns:
+        datetime: Naive datetime.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
 @router.get(
     "/device-data/{device_id}/historical/day",
     responses=error_response(
@@ -45,13 +119,17 @@ async def read_device_data(
         ]
     ),
     response_model=List[device_schema.DeviceHistorical],
+    response_model_exclude_none=True,
 )
 async def read_device_data_day(
     current_user: auth_schema.SystemUser = Depends(get_current_user),
     device_id: str = Path(regex=RE_UUID),
-    db: AsyncSession = Depends(get_db),
+    stats: bool = Query(False, description=STATS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db),
 ):
     result = await device_crud.get_historical_device_data_day(db, device_id)
+    if stats:
+        result = await add_historical_statistics(db, device_id, "day", result)
     return result
 
 
@@ -65,13 +143,17 @@ async def read_device_data_day(
         ]
     ),
     response_model=List[device_schema.DeviceHistorical],
+    response_model_exclude_none=True,
 )
 async def read_device_data_week(
     current_user: auth_schema.SystemUser = Depends(get_current_user),
     device_id: str = Path(regex=RE_UUID),
-    db: AsyncSession = Depends(get_db),
+    stats: bool = Query(False, description=STATS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db),
 ):
     result = await device_crud.get_historical_device_data_week(db, device_id)
+    if stats:
+        result = await add_historical_statistics(db, device_id, "week", result)
     return result
 
 
@@ -85,13 +167,17 @@ async def read_device_data_week(
         ]
     ),
     response_model=List[device_schema.DeviceHistorical],
+    response_model_exclude_none=True,
 )
 async def read_device_data_month(
     current_user: auth_schema.SystemUser = Depends(get_current_user),
     device_id: str = Path(regex=RE_UUID),
-    db: AsyncSession = Depends(get_db),
+    stats: bool = Query(False, description=STATS_DESCRIPTION),
+    db: AsyncSession = Depends(get_read_db),
 ):
     result = await device_crud.get_historical_device_data_month(db, device_id)
+    if stats:
+        result = await add_historical_statistics(db, device_id, "month", result)
     return result
 
 
@@ -102,6 +188,7 @@ async def read_device_data_month(
             UserNotFoundException,
             TokenValidationFailException,
             TokenExpiredException,
+            InvalidCursorError,
         ]
     ),
     response_model=List[device_schema.DeviceHistoricalAlarm],
@@ -109,10 +196,58 @@ async def read_device_data_month(
 async def read_device_data_alarm(
     current_user: auth_schema.SystemUser = Depends(get_current_user),
     device_id: str = Path(regex=RE_UUID),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description=f"`{NEXT_CURSOR_HEADER}` header of the previous page"),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    result = await device_crud.get_historical_device_data_alarm(db, device_id)
-    return result
+    after = None
+    if cursor is not None:
+        try:
+            after, _ = decode_cursor(cursor)
+        except ValueError:
+            raise InvalidCursorError()
+
+    result, next_after = await device_crud.get_historical_device_data_alarm(db, device_id, limit, after)
+    headers = {NEXT_CURSOR_HEADER: encode_cursor(next_after)} if next_after is not None else None
+    # Rows are already in the response shape, returning a response skips validating them against response_model.
+    return JSONResponse(content=result, headers=headers)
+
+
+@router.get(
+    "/device-data/{device_id}/export",
+    responses=error_response(
+        [
+            UserNotFoundException,
+            TokenValidationFailException,
+            TokenExpiredException,
+            InvalidHistoricalRangeError,
+            ExportFormatNotAvailableError,
+        ]
+    ),
+    response_class=StreamingResponse,
+)
+async def export_device_data(
+    current_user: auth_schema.SystemUser = Depends(get_current_user),
+    device_id: str = Path(regex=RE_UUID),
+    start: datetime = Query(alias="from", description="Start of the range, inclusive"),
+    end: datetime | None = Query(None, alias="to", description="End of the range, exclusive. Defaults to now."),
+    export_format: str = Query("csv", alias="format", regex=f"^({'|'.join(EXPORT_FORMATS)})$", description="File format"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    # TODO Check device exists, and owned by user.
+    start = to_naive_local(start)
+    end = to_naive_local(end) if end is not None else datetime.now()
+    if start >= end:
+        raise InvalidHistoricalRangeError()
+    if export_format == "parquet" and not parquet_available():
+        raise ExportFormatNotAvailableError()
+
+    filename = f"{device_id}_{start:%Y%m%dT%H%M%S}_{end:%Y%m%dT%H%M%S}.{export_format}"
+    return StreamingResponse(
+        stream_export(db, device_id, start, end, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -129,17 +264,160 @@ async def read_device_data_alarm(
 async def read_device_name(
     current_user: auth_schema.SystemUser = Depends(get_current_user),
     device_id: str = Path(regex=RE_UUID),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     return await device_crud.find_device_name_by_device_id(db, device_id)
 
 
-@router.post("/device-data/{device_id}")
+async def read_device_data_records(request: Request, device_id: str = Path(regex=RE_UUID)) -> List[tuple]:
+    """
+    Decode the device data body into reading records, negotiated by Content-Type.
+
+    - application/json: a list of DeviceDataCreate, or DeviceDataColumns.
+    - application/x-ondo-packed: packed binary samples, see src.utils.packed.
+
+    Args:
+        request (Request): Request.
+        device_id (str): Device id.
+
+    Raises:
+        UnsupportedMediaTypeError: Content-Type is not supported.
+        DeviceDataDecodeError: Body cannot be decoded.
+        RequestValidationError: Body does not match the schema.
+
+    Returns:
+        List[tuple]: Reading records in the order of READING_COLUMNS.
+    """
+    content_type = request.headers.get("content-type", "application/json").split(";")[0].strip().lower()
+    body = await request.body()
+
+    if content_type == PACKED_CONTENT_TYPE:
+        try:
+            columns = unpack_device_data(body)
+        except ValueError:
+            raise DeviceDataDecodeError()
+        return device_crud.columns_to_reading_records(device_id, device_schema.DeviceDataColumns.construct(**columns))
+
+    if content_type != "application/json":
+        raise UnsupportedMediaTypeError()
+
+    try:
+        json_body = json.loads(body)
+    except ValueError:
+        raise DeviceDataDecodeError()
+    try:
+        if isinstance(json_body, dict):
+            return device_crud.columns_to_reading_records(device_id, device_schema.DeviceDataColumns.parse_obj(json_body))
+        return device_crud.to_reading_records(device_id, parse_obj_as(List[device_schema.DeviceDataCreate], json_body))
+    except ValidationError as e:
+        raise RequestValidationError([ErrorWrapper(e, loc=("body",))], body=json_body)
+
+
+@router.post(
+    "/device-data/{device_id}",
+    responses=error_response(
+        [
+            DeviceDataDecodeError,
+            UnsupportedMediaTypeError,
+            IngestionOverloadedError,
+            IngestionBufferFullError,
+            DeviceDataNotStoredError,
+        ]
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "anyOf": [
+                            {"type": "array", "items": device_schema.DeviceDataCreate.schema()},
+                            device_schema.DeviceDataColumns.schema(),
+                        ]
+                    }
+                },
+                PACKED_CONTENT_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            },
+        }
+    },
+)
 async def create_device_data(
-    device_data_list: List[device_schema.DeviceDataCreate],
     device_id: str = Path(regex=RE_UUID),
-    db: AsyncSession = Depends(get_db),
+    _: None = Depends(admit_ingestion),
+    records: List[tuple] = Depends(read_device_data_records),
+    batch_id: str | None = Header(
+        None,
+        alias="X-Batch-Id",
+        max_length=64,
+        description="Client batch id. The response waits until the batch is stored, and a batch replayed with the same id is skipped.",
+    ),
 ) -> None:
     # TODO Need to authenticate before fetching the current data
     # TODO Check device exists, and owned by user.
-    await device_crud.create_device_data(db, device_id, device_data_list)
+    count = await store_readings(device_id, records, batch_id=batch_id)
+    if batch_id is not None and records and count == 0:
+        raise DeviceDataNotStoredError()
+
+
+async def stream_device_data(request: Request) -> AsyncIterator[device_schema.DeviceDataCreate]:
+    """
+    Parse and validate a JSON array of DeviceDataCreate while the body is being received.
+
+    Args:
+        request (Request): Request.
+
+    Raises:
+        DeviceDataDecodeError: Body is not a JSON array.
+        RequestValidationError: An item does not match the schema.
+
+    Yields:
+        device_schema.DeviceDataCreate: Device data.
+    """
+    items = iter_json_array(request.stream())
+    index = 0
+    while True:
+        try:
+            item = await items.__anext__()
+        except StopAsyncIteration:
+            return
+        except ValueError:
+            raise DeviceDataDecodeError()
+        try:
+            device_data = device_schema.DeviceDataCreate.parse_obj(item)
+        except ValidationError as e:
+            raise RequestValidationError([ErrorWrapper(e, loc=("body", index))])
+        yield device_data
+        index += 1
+
+
+@router.post(
+    "/device-data/{device_id}/backfill",
+    responses=error_response(
+        [
+            DeviceDataDecodeError,
+            IngestionOverloadedError,
+        ]
+    ),
+    response_model=device_schema.DeviceDataBackfill,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"type": "array", "items": device_schema.DeviceDataCreate.schema()}}},
+        }
+    },
+)
+async def create_device_data_backfill(
+    request: Request,
+    device_id: str = Path(regex=RE_UUID),
+    _: None = Depends(admit_ingestion),
+):
+    """
+    Store a large batch of device data, such as a backfill after an outage.
+
+    The body is the same as POST /device-data/{device_id}, but it is parsed and written in chunks while it is received.
+    Chunks written before an invalid item stay stored. Retrying the whole upload is safe.
+    """
+    # TODO Need to authenticate before fetching the current data
+    # TODO Check device exists, and owned by user.
+    count = await store_readings_stream(device_id, stream_device_data(request))
+    return device_schema.DeviceDataBackfill(count=count)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+
+import src.schemas.auth as auth_schema
+import src.schemas.ingestion as ingestion_schema
+from src.errors.errors import TokenExpiredException, TokenValidationFailException, UserNotFoundException, error_response
+from src.ingestion.service import ingestion_admission, ingestion_buffer
+from src.routers.auth import get_current_user
+
+router = APIRouter()
+
+
+@router.get(
+    "/ingestion/metrics",
+    responses=error_response(
+        [
+            UserNotFoundException,
+            TokenValidationFailException,
+            TokenExpiredException,
+        ]
+    ),
+    response_model=ingestion_schema.IngestionMetrics,
+)
+async def read_ingestion_metrics(current_user: auth_schema.SystemUser = Depends(get_current_user)):
+    return {
+        **ingestion_buffer.metrics(),
+        "in_flight": ingestion_admission.in_flight,
+        "max_in_flight": ingestion_admission.max_in_flight,
+        "rejected": ingestion_admission.rejected,
+    }
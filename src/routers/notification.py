@@ -1,16 +1,34 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from twilio.rest import Client
 
 import src.cruds.notification as notification_crud
 import src.schemas.auth as auth_schema
 import src.schemas.notification as notification_schema
-from src.constants.common import RE_UUID, TWILIO_AUTH_TOKEN, TWILIO_SID, TWILIO_VERIFIED_NUMBER, TWILIO_VIRTUAL_NUMBER
-from src.db.db import get_db
-from src.errors.errors import IncorrectUserUpdateError, TokenExpiredException, TokenValidationFailException, UserNotFoundException, error_response
+from src.constants.common import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    RE_UUID,
+    TWILIO_AUTH_TOKEN,
+    TWILIO_SID,
+    TWILIO_VERIFIED_NUMBER,
+    TWILIO_VIRTUAL_NUMBER,
+)
+from src.db.db import get_db, get_read_db
+from src.errors.errors import (
+    IncorrectUserUpdateError,
+    InvalidCursorError,
+    TokenExpiredException,
+    TokenValidationFailException,
+    UserNotFoundException,
+    error_response,
+)
 from src.routers.auth import get_current_user
+from src.utils.cursor import decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -49,12 +67,30 @@ async def device_alarm_on(
             UserNotFoundException,
             TokenValidationFailException,
             TokenExpiredException,
+            InvalidCursorError,
         ]
     ),
     response_model=List[notification_schema.DeviceNotificationData],
 )
-async def read_device_data_notifications(current_user: auth_schema.SystemUser = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
-    return await notification_crud.find_device_notification_by_user_id(db, current_user.user_id)
+async def read_device_data_notifications(
+    current_user: auth_schema.SystemUser = Depends(get_current_user),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description=f"`{NEXT_CURSOR_HEADER}` header of the previous page"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    keyset = None
+    if cursor is not None:
+        try:
+            keyset = decode_cursor(cursor)
+        except ValueError:
+            raise InvalidCursorError()
+        if keyset[1] is None:
+            raise InvalidCursorError()
+
+    result, next_keyset = await notification_crud.find_device_notification_by_user_id(db, current_user.user_id, limit, keyset)
+    headers = {NEXT_CURSOR_HEADER: encode_cursor(*next_keyset)} if next_keyset is not None else None
+    # Rows are already in the response shape, returning a response skips validating them against response_model.
+    return JSONResponse(content=result, headers=headers)
 
 
 @router.put(
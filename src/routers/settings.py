@@ -6,11 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import src.cruds.settings as settings_cruds
 import src.schemas.auth as auth_schema
 import src.schemas.settings as settings_schema
-from src.auth.utils import verify_hash_password
+from src.auth.utils import verify_hash_password_async
 from src.constants.common import RE_UUID
-from src.db.db import get_db
+from src.db.db import get_db, get_read_db
 from src.errors.errors import IncorrectOldPasswordError, TokenExpiredException, TokenValidationFailException, UserNotFoundException, error_response
-from src.routers.auth import get_current_user
+from src.ingestion.service import threshold_monitor
+from src.routers.auth import get_current_user, user_cache
 
 router = APIRouter()
 
@@ -26,7 +27,7 @@ router = APIRouter()
         ]
     ),
 )
-async def read_user_settings(current_user: auth_schema.SystemUser = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def read_user_settings(current_user: auth_schema.SystemUser = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
     return await settings_cruds.find_user_settings_by_user_id(db, current_user.user_id)
 
 
@@ -41,7 +42,7 @@ async def read_user_settings(current_user: auth_schema.SystemUser = Depends(get_
         ]
     ),
 )
-async def read_device_settings(current_user: auth_schema.SystemUser = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def read_device_settings(current_user: auth_schema.SystemUser = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
     return await settings_cruds.find_device_settings_by_user_id(db, current_user.user_id)
 
 
@@ -62,6 +63,9 @@ async def update_device_settings(
     db: AsyncSession = Depends(get_db),
 ):
     await settings_cruds.update_device_settings(db, device, device_id)
+    # Commit first, so that ingestion cannot cache the previous limits again after the invalidation.
+    await db.commit()
+    threshold_monitor.invalidate(device_id)
 
 
 @router.put(
@@ -80,7 +84,9 @@ async def update_user_settings(
 ):
     if user.old_password is not None:
         password = await settings_cruds.find_user_password_by_user_id(db, current_user.user_id)
-        if not verify_hash_password(user.old_password, password):
+        if not await verify_hash_password_async(user.old_password, password):
             raise IncorrectOldPasswordError()
 
     await settings_cruds.update_user_settings(db, user, current_user.user_id)
+    await db.commit()
+    user_cache.invalidate(current_user.user_id)
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import src.cruds.user as user_crud
 import src.schemas.auth as auth_schema
 import src.schemas.user as user_schema
-from src.db.db import get_db
+from src.db.db import get_read_db
 from src.errors.errors import TokenExpiredException, TokenValidationFailException, UserNotFoundException, error_response
 from src.routers.auth import get_current_user
 
@@ -24,5 +24,5 @@ router = APIRouter()
         ]
     ),
 )
-async def read_user_devices(current_user: auth_schema.SystemUser = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+async def read_user_devices(current_user: auth_schema.SystemUser = Depends(get_current_user), db: AsyncSession = Depends(get_read_db)):
     return await user_crud.find_device_id_by_user_id(db, current_user.user_id)
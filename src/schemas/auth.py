@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class TokenData(BaseModel):
@@ -13,3 +13,9 @@ class TokenPayload(BaseModel):
 
 class SystemUser(BaseModel):
     user_id: int
+
+
+class UserCacheMetrics(BaseModel):
+    size: int = Field(example=120, description="Number of cached user ids")
+    hits: int = Field(example=9800, description="Number of lookups answered from the cache")
+    misses: int = Field(example=200, description="Number of lookups that queried the database")
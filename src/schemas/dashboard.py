@@ -0,0 +1,21 @@
+from typing import List
+
+from pydantic import UUID4, BaseModel, Field
+
+from src.schemas.weather import Weather
+
+
+class DashboardDevice(BaseModel):
+    device_id: UUID4 = Field(example="a7382f5c-3326-4cf8-b717-549affe1c2eb", description="Device id")
+    device_name: str | None = Field(example="Roppongi_Device", description="Device name")
+    temperature_celsius: float | None = Field(example="25.1", description="Latest temperature (Celsius)")
+    humidity: float | None = Field(example="87", description="Latest humidity (Percentage)")
+    alarm: bool | None = Field(example="True", description="Latest alarm status")
+    temp_upper_limit: float | None = Field(example="32.9", description="Upper temperature limit (Celsius)")
+    temp_lower_limit: float | None = Field(example="29.2", description="Lower temperature limit (Celsius)")
+    unread_notifications: int = Field(example=3, description="Number of unread notifications")
+    weather: Weather | None = Field(description="Current weather at the device. Null if it could not be fetched.")
+
+
+class Dashboard(BaseModel):
+    devices: List[DashboardDevice]
@@ -1,6 +1,9 @@
 from datetime import datetime
+from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, root_validator
+
+from src.utils.columnar import to_bool_array, to_datetime_array, to_float_array
 
 
 class Device(BaseModel):
@@ -21,6 +24,35 @@ class DeviceHistorical(BaseModel):
     max_humid: float = Field(example="87.0", description="Max Humidity")
     min_humid: float = Field(example="87.0", description="Min Humidity")
     date: str = Field(example="2022-07-01", description="Created Day")
+    # Returned with `stats=true`, see src.historical.analytics
+    avg_temp: float | None = Field(None, example="24.8", description="Mean Temperature (Celsius)")
+    std_temp: float | None = Field(None, example="0.4", description="Standard Deviation of Temperature")
+    p5_temp: float | None = Field(None, example="24.1", description="5th Percentile of Temperature")
+    p50_temp: float | None = Field(None, example="24.8", description="Median Temperature")
+    p95_temp: float | None = Field(None, example="25.0", description="95th Percentile of Temperature")
+    avg_humid: float | None = Field(None, example="85.2", description="Mean Humidity")
+    std_humid: float | None = Field(None, example="1.3", description="Standard Deviation of Humidity")
+    p5_humid: float | None = Field(None, example="83.0", description="5th Percentile of Humidity")
+    p50_humid: float | None = Field(None, example="85.5", description="Median Humidity")
+    p95_humid: float | None = Field(None, example="86.9", description="95th Percentile of Humidity")
+    temp_in_range: float | None = Field(
+        None, example="0.97", description="Share of readings within the temperature limits of the device, if it has any limit"
+    )
+
+
+class DeviceHistoricalPoint(BaseModel):
+    time: datetime = Field(example="2022-07-01 12:00:00", description="Timestamp of the reading, or start of the bucket")
+    temperature_min: float | None = Field(example="25.1", description="Min Temperature (Celsius)")
+    temperature_max: float | None = Field(example="25.1", description="Max Temperature (Celsius)")
+    temperature_avg: float | None = Field(example="25.1", description="Average Temperature (Celsius)")
+    humidity_min: float | None = Field(example="87.0", description="Min Humidity")
+    humidity_max: float | None = Field(example="87.0", description="Max Humidity")
+    humidity_avg: float | None = Field(example="87.0", description="Average Humidity")
+
+
+class DeviceHistoricalSeries(BaseModel):
+    bucket: str = Field(example="hour", description="Source of the points: raw, hour or day")
+    points: List[DeviceHistoricalPoint]
 
 
 class DeviceHistoricalAlarm(BaseModel):
@@ -36,3 +68,36 @@ class DeviceDataCreate(BaseModel):
     alarm: bool = Field(example=True, description="Alarmed")
     button: bool = Field(example=True, description="Button pressed")
     created_at: datetime = Field(example="2022-07-01 12:23:45", description="Created timestamp")
+
+
+class DeviceDataColumns(BaseModel):
+    """
+    Column-oriented batch of device data.
+
+    Each column is validated in bulk and converted to a NumPy array.
+    """
+
+    temperature_c: list = Field(example=[25.1, 25.3], description="Temperature (Celsius)")
+    humidity: list = Field(example=[87, 86.5], description="Humidity")
+    motion: list = Field(example=[True, False], description="Motion detected")
+    alarm: list = Field(example=[False, False], description="Alarmed")
+    button: list = Field(example=[False, True], description="Button pressed")
+    created_at: list = Field(example=["2022-07-01 12:23:45", "2022-07-01 12:24:45"], description="Created timestamp")
+
+    @root_validator(skip_on_failure=True)
+    def validate_all(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        values["temperature_c"] = to_float_array(values["temperature_c"])
+        values["humidity"] = to_float_array(values["humidity"])
+        values["motion"] = to_bool_array(values["motion"])
+        values["alarm"] = to_bool_array(values["alarm"])
+        values["button"] = to_bool_array(values["button"])
+        values["created_at"] = to_datetime_array(values["created_at"])
+
+        lengths = {len(v) for v in values.values()}
+        if len(lengths) != 1:
+            raise ValueError("All columns must have the same length")
+        return values
+
+
+class DeviceDataBackfill(BaseModel):
+    count: int = Field(example=86400, description="Number of readings stored")
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+
+class IngestionMetrics(BaseModel):
+    queue_depth: int = Field(example=1200, description="Number of records waiting to be flushed")
+    max_rows: int = Field(example=200000, description="Maximum number of records the buffer can hold")
+    flush_count: int = Field(example=42, description="Number of flushes")
+    flushed_rows: int = Field(example=250000, description="Number of records written")
+    dropped_rows: int = Field(example=0, description="Number of records dropped because they could not be written")
+    flushed_rows_per_second: float = Field(example=5000.0, description="Number of records written per second over the last 10 seconds")
+    last_flush_seconds: float = Field(example=0.012, description="Latency of the last flush (seconds)")
+    max_flush_seconds: float = Field(example=0.2, description="Max latency of a flush (seconds)")
+    avg_flush_seconds: float = Field(example=0.015, description="Average latency of a flush (seconds)")
+    in_flight: int = Field(example=3, description="Number of ingestion requests in flight")
+    max_in_flight: int = Field(example=64, description="Maximum number of ingestion requests in flight")
+    rejected: int = Field(example=0, description="Number of ingestion requests rejected because too many were in flight or the buffer was full")
@@ -58,3 +58,21 @@ def generate_historic_alarm_data() -> Dict[str, List]:
         result["alarm"].append(alarm_obj)
 
     return result
+
+
+def generate_historic_reading_data() -> Dict[str, List]:
+
+    readings: Dict[str, Dict] = {}
+
+    generated_data_set = generate_historic_temp_data()
+    for temp_obj, humid_obj in zip(generated_data_set["temp"], generated_data_set["humid"]):
+        reading = readings.setdefault(temp_obj["created_at"], {"created_at": temp_obj["created_at"], "device_id": UUID})
+        reading["temperature"] = temp_obj["temperature"]
+        reading["humidity"] = humid_obj["humidity"]
+
+    generated_data_set_alarm = generate_historic_alarm_data()
+    for alarm_obj in generated_data_set_alarm["alarm"]:
+        reading = readings.setdefault(alarm_obj["created_at"], {"created_at": alarm_obj["created_at"], "device_id": UUID})
+        reading["is_alarm"] = alarm_obj["is_alarm"]
+
+    return {"reading": list(readings.values())}
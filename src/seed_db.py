@@ -7,8 +7,9 @@ from sqlalchemy.orm import sessionmaker
 
 from src.auth.utils import create_hash_password
 from src.constants.common import SYNC_DATABASE_URL
-from src.models.models import Alarm, Button, Device, Humidity, Motion, Notification, Register, Temperature, User
-from src.seed.generate_seed_data import generate_historic_alarm_data, generate_historic_temp_data
+from src.migrate_db import migrate_latest_readings, migrate_reading_rollups
+from src.models.models import Device, Notification, Reading, Register, User
+from src.seed.generate_seed_data import generate_historic_reading_data
 
 engine = create_engine(SYNC_DATABASE_URL, echo=True)
 
@@ -62,19 +63,12 @@ data_set.append(
 )
 
 
-generated_data_set = generate_historic_temp_data()
+generated_data_set = generate_historic_reading_data()
 
-for row in generated_data_set.get("temp"):
-    data_set.append(Temperature(**row))
+for row in generated_data_set.get("reading"):
+    data_set.append(Reading(**row))
 
-for row in generated_data_set.get("humid"):
-    data_set.append(Humidity(**row))
-
-data_set.append(Motion(motion=True, created_at=seed_time, device_id=uuid))
-
-data_set.append(Button(device_listening=True, created_at=seed_time, device_id=uuid))
-
-generated_data_set_alarm = generate_historic_alarm_data()
+data_set.append(Reading(motion=True, device_listening=True, created_at=seed_time, device_id=uuid))
 
 for i in range(1, 21):
     notification_time = get_date()
@@ -101,9 +95,9 @@ for i in range(1, 21):
         )
     )
 
-for row in generated_data_set_alarm.get("alarm"):
-    data_set.append(Alarm(**row))
-
 session.add_all(data_set)
 
 session.commit()
+
+migrate_latest_readings()
+migrate_reading_rollups()
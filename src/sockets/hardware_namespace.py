@@ -1,6 +1,16 @@
-from typing import Dict
+import re
+from typing import Dict, List
 
+import asyncpg
 import socketio
+from pydantic import ValidationError, parse_obj_as
+from sqlalchemy.exc import SQLAlchemyError
+
+import src.cruds.device as device_crud
+import src.schemas.device as device_schema
+from src.constants.common import RE_UUID
+from src.errors.errors import APIError, IngestionBufferFullError, IngestionOverloadedError
+from src.ingestion.service import ingestion_admission, store_readings
 
 # Key -> Device id
 # Value -> Socket id
@@ -24,3 +34,41 @@ class HardwareNameSpace(socketio.AsyncNamespace):
         device_id = data["device_id"]
         hardware_devices[device_id] = sid
         print("Register device id")
+
+    async def on_device_data(self, sid, data) -> dict:
+        """
+        Store device data sent over the socket.
+
+        The payload is `{"device_id": str, "data": [DeviceDataCreate, ...], "batch_id": str | None}`,
+        the same batch as POST /device-data/{device_id}.
+
+        Returns:
+            dict: Ack with the persisted count, `{"count": int}`, or `{"error": str}`.
+                `retry_after` (seconds) is added when the server is overloaded.
+        """
+        device_id = data.get("device_id") if isinstance(data, dict) else None
+        if not isinstance(device_id, str) or re.fullmatch(RE_UUID, device_id) is None:
+            return {"error": "Device id is not valid"}
+
+        batch_id = data.get("batch_id")
+        if batch_id is not None and not isinstance(batch_id, str):
+            return {"error": "Batch id is not valid"}
+
+        try:
+            device_data_list = parse_obj_as(List[device_schema.DeviceDataCreate], data.get("data"))
+        except ValidationError as e:
+            return {"error": str(e)}
+
+        records = device_crud.to_reading_records(device_id, device_data_list)
+        try:
+            async with ingestion_admission.admit():
+                count = await store_readings(device_id, records, wait=True, batch_id=batch_id)
+        except (IngestionOverloadedError, IngestionBufferFullError) as e:
+            return {"error": e.detail, "retry_after": int(e.headers["Retry-After"])}
+        except APIError as e:
+            return {"error": e.detail}
+        except (SQLAlchemyError, asyncpg.PostgresError, OSError) as e:
+            # TODO Replace with logger
+            print(f"Failed to store device data of {device_id}: {e}")
+            return {"error": "Device data could not be stored"}
+        return {"count": count}
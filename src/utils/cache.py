@@ -0,0 +1,123 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+
+class LRUSet:
+    """
+    Set of keys bounded to `maxsize` entries. The least recently added key is evicted first.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._keys: OrderedDict[Hashable, None] = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Add the key.
+
+        Args:
+            key (Hashable): Key.
+
+        Returns:
+            bool: True if the key was added. False if it was already present.
+        """
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+        return True
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove the key if present.
+
+        Args:
+            key (Hashable): Key.
+        """
+        self._keys.pop(key, None)
+
+
+class TTLCache:
+    """
+    Mapping of keys to values that expire `ttl` seconds after they are set, bounded to `maxsize` entries.
+    The least recently set key is evicted first. None is a valid value, misses are told apart with `default`.
+    Lookups are counted in `hits` and `misses`.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get the value of the key if it has not expired.
+
+        Args:
+            key (Hashable): Key.
+            default (Any): Returned when the key is missing or expired. Defaults to None.
+
+        Returns:
+            Any: Value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() >= entry[0]:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Set the value of the key, expiring `ttl` seconds from now.
+
+        Args:
+            key (Hashable): Key.
+            value (Any): Value.
+            ttl (float | None): Seconds until the value expires. Defaults to the `ttl` of the cache.
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = (self._clock() + (self.ttl if ttl is None else ttl), value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove the key if present.
+
+        Args:
+            key (Hashable): Key.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every key."""
+        self._entries.clear()
+
+    def metrics(self) -> dict:
+        """
+        Get the size and lookup counters.
+
+        Returns:
+            dict: Metrics.
+        """
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,84 @@
+import numpy as np
+
+
+def to_float_array(v: list) -> np.ndarray:
+    """
+    Convert a column to a float array. Strings and booleans are rejected, not coerced.
+
+    Args:
+        v (list): Column values.
+
+    Raises:
+        ValueError: If the column is not one-dimensional finite numbers.
+
+    Returns:
+        np.ndarray: float64 array.
+    """
+    try:
+        arr = np.asarray(v)
+    except (TypeError, ValueError):
+        raise ValueError("Values must be numbers")
+    if arr.ndim != 1:
+        raise ValueError("Values must be a flat array")
+    # Booleans mixed with numbers are upcast to numbers, so they are looked for in the values themselves.
+    if arr.size and (arr.dtype.kind not in "iuf" or any(isinstance(value, (bool, np.bool_)) for value in v)):
+        raise ValueError("Values must be numbers")
+    arr = arr.astype(np.float64)
+    if not np.isfinite(arr).all():
+        raise ValueError("Values must be finite numbers")
+    return arr
+
+
+def to_bool_array(v: list) -> np.ndarray:
+    """
+    Convert a column to a bool array. Integers 0 and 1 are accepted.
+
+    Args:
+        v (list): Column values.
+
+    Raises:
+        ValueError: If the column is not one-dimensional booleans.
+
+    Returns:
+        np.ndarray: bool array.
+    """
+    arr = np.asarray(v)
+    if arr.ndim != 1:
+        raise ValueError("Values must be a flat array")
+    if arr.dtype == np.bool_:
+        return arr
+    if arr.size == 0:
+        return arr.astype(np.bool_)
+    if arr.dtype.kind in "iu" and np.isin(arr, (0, 1)).all():
+        return arr.astype(np.bool_)
+    raise ValueError("Values must be booleans")
+
+
+def to_datetime_array(v: list) -> np.ndarray:
+    """
+    Convert a column of ISO 8601 strings to a datetime array.
+
+    Strings with a UTC offset are rejected. NumPy would convert them to naive UTC,
+    while the row and packed formats store the device wall-clock time.
+
+    Args:
+        v (list): Column values.
+
+    Raises:
+        ValueError: If the column is not one-dimensional ISO 8601 strings without a UTC offset.
+
+    Returns:
+        np.ndarray: datetime64[us] array.
+    """
+    arr = np.asarray(v)
+    if arr.ndim != 1:
+        raise ValueError("Values must be a flat array")
+    if arr.size and arr.dtype.kind != "U":
+        raise ValueError("Values must be datetime strings")
+    # An offset is "Z", or a sign after the 10 characters of the date.
+    if arr.size and ((np.char.find(arr, "Z") >= 0) | (np.char.find(arr, "+", 10) >= 0) | (np.char.find(arr, "-", 10) >= 0)).any():
+        raise ValueError("Values must be datetime strings without a UTC offset")
+    try:
+        return arr.astype("datetime64[us]")
+    except ValueError:
+        raise ValueError("Values must be datetime strings")
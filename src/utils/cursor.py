@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, id: int | None = None) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor.
+
+    Args:
+        created_at (datetime): Created timestamp of the row.
+        id (int | None): Id of the row, for tables where created_at is not unique.
+
+    Returns:
+        str: URL-safe cursor.
+    """
+    payload = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int | None]:
+    """
+    Decode a cursor made by encode_cursor.
+
+    Args:
+        cursor (str): Cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        Tuple[datetime, int | None]: Created timestamp and id.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        created_at, id = payload
+        if id is not None and not isinstance(id, int):
+            raise ValueError("Cursor id must be an integer")
+        return datetime.fromisoformat(created_at), id
+    except (binascii.Error, UnicodeDecodeError, TypeError) as e:
+        raise ValueError("Malformed cursor") from e
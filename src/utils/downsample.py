@@ -0,0 +1,63 @@
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Select points of a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are split into `threshold - 2` buckets,
+    and from each bucket the point forming the largest triangle with the previously selected point
+    and the average of the next bucket is kept.
+
+    Args:
+        x (np.ndarray): Ascending x values, e.g. epoch seconds.
+        y (np.ndarray): y values.
+        threshold (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Ascending indices of the kept points.
+    """
+    n = len(x)
+    if threshold >= n or n <= 2:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1])
+
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    return indices
+
+
+def minmax_indices(y: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Select the minimum and maximum point of each of `n_bins` equal-count bins of a series.
+
+    Args:
+        y (np.ndarray): y values.
+        n_bins (int): Number of bins. At most `2 * n_bins` points are kept.
+
+    Returns:
+        np.ndarray: Ascending indices of the kept points.
+    """
+    n = len(y)
+    if n_bins * 2 >= n:
+        return np.arange(n)
+
+    indices = []
+    for positions in np.array_split(np.arange(n), max(n_bins, 1)):
+        values = y[positions]
+        indices.append(positions[np.argmin(values)])
+        indices.append(positions[np.argmax(values)])
+    return np.unique(indices)
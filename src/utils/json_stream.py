@@ -0,0 +1,91 @@
+import codecs
+import json
+from typing import Any, AsyncIterator
+
+WHITESPACE = " \t\n\r"
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes], max_item_size: int = 65536) -> AsyncIterator[Any]:
+    """
+    Parse a JSON array incrementally and yield its items as they arrive.
+
+    Only the unparsed tail of the body is kept in memory, trimmed once per chunk, so memory does not grow with the array length.
+    Items must be objects or arrays, a scalar at the end of a chunk might continue in the next one.
+
+    Args:
+        chunks (AsyncIterator[bytes]): UTF-8 encoded body chunks.
+        max_item_size (int): Maximum size of one item in characters. Defaults to 65536.
+
+    Raises:
+        ValueError: If the body is not a JSON array of objects or arrays.
+
+    Yields:
+        Any: Parsed array items.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    expect_item = True
+    eof = False
+    chunk_iterator = chunks.__aiter__()
+
+    async def read_more() -> None:
+        nonlocal buf, pos, eof
+        buf, pos = buf[pos:], 0
+        try:
+            chunk = await chunk_iterator.__anext__()
+        except StopAsyncIteration:
+            buf += text_decoder.decode(b"", final=True)
+            eof = True
+        else:
+            buf += text_decoder.decode(chunk)
+
+    while True:
+        while pos < len(buf) and buf[pos] in WHITESPACE:
+            pos += 1
+
+        if pos == len(buf):
+            if eof:
+                raise ValueError("Unexpected end of JSON array")
+            await read_more()
+            continue
+
+        char = buf[pos]
+        if not started:
+            if char != "[":
+                raise ValueError("Body must be a JSON array")
+            started = True
+            pos += 1
+            continue
+        if char == "]":
+            pos += 1
+            break
+        if not expect_item:
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' at character {pos}")
+            expect_item = True
+            pos += 1
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof or len(buf) - pos > max_item_size:
+                raise ValueError("Invalid JSON array item")
+            await read_more()
+            continue
+        if not isinstance(item, (dict, list)):
+            raise ValueError("JSON array items must be objects or arrays")
+        yield item
+        expect_item = False
+        pos = end
+
+    while pos < len(buf) and buf[pos] in WHITESPACE:
+        pos += 1
+    if pos != len(buf):
+        raise ValueError("Unexpected data after JSON array")
+    async for chunk in chunk_iterator:
+        if text_decoder.decode(chunk).strip(WHITESPACE):
+            raise ValueError("Unexpected data after JSON array")
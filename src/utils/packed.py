@@ -0,0 +1,90 @@
+import struct
+
+import numpy as np
+
+# Packed device data format (little-endian)
+#
+# Header
+#   magic       4s   b"ONDO"
+#   version     B    1
+#   count       I    Number of samples
+#   base_time   q    Timestamp of the first sample, milliseconds since 1970-01-01 (device wall-clock time)
+#
+# Sample (9 bytes)
+#   delta_ms    i    Milliseconds since the previous sample (0 for the first sample)
+#   temperature h    Temperature (Celsius) * 100
+#   humidity    H    Humidity * 100
+#   flags       B    bit 0: motion, bit 1: alarm, bit 2: button
+PACKED_CONTENT_TYPE = "application/x-ondo-packed"
+PACKED_MAGIC = b"ONDO"
+PACKED_VERSION = 1
+HEADER = struct.Struct("<4sBIq")
+SAMPLE_DTYPE = np.dtype([("delta_ms", "<i4"), ("temperature", "<i2"), ("humidity", "<u2"), ("flags", "u1")])
+
+FLAG_MOTION = 1
+FLAG_ALARM = 2
+FLAG_BUTTON = 4
+
+
+def unpack_device_data(body: bytes) -> dict:
+    """
+    Decode packed device data into columns.
+
+    Args:
+        body (bytes): Packed device data.
+
+    Raises:
+        ValueError: If the body is not valid packed device data.
+
+    Returns:
+        dict: NumPy arrays keyed by temperature_c, humidity, motion, alarm, button and created_at.
+    """
+    if len(body) < HEADER.size:
+        raise ValueError("Body is shorter than the header")
+    magic, version, count, base_time = HEADER.unpack_from(body)
+    if magic != PACKED_MAGIC:
+        raise ValueError("Unknown magic")
+    if version != PACKED_VERSION:
+        raise ValueError(f"Unsupported version {version}")
+    if len(body) != HEADER.size + count * SAMPLE_DTYPE.itemsize:
+        raise ValueError("Body length does not match the sample count")
+
+    samples = np.frombuffer(body, dtype=SAMPLE_DTYPE, count=count, offset=HEADER.size)
+    flags = samples["flags"]
+    created_at = (base_time + np.cumsum(samples["delta_ms"], dtype=np.int64)).astype("datetime64[ms]").astype("datetime64[us]")
+    return {
+        "temperature_c": samples["temperature"] / 100,
+        "humidity": samples["humidity"] / 100,
+        "motion": (flags & FLAG_MOTION) != 0,
+        "alarm": (flags & FLAG_ALARM) != 0,
+        "button": (flags & FLAG_BUTTON) != 0,
+        "created_at": created_at,
+    }
+
+
+def pack_device_data(
+    temperature_c: np.ndarray, humidity: np.ndarray, motion: np.ndarray, alarm: np.ndarray, button: np.ndarray, created_at: np.ndarray
+) -> bytes:
+    """
+    Encode device data columns into the packed format.
+
+    Args:
+        temperature_c (np.ndarray): Temperature (Celsius).
+        humidity (np.ndarray): Humidity.
+        motion (np.ndarray): Motion detected.
+        alarm (np.ndarray): Alarmed.
+        button (np.ndarray): Button pressed.
+        created_at (np.ndarray): Created timestamp, datetime64.
+
+    Returns:
+        bytes: Packed device data.
+    """
+    timestamps = created_at.astype("datetime64[ms]").astype(np.int64)
+    base_time = int(timestamps[0]) if len(timestamps) else 0
+
+    samples = np.empty(len(timestamps), dtype=SAMPLE_DTYPE)
+    samples["delta_ms"] = np.diff(timestamps, prepend=base_time)
+    samples["temperature"] = np.round(np.asarray(temperature_c) * 100)
+    samples["humidity"] = np.round(np.asarray(humidity) * 100)
+    samples["flags"] = np.asarray(motion) * FLAG_MOTION | np.asarray(alarm) * FLAG_ALARM | np.asarray(button) * FLAG_BUTTON
+    return HEADER.pack(PACKED_MAGIC, PACKED_VERSION, len(samples), base_time) + samples.tobytes()
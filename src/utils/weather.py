@@ -0,0 +1,44 @@
+import asyncio
+
+import requests
+from requests.exceptions import RequestException
+
+from src.constants.common import OPEN_WEATHER_API, OPEN_WEATHER_APPID, WEATHER_REQUEST_TIMEOUT_SECONDS
+from src.errors.errors import WeatherAPIRequestError
+from src.utils.common import convert_celsius_to_fahrenheit
+
+
+async def fetch_weather(lat: float, lon: float, lang: str) -> dict:
+    """
+    Fetch the current weather at a location from OpenWeather.
+
+    The request runs in a worker thread, so that lookups for several locations can run concurrently.
+
+    Args:
+        lat (float): Latitude.
+        lon (float): Longitude.
+        lang (str): Language of the location name, "en" or "ja".
+
+    Raises:
+        WeatherAPIRequestError: If the request fails.
+
+    Returns:
+        dict: Weather in the shape of src.schemas.weather.Weather.
+    """
+    params = {"lat": lat, "lon": lon, "units": "metric", "appid": OPEN_WEATHER_APPID, "lang": lang}
+    try:
+        r = await asyncio.to_thread(requests.get, OPEN_WEATHER_API, params=params, timeout=WEATHER_REQUEST_TIMEOUT_SECONDS)
+        r.raise_for_status()
+    except RequestException as e:
+        # TODO Replace with logger
+        print(f"Request failed: {e}")
+        raise WeatherAPIRequestError()
+
+    json = r.json()
+    return {
+        "location_name": json["name"],
+        "temperature_c": json["main"]["temp"],
+        "temperature_f": convert_celsius_to_fahrenheit(json["main"]["temp"]),
+        "humidity": json["main"]["humidity"],
+        "weather_icon": json["weather"][0]["icon"],
+    }
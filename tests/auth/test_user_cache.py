@@ -0,0 +1,64 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+import pytest
+
+import src.auth.user_cache as user_cache_module
+from src.auth.user_cache import UserExistenceCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@asynccontextmanager
+async def fake_session() -> AsyncIterator[None]:
+    yield None
+
+
+@pytest.fixture
+def lookups(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    lookups: List[int] = []
+    existing_user_ids = {1}
+
+    async def count_user_by_user_id(db: None, user_id: int) -> int:
+        lookups.append(user_id)
+        return 1 if user_id in existing_user_ids else 0
+
+    monkeypatch.setattr(user_cache_module.user_cruds, "count_user_by_user_id", count_user_by_user_id)
+    return lookups
+
+
+def test_hit_skips_database(lookups: List[int]) -> None:
+    cache = UserExistenceCache(fake_session, maxsize=10, ttl=300, negative_ttl=30)
+    assert asyncio.run(cache.exists(1))
+    assert asyncio.run(cache.exists(1))
+    assert lookups == [1]
+    assert cache.metrics() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_missing_user_expires_after_negative_ttl(lookups: List[int]) -> None:
+    clock = Clock()
+    cache = UserExistenceCache(fake_session, maxsize=10, ttl=300, negative_ttl=30, clock=clock)
+    assert asyncio.run(cache.exists(1))
+    assert not asyncio.run(cache.exists(2))
+    clock.now = 29
+    assert not asyncio.run(cache.exists(2))
+    assert lookups == [1, 2]
+    clock.now = 31
+    assert not asyncio.run(cache.exists(2))
+    assert asyncio.run(cache.exists(1))
+    assert lookups == [1, 2, 2]
+
+
+def test_invalidate_forces_lookup(lookups: List[int]) -> None:
+    cache = UserExistenceCache(fake_session, maxsize=10, ttl=300, negative_ttl=30)
+    assert not asyncio.run(cache.exists(2))
+    cache.invalidate(2)
+    assert not asyncio.run(cache.exists(2))
+    assert lookups == [2, 2]
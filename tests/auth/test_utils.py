@@ -0,0 +1,18 @@
+import asyncio
+
+from src.auth.utils import create_hash_password_async, verify_hash_password, verify_hash_password_async
+
+
+def test_hash_password_async_round_trip() -> None:
+    async def run() -> tuple[str, bool, bool]:
+        hashed_password = await create_hash_password_async("secretPassword")
+        return (
+            hashed_password,
+            await verify_hash_password_async("secretPassword", hashed_password),
+            await verify_hash_password_async("wrongPassword", hashed_password),
+        )
+
+    hashed_password, valid, invalid = asyncio.run(run())
+    assert verify_hash_password("secretPassword", hashed_password)
+    assert valid
+    assert not invalid
@@ -0,0 +1,63 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import create_engine
+
+from src.cruds.device import latest_reading_values, reading_rollup_buckets
+
+DEVICE_A = uuid.UUID("a7382f5c-3326-4cf8-b717-549affe1c2eb")
+DEVICE_B = uuid.UUID("0b5a1c2d-3e4f-4a5b-8c6d-7e8f9a0b1c2d")
+
+
+def test_latest_reading_values_out_of_order():
+    records = [
+        (DEVICE_A, datetime(2022, 7, 21, 12, 2), 26.0, None, None, None, None),
+        (DEVICE_A, datetime(2022, 7, 21, 12, 0), 24.0, 60.0, False, False, False),
+        (DEVICE_A, datetime(2022, 7, 21, 12, 1), None, 61.0, None, True, None),
+    ]
+    assert latest_reading_values(records) == [
+        (DEVICE_A, 26.0, datetime(2022, 7, 21, 12, 2), 61.0, datetime(2022, 7, 21, 12, 1), True, datetime(2022, 7, 21, 12, 1)),
+    ]
+
+
+def test_latest_reading_values_per_device():
+    records = [
+        (DEVICE_A, datetime(2022, 7, 21, 12, 0), 24.0, None, None, None, None),
+        (DEVICE_B, datetime(2022, 7, 21, 12, 0), 30.0, 50.0, None, None, None),
+    ]
+    assert latest_reading_values(records) == [
+        (DEVICE_B, 30.0, datetime(2022, 7, 21, 12, 0), 50.0, datetime(2022, 7, 21, 12, 0), None, None),
+        (DEVICE_A, 24.0, datetime(2022, 7, 21, 12, 0), None, None, None, None),
+    ]
+
+
+def test_reading_rollup_buckets():
+    records = [
+        (DEVICE_A, datetime(2022, 7, 21, 12, 59, 59), 24.0, 60.0, False, False, False),
+        (DEVICE_A, datetime(2022, 7, 21, 12, 0), 24.0, 60.0, False, False, False),
+        (DEVICE_A, datetime(2022, 7, 20, 23, 30), 24.0, 60.0, False, False, False),
+        (DEVICE_B, datetime(2022, 7, 21, 12, 15), 24.0, 60.0, False, False, False),
+    ]
+    hours, days = reading_rollup_buckets(records)
+    assert hours == [
+        (DEVICE_B, datetime(2022, 7, 21, 12)),
+        (DEVICE_A, datetime(2022, 7, 20, 23)),
+        (DEVICE_A, datetime(2022, 7, 21, 12)),
+    ]
+    assert days == [
+        (DEVICE_B, datetime(2022, 7, 21)),
+        (DEVICE_A, datetime(2022, 7, 20)),
+        (DEVICE_A, datetime(2022, 7, 21)),
+    ]
+
+
+def test_rollback_forgets_readings_staging():
+    with create_engine("sqlite://").connect() as conn:
+        transaction = conn.begin()
+        conn.info["readings_staging"] = True
+        transaction.commit()
+        assert conn.info["readings_staging"]
+
+        transaction = conn.begin()
+        transaction.rollback()
+        assert "readings_staging" not in conn.info
@@ -0,0 +1,19 @@
+from datetime import date, datetime
+
+from src.db.partitions import add_months, month_of, partition_name
+
+
+def test_add_months():
+    assert add_months(date(2022, 7, 1), 1) == date(2022, 8, 1)
+    assert add_months(date(2022, 12, 1), 1) == date(2023, 1, 1)
+    assert add_months(date(2022, 1, 1), -1) == date(2021, 12, 1)
+    assert add_months(date(2022, 7, 1), -19) == date(2020, 12, 1)
+
+
+def test_month_of():
+    assert month_of(datetime(2022, 7, 21, 12, 30)) == date(2022, 7, 1)
+    assert month_of(date(2022, 12, 31)) == date(2022, 12, 1)
+
+
+def test_partition_name():
+    assert partition_name(date(2022, 7, 1)) == "readings_y2022m07"
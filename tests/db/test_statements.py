@@ -0,0 +1,6 @@
+from src.db.statements import HOT_STATEMENTS, INGESTION_STATEMENTS
+
+
+def test_statement_parameters_match_binds():
+    for stmt, params in HOT_STATEMENTS + INGESTION_STATEMENTS:
+        assert set(params) == set(stmt.compile().params)
@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from src.export.service import CsvEncoder, NdjsonEncoder, ParquetEncoder, parquet_available
+
+ROWS = [
+    (datetime(2022, 7, 1, 12, 0, 0), 25.5, 60.0, True, False, True),
+    (datetime(2022, 7, 1, 12, 0, 10), None, 61.0, False, True, True),
+]
+
+
+def test_csv_encoder():
+    encoder = CsvEncoder()
+    body = encoder.encode(ROWS[:1]) + encoder.encode(ROWS[1:]) + encoder.close()
+    lines = list(csv.reader(io.StringIO(body.decode())))
+    assert lines == [
+        ["created_at", "temperature", "humidity", "motion", "is_alarm", "device_listening"],
+        ["2022-07-01T12:00:00", "25.5", "60.0", "True", "False", "True"],
+        ["2022-07-01T12:00:10", "", "61.0", "False", "True", "True"],
+    ]
+
+
+def test_csv_encoder_without_rows():
+    assert CsvEncoder().close() == b"created_at,temperature,humidity,motion,is_alarm,device_listening\n"
+
+
+def test_ndjson_encoder():
+    encoder = NdjsonEncoder()
+    body = encoder.encode(ROWS) + encoder.close()
+    lines = [json.loads(line) for line in body.decode().splitlines()]
+    assert lines[1] == {"created_at": "2022-07-01T12:00:10", "temperature": None, "humidity": 61.0, "motion": False, "is_alarm": True, "device_listening": True}
+
+
+@pytest.mark.skipif(not parquet_available(), reason="pyarrow is not installed")
+def test_parquet_encoder():
+    import pyarrow.parquet as pq
+
+    encoder = ParquetEncoder()
+    body = encoder.encode(ROWS[:1]) + encoder.encode(ROWS[1:]) + encoder.close()
+    parquet_file = pq.ParquetFile(io.BytesIO(body))
+    assert parquet_file.num_row_groups == 2
+    assert parquet_file.read().to_pylist()[1] == {
+        "created_at": datetime(2022, 7, 1, 12, 0, 10),
+        "temperature": None,
+        "humidity": 61.0,
+        "motion": False,
+        "is_alarm": True,
+        "device_listening": True,
+    }
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import numpy as np
+
+from src.historical.analytics import bucket_starts, grouped_statistics, historical_statistics
+
+
+def epoch(value: datetime) -> float:
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+
+def test_bucket_starts() -> None:
+    times = np.array([epoch(datetime(2022, 7, 6, 13, 45)), epoch(datetime(2022, 7, 3, 23, 59))])
+    assert bucket_starts(times, "hour").tolist() == [epoch(datetime(2022, 7, 6, 13)), epoch(datetime(2022, 7, 3, 23))]
+    assert bucket_starts(times, "day").tolist() == [epoch(datetime(2022, 7, 6)), epoch(datetime(2022, 7, 3))]
+    # Weeks start on Monday, 2022-07-04 and 2022-06-27
+    assert bucket_starts(times, "week").tolist() == [epoch(datetime(2022, 7, 4)), epoch(datetime(2022, 6, 27))]
+
+
+def test_grouped_statistics() -> None:
+    rng = np.random.default_rng(0)
+    groups = rng.integers(0, 5, 1000)
+    values = rng.normal(25, 3, 1000)
+    stats = grouped_statistics(groups, values, lower=22.0, upper=28.0)
+
+    assert stats["group"].tolist() == [0, 1, 2, 3, 4]
+    for i, group in enumerate(stats["group"]):
+        expected = values[groups == group]
+        assert stats["count"][i] == len(expected)
+        assert np.isclose(stats["min"][i], expected.min())
+        assert np.isclose(stats["max"][i], expected.max())
+        assert np.isclose(stats["avg"][i], expected.mean())
+        assert np.isclose(stats["std"][i], expected.std())
+        for percentile in [5, 50, 95]:
+            assert np.isclose(stats[f"p{percentile}"][i], np.percentile(expected, percentile))
+        assert np.isclose(stats["in_range"][i], np.mean((expected >= 22.0) & (expected <= 28.0)))
+
+
+def test_grouped_statistics_without_limits() -> None:
+    stats = grouped_statistics(np.array([0, 0, 1]), np.array([1.0, 3.0, 5.0]))
+    assert "in_range" not in stats
+    assert stats["p50"].tolist() == [2.0, 5.0]
+
+
+def test_historical_statistics() -> None:
+    times = np.array([epoch(datetime(2022, 7, 1, 12, 10)), epoch(datetime(2022, 7, 1, 12, 20)), epoch(datetime(2022, 7, 1, 13, 0))])
+    result = historical_statistics(times, np.array([20.0, 30.0, 25.0]), np.array([50.0, 60.0, 55.0]), None, 26.0, "hour", "%Y/%m/%d %H:00:00")
+    assert result.keys() == {"2022/07/01 12:00:00", "2022/07/01 13:00:00"}
+    assert result["2022/07/01 12:00:00"]["avg_temp"] == 25.0
+    assert result["2022/07/01 12:00:00"]["std_humid"] == 5.0
+    assert result["2022/07/01 12:00:00"]["temp_in_range"] == 0.5
+    assert historical_statistics(np.empty(0), np.empty(0), np.empty(0), None, None, "day", "%Y/%m/%d") == {}
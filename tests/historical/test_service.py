@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta
+
+from src.historical.service import choose_bucket, downsample_readings, merge_rollups
+
+START = datetime(2022, 7, 1)
+
+
+def test_choose_bucket() -> None:
+    assert choose_bucket(START, START + timedelta(hours=12), 1000) == "raw"
+    assert choose_bucket(START, START + timedelta(days=30), 1000) == "hour"
+    assert choose_bucket(START, START + timedelta(days=90), 1000) == "day"
+
+
+def test_merge_rollups() -> None:
+    rows = [(START + timedelta(hours=i), 20.0 + i, 21.0 + i, 41.0 + 2 * i, 2, 50.0, 60.0, 110.0, 2) for i in range(5)]
+    merged = merge_rollups(rows, 2)
+    assert merged == [
+        (START, 20.0, 23.0, 129.0, 6, 50.0, 60.0, 330.0, 6),
+        (START + timedelta(hours=3), 23.0, 25.0, 96.0, 4, 50.0, 60.0, 220.0, 4),
+    ]
+    assert merge_rollups(rows, 5) == rows
+
+
+def test_downsample_readings() -> None:
+    rows = [(START + timedelta(seconds=i), 20.0 + (i % 7), 50.0 - (i % 5)) for i in range(1000)]
+    for method in ["lttb", "minmax"]:
+        result = downsample_readings(rows, ["temperature", "humidity"], method, 100)
+        assert 0 < len(result) <= 100
+        assert result == sorted(result)
+    assert downsample_readings(rows[:50], ["temperature"], "lttb", 100) == rows[:50]
+
+
+def test_downsample_readings_small_budget() -> None:
+    rows = [(START + timedelta(seconds=i), 20.0 + (i % 7), 50.0 - (i % 5)) for i in range(1000)]
+    for method in ["lttb", "minmax"]:
+        for metrics in [["temperature"], ["temperature", "humidity"]]:
+            for max_points in range(2, 10):
+                assert 2 <= len(downsample_readings(rows, metrics, method, max_points)) <= max_points
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from src.errors.errors import IngestionOverloadedError
+from src.ingestion.admission import AdmissionController
+from src.ingestion.buffer import IngestionBuffer
+
+
+def test_acquire_over_max_in_flight() -> None:
+    admission = AdmissionController(max_in_flight=2)
+    admission.acquire()
+    admission.acquire()
+    with pytest.raises(IngestionOverloadedError) as e:
+        admission.acquire()
+    assert e.value.status_code == 429
+    assert e.value.headers == {"Retry-After": "60"}
+    assert admission.rejected == 1
+
+
+def test_retry_after_from_drain_rate() -> None:
+    admission = AdmissionController(max_in_flight=1, window=10.0)
+    for _ in range(20):
+        admission.acquire()
+        admission.release()
+    admission.acquire()
+    # 20 requests in 10 seconds drain 2 requests per second
+    assert admission.drain_rate() == 2.0
+    assert admission.retry_after() == 1
+
+
+def test_admit_releases_on_error() -> None:
+    async def run(admission: AdmissionController) -> None:
+        async with admission.admit():
+            raise ValueError("Failed")
+
+    admission = AdmissionController(max_in_flight=1)
+    with pytest.raises(ValueError):
+        asyncio.run(run(admission))
+    assert admission.in_flight == 0
+
+
+def test_acquire_while_buffer_is_full() -> None:
+    buffer = IngestionBuffer(lambda records: None, max_rows=2, flush_rows=100, flush_interval=3)
+    admission = AdmissionController(max_in_flight=10, buffer=buffer)
+    admission.acquire()
+    buffer.put([("a", 1), ("a", 2)])
+    with pytest.raises(IngestionOverloadedError) as e:
+        admission.acquire()
+    assert e.value.headers == {"Retry-After": "3"}
+    assert admission.rejected == 1
+    assert admission.in_flight == 1
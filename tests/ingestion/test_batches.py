@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from src.ingestion.batches import BatchTracker
+
+
+def test_store_skips_stored_batch() -> None:
+    writes = []
+
+    async def write() -> int:
+        writes.append(1)
+        return 2
+
+    async def run(batches: BatchTracker) -> list:
+        return [await batches.store(("device", "batch"), 2, write) for _ in range(2)]
+
+    assert asyncio.run(run(BatchTracker(maxsize=10))) == [2, 2]
+    assert len(writes) == 1
+
+
+def test_replay_waits_for_pending_write() -> None:
+    async def run(batches: BatchTracker) -> list:
+        written = asyncio.Event()
+
+        async def write() -> int:
+            await written.wait()
+            return 2
+
+        first = asyncio.create_task(batches.store(("device", "batch"), 2, write))
+        replay = asyncio.create_task(batches.store(("device", "batch"), 2, write))
+        await asyncio.sleep(0)
+        assert not replay.done()
+        assert batches.pending == 1
+        written.set()
+        return [await first, await replay]
+
+    batches = BatchTracker(maxsize=10)
+    assert asyncio.run(run(batches)) == [2, 2]
+    assert ("device", "batch") in batches.stored
+    assert batches.pending == 0
+
+
+def test_failed_or_dropped_batch_is_not_remembered() -> None:
+    async def fail() -> int:
+        raise ValueError("Failed")
+
+    async def drop() -> int:
+        return 0
+
+    batches = BatchTracker(maxsize=10)
+    with pytest.raises(ValueError):
+        asyncio.run(batches.store(("device", "batch"), 2, fail))
+    assert asyncio.run(batches.store(("device", "batch"), 2, drop)) == 0
+    assert ("device", "batch") not in batches.stored
+    assert batches.pending == 0
@@ -0,0 +1,153 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from src.errors.errors import IngestionBufferFullError
+from src.ingestion.buffer import IngestionBuffer
+
+
+class RecordingWriter:
+    def __init__(self, failing_device_ids: set | None = None) -> None:
+        self.batches: List[List[tuple]] = []
+        self.failing_device_ids = failing_device_ids or set()
+
+    async def __call__(self, records: List[tuple]) -> None:
+        if any(record[0] in self.failing_device_ids for record in records):
+            raise ValueError("Write failed")
+        self.batches.append(records)
+
+
+def test_flush_on_size_threshold() -> None:
+    async def run() -> RecordingWriter:
+        writer = RecordingWriter()
+        buffer = IngestionBuffer(writer, max_rows=100, flush_rows=3, flush_interval=60)
+        buffer.start()
+        buffer.put([("a", 1), ("b", 1)])
+        buffer.put([("a", 2)])
+        await asyncio.sleep(0.01)
+        await buffer.stop()
+        return writer
+
+    writer = asyncio.run(run())
+    assert writer.batches == [[("a", 1), ("b", 1), ("a", 2)]]
+
+
+def test_flush_on_time_threshold() -> None:
+    async def run() -> RecordingWriter:
+        writer = RecordingWriter()
+        buffer = IngestionBuffer(writer, max_rows=100, flush_rows=100, flush_interval=0.01)
+        buffer.start()
+        buffer.put([("a", 1)])
+        await asyncio.sleep(0.05)
+        assert buffer.depth == 0
+        await buffer.stop()
+        return writer
+
+    writer = asyncio.run(run())
+    assert writer.batches == [[("a", 1)]]
+
+
+def test_flush_on_stop() -> None:
+    async def run() -> RecordingWriter:
+        writer = RecordingWriter()
+        buffer = IngestionBuffer(writer, max_rows=100, flush_rows=100, flush_interval=60)
+        buffer.start()
+        buffer.put([("a", 1)])
+        await buffer.stop()
+        return writer
+
+    writer = asyncio.run(run())
+    assert writer.batches == [[("a", 1)]]
+
+
+def test_put_over_max_rows() -> None:
+    buffer = IngestionBuffer(RecordingWriter(), max_rows=2, flush_rows=100, flush_interval=60)
+    buffer.put([("a", 1), ("a", 2)])
+    with pytest.raises(IngestionBufferFullError):
+        buffer.put([("a", 3)])
+    assert buffer.depth == 2
+
+
+def test_failed_device_does_not_drop_other_devices() -> None:
+    async def run() -> IngestionBuffer:
+        buffer = IngestionBuffer(RecordingWriter(failing_device_ids={"b"}), max_rows=100, flush_rows=100, flush_interval=60)
+        buffer.put([("a", 1), ("b", 1), ("c", 1)])
+        await buffer.flush()
+        return buffer
+
+    buffer = asyncio.run(run())
+    metrics = buffer.metrics()
+    assert metrics["flushed_rows"] == 2
+    assert metrics["dropped_rows"] == 1
+    assert metrics["queue_depth"] == 0
+
+
+def test_put_and_wait_returns_persisted_count() -> None:
+    async def run() -> tuple:
+        buffer = IngestionBuffer(RecordingWriter(failing_device_ids={"b"}), max_rows=100, flush_rows=100, flush_interval=60)
+        buffer.start()
+        waits = asyncio.gather(buffer.put_and_wait([("a", 1), ("a", 2)]), buffer.put_and_wait([("b", 1)]))
+        await asyncio.sleep(0)
+        await buffer.stop()
+        return await waits
+
+    assert asyncio.run(run()) == [2, 0]
+
+
+def test_retry_after_from_flush_throughput() -> None:
+    async def run() -> IngestionBuffer:
+        buffer = IngestionBuffer(RecordingWriter(), max_rows=100, flush_rows=1000, flush_interval=5, window=10.0)
+        assert buffer.retry_after(1) == 5
+        buffer.put([("a", i) for i in range(100)])
+        await buffer.flush()
+        buffer.put([("a", i) for i in range(100)])
+        return buffer
+
+    buffer = asyncio.run(run())
+    # 100 records in 10 seconds drain 10 records per second
+    assert buffer.metrics()["flushed_rows_per_second"] == 10.0
+    with pytest.raises(IngestionBufferFullError) as e:
+        buffer.put([("a", i) for i in range(50)])
+    assert e.value.headers == {"Retry-After": "5"}
+
+
+class SlowWriter(RecordingWriter):
+    async def __call__(self, records: List[tuple]) -> None:
+        await asyncio.sleep(0.2)
+        await super().__call__(records)
+
+
+def test_stop_waits_for_flush_in_progress() -> None:
+    async def run() -> tuple:
+        writer = SlowWriter()
+        buffer = IngestionBuffer(writer, max_rows=100, flush_rows=1, flush_interval=60)
+        buffer.start()
+        wait = asyncio.create_task(buffer.put_and_wait([("a", 1)]))
+        await asyncio.sleep(0.05)
+        await buffer.stop()
+        return writer, wait.done() and wait.result()
+
+    writer, count = asyncio.run(run())
+    assert writer.batches == [[("a", 1)]]
+    assert count == 1
+
+
+def test_cancelled_flush_keeps_records() -> None:
+    async def run() -> tuple:
+        writer = SlowWriter()
+        buffer = IngestionBuffer(writer, max_rows=100, flush_rows=100, flush_interval=60)
+        wait = asyncio.create_task(buffer.put_and_wait([("a", 1)]))
+        await asyncio.sleep(0)
+        flush = asyncio.create_task(buffer.flush())
+        await asyncio.sleep(0.05)
+        flush.cancel()
+        await asyncio.gather(flush, return_exceptions=True)
+        depth = buffer.depth
+        await buffer.flush()
+        return writer, depth, await asyncio.wait_for(wait, timeout=1)
+
+    writer, depth, count = asyncio.run(run())
+    assert depth == 1
+    assert writer.batches == [[("a", 1)]]
+    assert count == 1
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+from src.ingestion.thresholds import BREACHED, NORMAL, breach_message, evaluate_thresholds
+
+START = datetime(2022, 7, 1)
+DEVICE_A = "00000000-0000-0000-0000-00000000000a"
+DEVICE_B = "00000000-0000-0000-0000-00000000000b"
+
+
+def records_of(device_id: str, temperatures: list) -> list:
+    return [(device_id, START + timedelta(seconds=i), temperature, 50.0, False, False, False) for i, temperature in enumerate(temperatures)]
+
+
+def test_evaluate_thresholds_hysteresis() -> None:
+    # Hovering around the upper limit notifies once, until the temperature is back below 29.5.
+    records = records_of(DEVICE_A, [29.0, 30.5, 29.9, 30.2, 29.8, 29.4, 30.1])
+    breaches, states = evaluate_thresholds(records, {DEVICE_A: (None, 30.0)}, {}, 0.5)
+    assert breaches == [
+        (DEVICE_A, START + timedelta(seconds=1), "upper", 30.5, 30.0),
+        (DEVICE_A, START + timedelta(seconds=6), "upper", 30.1, 30.0),
+    ]
+    assert states == {(DEVICE_A, "upper"): BREACHED, (DEVICE_A, "lower"): NORMAL}
+
+
+def test_evaluate_thresholds_continues_state() -> None:
+    records = records_of(DEVICE_A, [30.2, 29.8])
+    breaches, states = evaluate_thresholds(records, {DEVICE_A: (None, 30.0)}, {(DEVICE_A, "upper"): BREACHED}, 0.5)
+    assert breaches == []
+    assert states[(DEVICE_A, "upper")] == BREACHED
+
+
+def test_evaluate_thresholds_many_devices() -> None:
+    # Records of devices are interleaved and unordered, and a device without limits never breaches.
+    records = records_of(DEVICE_A, [10.0, 4.0, 3.0]) + records_of(DEVICE_B, [100.0, None])
+    records.reverse()
+    breaches, states = evaluate_thresholds(records, {DEVICE_A: (5.0, 30.0)}, {(DEVICE_B, "upper"): BREACHED}, 0.5)
+    assert breaches == [(DEVICE_A, START + timedelta(seconds=1), "lower", 4.0, 5.0)]
+    assert states[(DEVICE_A, "lower")] == BREACHED
+    assert states[(DEVICE_B, "upper")] == BREACHED
+
+
+def test_evaluate_thresholds_without_temperature() -> None:
+    assert evaluate_thresholds(records_of(DEVICE_A, [None]), {DEVICE_A: (5.0, 30.0)}, {}, 0.5) == ([], {})
+
+
+def test_breach_message() -> None:
+    assert breach_message("upper", 30.54, 30.0) == "Temperature 30.5°C is above the upper limit of 30.0°C"
+    assert breach_message("lower", 4.0, 5.0) == "Temperature 4.0°C is below the lower limit of 5.0°C"
@@ -0,0 +1,60 @@
+from src.utils.cache import LRUSet, TTLCache
+
+
+def test_lru_set_add() -> None:
+    keys = LRUSet(maxsize=2)
+    assert keys.add("a")
+    assert not keys.add("a")
+    assert "a" in keys
+    assert len(keys) == 1
+
+
+def test_lru_set_evicts_least_recent() -> None:
+    keys = LRUSet(maxsize=2)
+    keys.add("a")
+    keys.add("b")
+    keys.add("a")
+    keys.add("c")
+    assert "a" in keys
+    assert "b" not in keys
+    assert "c" in keys
+
+
+def test_lru_set_discard() -> None:
+    keys = LRUSet(maxsize=2)
+    keys.add("a")
+    keys.discard("a")
+    keys.discard("b")
+    assert "a" not in keys
+    assert keys.add("a")
+
+
+def test_ttl_cache_expires() -> None:
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", None)
+    assert cache.get("a", "missing") is None
+    now[0] = 10.0
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_and_invalidates() -> None:
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    cache.invalidate("b")
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_counts_lookups_and_overrides_ttl() -> None:
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", False, ttl=1)
+    assert cache.get("a") is False
+    now[0] = 1.0
+    assert cache.get("a") is None
+    assert cache.metrics() == {"size": 0, "hits": 1, "misses": 1}
@@ -0,0 +1,92 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.schemas.device import DeviceDataColumns
+from src.utils.columnar import to_bool_array, to_datetime_array, to_float_array
+
+
+def test_to_float_array_valid() -> None:
+    result = to_float_array([25.1, 26, 27.5])
+    assert result.dtype == np.float64
+    assert result.tolist() == [25.1, 26.0, 27.5]
+    assert to_float_array([]).tolist() == []
+
+
+def test_to_float_array_invalid() -> None:
+    values_list = [
+        ["abc"],
+        [None],
+        [float("nan")],
+        [[1.0]],
+    ]
+    for values in values_list:
+        with pytest.raises(ValueError):
+            to_float_array(values)
+
+
+def test_to_float_array_rejects_strings_and_booleans() -> None:
+    values_list = [
+        ["21.5"],
+        [25.1, "21.5"],
+        [True, False],
+        [25.1, True],
+        [1, False],
+    ]
+    for values in values_list:
+        with pytest.raises(ValueError, match="numbers"):
+            to_float_array(values)
+
+
+def test_to_bool_array_valid() -> None:
+    assert to_bool_array([True, False]).tolist() == [True, False]
+    assert to_bool_array([1, 0]).tolist() == [True, False]
+    assert to_bool_array([]).tolist() == []
+
+
+def test_to_bool_array_invalid() -> None:
+    values_list = [
+        [2],
+        ["true"],
+        [1.0],
+        [[True]],
+    ]
+    for values in values_list:
+        with pytest.raises(ValueError):
+            to_bool_array(values)
+
+
+def test_to_datetime_array_valid() -> None:
+    result = to_datetime_array(["2022-07-01 12:23:45", "2022-07-01T12:24:45.5"])
+    assert result.tolist() == [datetime(2022, 7, 1, 12, 23, 45), datetime(2022, 7, 1, 12, 24, 45, 500000)]
+
+
+def test_to_datetime_array_invalid() -> None:
+    values_list = [
+        ["abc"],
+        [1656678225],
+        [["2022-07-01 12:23:45"]],
+    ]
+    for values in values_list:
+        with pytest.raises(ValueError):
+            to_datetime_array(values)
+
+
+def test_to_datetime_array_with_offset() -> None:
+    values_list = [
+        ["2022-07-01T12:23:45Z"],
+        ["2022-07-01 12:23:45", "2022-07-01T12:24:45+09:00"],
+        ["2022-07-01T12:23:45.5-05:00"],
+    ]
+    for values in values_list:
+        with pytest.raises(ValueError, match="UTC offset"):
+            to_datetime_array(values)
+
+
+def test_device_data_columns_with_offset() -> None:
+    columns = {"temperature_c": [25.1], "humidity": [60], "motion": [False], "alarm": [False], "button": [False]}
+    assert DeviceDataColumns(**columns, created_at=["2022-07-01 12:23:45"]).created_at.tolist() == [datetime(2022, 7, 1, 12, 23, 45)]
+    with pytest.raises(ValidationError):
+        DeviceDataColumns(**columns, created_at=["2022-07-01T12:23:45+09:00"])
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+import pytest
+
+from src.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2022, 7, 21, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    assert decode_cursor(encode_cursor(created_at)) == (created_at, None)
+    assert "=" not in encode_cursor(created_at, 42)
+
+
+def test_decode_cursor_invalid() -> None:
+    for cursor in ["", "!!!", encode_cursor(datetime(2022, 7, 21))[:-3], "WzEsMiwzXQ", "WyJ4IiwxXQ"]:
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from src.utils.downsample import lttb_indices, minmax_indices
+
+
+def test_lttb_indices_keeps_short_series() -> None:
+    x = np.arange(5, dtype=np.float64)
+    assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_lttb_indices_keeps_ends_and_peak() -> None:
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000)
+    y[500] = 100.0
+    indices = lttb_indices(x, y, 20)
+    assert len(indices) == 20
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert 500 in indices
+    assert (np.diff(indices) > 0).all()
+
+
+def test_minmax_indices() -> None:
+    y = np.array([3.0, 1.0, 2.0, 9.0, 5.0, 7.0, 0.0, 4.0])
+    assert minmax_indices(y, 2).tolist() == [1, 3, 5, 6]
+    assert minmax_indices(y, 4).tolist() == list(range(8))
@@ -0,0 +1,45 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from src.utils.json_stream import iter_json_array
+
+
+async def to_chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def parse(body: bytes, size: int) -> List[Any]:
+    async def run() -> List[Any]:
+        return [item async for item in iter_json_array(to_chunks(body, size))]
+
+    return asyncio.run(run())
+
+
+def test_iter_json_array_valid() -> None:
+    items = [{"temperature_c": 25.1, "created_at": "2022-07-01 12:23:45", "name": "温度"}, {"a": [1, 2]}, [3]]
+    body = json.dumps(items, ensure_ascii=False).encode()
+    for size in [1, 2, 7, len(body)]:
+        assert parse(body, size) == items
+
+
+def test_iter_json_array_empty() -> None:
+    assert parse(b" [ ] ", 1) == []
+
+
+def test_iter_json_array_invalid() -> None:
+    bodies = [
+        b"",
+        b'{"a": 1}',
+        b"[1, 2]",
+        b'[{"a": 1}',
+        b'[{"a": 1} {"a": 2}]',
+        b'[{"a": }]',
+        b'[{"a": 1}] x',
+    ]
+    for body in bodies:
+        with pytest.raises(ValueError):
+            parse(body, 3)
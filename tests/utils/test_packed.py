@@ -0,0 +1,44 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.utils.packed import HEADER, SAMPLE_DTYPE, pack_device_data, unpack_device_data
+
+
+def packed_sample() -> bytes:
+    return pack_device_data(
+        temperature_c=np.array([25.12, -3.5]),
+        humidity=np.array([60.0, 61.25]),
+        motion=np.array([True, False]),
+        alarm=np.array([False, True]),
+        button=np.array([False, True]),
+        created_at=np.array(["2022-07-01 12:00:00", "2022-07-01 12:01:00.5"], dtype="datetime64[us]"),
+    )
+
+
+def test_pack_device_data_size() -> None:
+    assert len(packed_sample()) == HEADER.size + 2 * SAMPLE_DTYPE.itemsize
+
+
+def test_unpack_device_data() -> None:
+    result = unpack_device_data(packed_sample())
+    assert result["temperature_c"].tolist() == [25.12, -3.5]
+    assert result["humidity"].tolist() == [60.0, 61.25]
+    assert result["motion"].tolist() == [True, False]
+    assert result["alarm"].tolist() == [False, True]
+    assert result["button"].tolist() == [False, True]
+    assert result["created_at"].tolist() == [datetime(2022, 7, 1, 12, 0, 0), datetime(2022, 7, 1, 12, 1, 0, 500000)]
+
+
+def test_unpack_device_data_invalid() -> None:
+    body = packed_sample()
+    bodies = [
+        body[: HEADER.size - 1],
+        body[:-1],
+        b"XXXX" + body[4:],
+        body[:4] + b"\x02" + body[5:],
+    ]
+    for b in bodies:
+        with pytest.raises(ValueError):
+            unpack_device_data(b)